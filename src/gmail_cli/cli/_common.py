@@ -0,0 +1,15 @@
+"""Shared CLI option types."""
+
+from typing import Annotated
+
+import typer
+
+# Account option type
+AccountOption = Annotated[
+    str | None,
+    typer.Option(
+        "--account",
+        "-A",
+        help="Account email to use. Defaults to the default account.",
+    ),
+]
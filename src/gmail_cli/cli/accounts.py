@@ -2,7 +2,6 @@
 
 import typer
 
-from gmail_cli.services.credentials import get_default_account, list_accounts
 from gmail_cli.utils.output import is_json_mode, print_error, print_json
 
 accounts_app = typer.Typer(
@@ -21,8 +20,9 @@ def list_command() -> None:
     Examples:
         gmail accounts list
     """
+    from gmail_cli.services.credentials import get_default_account, list_accounts
+
     accounts = list_accounts()
-    default = get_default_account()
 
     if not accounts:
         if is_json_mode():
@@ -34,6 +34,8 @@ def list_command() -> None:
             )
         raise typer.Exit(1)
 
+    default = get_default_account()
+
     if is_json_mode():
         print_json(
             {
@@ -42,6 +44,4 @@ def list_command() -> None:
             }
         )
     else:
-        for acc in accounts:
-            marker = " *" if acc == default else ""
-            typer.echo(f"{acc}{marker}")
+        typer.echo("\n".join(f"{acc} *" if acc == default else acc for acc in accounts))
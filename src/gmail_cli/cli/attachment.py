@@ -5,10 +5,12 @@ from typing import Annotated
 
 import typer
 
+from gmail_cli.cli._common import AccountOption
 from gmail_cli.cli.auth import require_auth
-from gmail_cli.services.gmail import download_attachment, get_email
+from gmail_cli.models.attachment import Attachment
 from gmail_cli.utils.output import (
     console,
+    emit_error,
     is_json_mode,
     print_error,
     print_info,
@@ -18,15 +20,8 @@ from gmail_cli.utils.output import (
     print_table,
 )
 
-# Account option type
-AccountOption = Annotated[
-    str | None,
-    typer.Option(
-        "--account",
-        "-A",
-        help="Account email to use. Defaults to the default account.",
-    ),
-]
+# Maximum number of concurrent downloads for --all
+MAX_DOWNLOAD_WORKERS = 8
 
 attachment_app = typer.Typer(
     name="attachment",
@@ -52,14 +47,12 @@ def list_attachments(
         gmail attachment list 18c1234abcd5678
         gmail attachment list 18c1234abcd5678 --account work@company.com
     """
+    from gmail_cli.services.gmail import get_email
+
     email = get_email(message_id, account=account)
 
     if not email:
-        if is_json_mode():
-            print_json_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
-        else:
-            print_error(f"E-Mail mit ID '{message_id}' nicht gefunden")
-        raise typer.Exit(1)
+        emit_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
 
     if is_json_mode():
         print_json(
@@ -85,7 +78,7 @@ def list_attachments(
         print_table(
             title=f"Anhänge für E-Mail {message_id[:16]}...",
             columns=["Dateiname", "Typ", "Größe"],
-            rows=[[att.filename, att.mime_type, att.size_human] for att in email.attachments],
+            rows=((att.filename, att.mime_type, att.size_human) for att in email.attachments),
         )
 
 
@@ -131,22 +124,20 @@ def download_attachment_command(
         gmail attachment download 18c1234abcd5678 --all --output ~/Downloads/
         gmail attachment download 18c1234abcd5678 doc.pdf --account work@company.com
     """
+    from gmail_cli.services.gmail import (
+        download_attachment,
+        get_email,
+        gmail_worker_pool,
+    )
+
     # Validate: either filename or --all must be provided
     if not all_attachments and not filename:
-        if is_json_mode():
-            print_json_error("MISSING_ARGUMENT", "Bitte Dateiname angeben oder --all verwenden")
-        else:
-            print_error("Bitte Dateiname angeben oder --all verwenden")
-        raise typer.Exit(1)
+        emit_error("MISSING_ARGUMENT", "Bitte Dateiname angeben oder --all verwenden")
 
     email = get_email(message_id, account=account)
 
     if not email:
-        if is_json_mode():
-            print_json_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
-        else:
-            print_error(f"E-Mail mit ID '{message_id}' nicht gefunden")
-        raise typer.Exit(1)
+        emit_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
 
     if not email.attachments:
         if is_json_mode():
@@ -155,15 +146,33 @@ def download_attachment_command(
             print_info("E-Mail hat keine Anhänge.")
         raise typer.Exit(1)
 
+    # Resolve and stat the output location once instead of once per attachment
+    output_base = Path(output) if output else None
+    output_dir = output_base if output_base is not None and output_base.is_dir() else None
+
     if all_attachments:
         # Download all attachments
-        downloaded = []
+        targets = []
         for att in email.attachments:
-            output_path = output if output else att.filename
-            if Path(output_path).is_dir():
-                output_path = str(Path(output_path) / att.filename)
+            if output_dir is not None:
+                targets.append((att, str(output_dir / att.filename)))
+            else:
+                targets.append((att, output or att.filename))
+
+        # Downloads are independent network round trips, so run them concurrently.
+        # Fall back to one worker when several attachments share a target path.
+        paths = [path for _, path in targets]
+        workers = min(MAX_DOWNLOAD_WORKERS, len(targets)) if len(set(paths)) == len(paths) else 1
+
+        def _download(target: tuple[Attachment, str]) -> bool:
+            att, output_path = target
+            return download_attachment(message_id, att.id, output_path, account=account)
+
+        downloaded = []
+        with gmail_worker_pool(workers, account=account) as executor:
+            results = list(executor.map(_download, targets))
 
-            success = download_attachment(message_id, att.id, output_path, account=account)
+        for (att, output_path), success in zip(targets, results, strict=True):
             if success:
                 downloaded.append({"filename": att.filename, "path": output_path})
                 if not is_json_mode():
@@ -174,12 +183,8 @@ def download_attachment_command(
         if is_json_mode():
             print_json({"downloaded": downloaded})
     else:
-        # Download specific attachment
-        attachment = None
-        for att in email.attachments:
-            if att.filename == filename:
-                attachment = att
-                break
+        # Download specific attachment (first match wins for duplicate names)
+        attachment = next((att for att in email.attachments if att.filename == filename), None)
 
         if not attachment:
             if is_json_mode():
@@ -194,9 +199,10 @@ def download_attachment_command(
                     console.print(f"  - {att.filename}")
             raise typer.Exit(1)
 
-        output_path = output if output else attachment.filename
-        if Path(output_path).is_dir():
-            output_path = str(Path(output_path) / attachment.filename)
+        if output_dir is not None:
+            output_path = str(output_dir / attachment.filename)
+        else:
+            output_path = output or attachment.filename
         success = download_attachment(message_id, attachment.id, output_path, account=account)
 
         if success:
@@ -211,8 +217,4 @@ def download_attachment_command(
             else:
                 print_success(f"Heruntergeladen: {output_path}")
         else:
-            if is_json_mode():
-                print_json_error("DOWNLOAD_FAILED", "Download fehlgeschlagen")
-            else:
-                print_error("Download fehlgeschlagen")
-            raise typer.Exit(1)
+            emit_error("DOWNLOAD_FAILED", "Download fehlgeschlagen")
@@ -6,22 +6,8 @@ from typing import Annotated, Any
 
 import typer
 
-from gmail_cli.services.auth import (
-    get_token_expiry,
-    is_authenticated,
-    logout,
-    run_oauth_flow,
-)
-from gmail_cli.services.credentials import (
-    delete_credentials,
-    get_default_account,
-    get_raw_credentials_json,
-    has_credentials,
-    list_accounts,
-    set_default_account,
-)
-from gmail_cli.services.gmail import TokenExpiredError
 from gmail_cli.utils.output import (
+    emit_error,
     is_json_mode,
     print_error,
     print_json,
@@ -48,6 +34,10 @@ def require_auth(func: Callable[..., Any]) -> Callable[..., Any]:
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
+        from gmail_cli.services.auth import is_authenticated
+        from gmail_cli.services.credentials import delete_credentials
+        from gmail_cli.services.gmail import TokenExpiredError
+
         if not is_authenticated():
             if is_json_mode():
                 print_json_error(
@@ -95,6 +85,13 @@ def login(
     Supports multiple accounts. The first account authenticated becomes the default.
     Use --set-default to make a new account the default.
     """
+    from gmail_cli.services.auth import run_oauth_flow
+    from gmail_cli.services.credentials import (
+        has_credentials,
+        list_accounts,
+        set_default_account,
+    )
+
     # Check if already authenticated with any account
     accounts = list_accounts()
     if accounts and has_credentials(account=accounts[0]):
@@ -119,12 +116,13 @@ def login(
             set_default_account(email)
 
         if is_json_mode():
+            scopes = credentials.scopes
             print_json(
                 {
                     "status": "authenticated",
                     "email": email,
                     "is_default": is_default,
-                    "scopes": list(credentials.scopes) if credentials.scopes else [],
+                    "scopes": scopes if isinstance(scopes, list) else list(scopes or ()),
                 }
             )
         else:
@@ -172,6 +170,8 @@ def logout_command(
     Use --account to log out a specific account.
     Use --all to log out all accounts.
     """
+    from gmail_cli.services.auth import logout
+
     logged_out = logout(account=account, all_accounts=all_accounts)
 
     if is_json_mode():
@@ -192,8 +192,10 @@ def status() -> None:
     Lists all configured accounts with their status.
     The default account is marked with an asterisk (*).
     """
+    from gmail_cli.services.auth import get_token_expiries
+    from gmail_cli.services.credentials import get_default_account, list_accounts
+
     accounts = list_accounts()
-    default = get_default_account()
 
     if not accounts:
         if is_json_mode():
@@ -205,17 +207,19 @@ def status() -> None:
             )
         raise typer.Exit(1)
 
+    default = get_default_account()
+
+    expiries = get_token_expiries(accounts)
+
     if is_json_mode():
-        accounts_info = []
-        for acc in accounts:
-            expiry = get_token_expiry(account=acc)
-            accounts_info.append(
-                {
-                    "email": acc,
-                    "is_default": acc == default,
-                    "token_expiry": expiry,
-                }
-            )
+        accounts_info = [
+            {
+                "email": acc,
+                "is_default": acc == default,
+                "token_expiry": expiries[acc],
+            }
+            for acc in accounts
+        ]
         print_json(
             {
                 "authenticated": True,
@@ -225,11 +229,12 @@ def status() -> None:
         )
     else:
         print_success(f"Authentifiziert mit {len(accounts)} Konto(en):")
+        lines = []
         for acc in accounts:
-            marker = " *" if acc == default else ""
-            expiry = get_token_expiry(account=acc)
-            expiry_info = f" (Token bis: {expiry})" if expiry else ""
-            typer.echo(f"  {acc}{marker}{expiry_info}")
+            line = f"  {acc} *" if acc == default else f"  {acc}"
+            expiry = expiries[acc]
+            lines.append(f"{line} (Token bis: {expiry})" if expiry else line)
+        typer.echo("\n".join(lines))
 
 
 @auth_app.command("set-default")
@@ -243,6 +248,8 @@ def set_default_command(
 
     The default account is used when no --account option is specified.
     """
+    from gmail_cli.services.credentials import list_accounts, set_default_account
+
     accounts = list_accounts()
 
     if email not in accounts:
@@ -281,6 +288,12 @@ def token_command(
 
     WARNING: This contains sensitive data. Handle with care!
     """
+    from gmail_cli.services.credentials import (
+        get_default_account,
+        get_raw_credentials_json,
+        list_accounts,
+    )
+
     accounts = list_accounts()
 
     if not accounts:
@@ -313,11 +326,7 @@ def token_command(
     creds_json = get_raw_credentials_json(target_account)
 
     if not creds_json:
-        if is_json_mode():
-            print_json_error("NO_CREDENTIALS", f"Keine Credentials für {target_account}")
-        else:
-            print_error(f"Keine Credentials für {target_account}")
-        raise typer.Exit(1)
+        emit_error("NO_CREDENTIALS", f"Keine Credentials für {target_account}")
 
     # Output raw JSON (always JSON, regardless of --json flag)
     typer.echo(creds_json)
@@ -4,22 +4,17 @@ from typing import Annotated
 
 import typer
 
+from gmail_cli.cli._common import AccountOption
 from gmail_cli.cli.auth import require_auth
-from gmail_cli.services.gmail import (
-    DraftNotFoundError,
-    SendError,
-    delete_draft,
-    get_draft,
-    list_drafts,
-    send_draft,
-)
 from gmail_cli.utils.output import (
+    emit_error,
     is_json_mode,
     print_error,
     print_info,
     print_json,
     print_json_error,
     print_success,
+    print_text,
     print_warning,
 )
 
@@ -29,15 +24,10 @@ draft_app = typer.Typer(
     no_args_is_help=True,
 )
 
-# Account option type
-AccountOption = Annotated[
-    str | None,
-    typer.Option(
-        "--account",
-        "-A",
-        help="Account email to use. Defaults to the default account.",
-    ),
-]
+
+def _truncate(text: str, width: int) -> str:
+    """Truncate text to width characters, ending in "..." if shortened."""
+    return text if len(text) <= width else f"{text[: width - 3]}..."
 
 
 @draft_app.command("list")
@@ -63,6 +53,8 @@ def list_command(
         gmail draft list --json
         gmail draft list --account work@company.com
     """
+    from gmail_cli.services.gmail import list_drafts
+
     drafts = list_drafts(account=account, max_results=limit)
 
     if is_json_mode():
@@ -78,16 +70,13 @@ def list_command(
             return
 
         print_info(f"Entwürfe ({len(drafts)}):")
-        for draft in drafts:
-            draft_id = draft["id"]
-            to = draft.get("to", "") or "(kein Empfänger)"
-            subject = draft.get("subject", "(kein Betreff)")
-            # Truncate for display
-            if len(to) > 30:
-                to = to[:27] + "..."
-            if len(subject) > 40:
-                subject = subject[:37] + "..."
-            print(f"  {draft_id}  {to:<30}  {subject}")
+        lines = [
+            f"  {draft['id']}  "
+            f"{_truncate(draft.get('to', '') or '(kein Empfänger)', 30):<30}  "
+            f"{_truncate(draft.get('subject', '(kein Betreff)'), 40)}"
+            for draft in drafts
+        ]
+        print("\n".join(lines))
 
 
 @draft_app.command("show")
@@ -108,41 +97,40 @@ def show_command(
         gmail draft show r1234567890 --json
         gmail draft show r1234567890 --account work@company.com
     """
+    from gmail_cli.services.gmail import DraftNotFoundError, get_draft
+
     try:
         draft = get_draft(draft_id, account=account, include_body=True)
     except DraftNotFoundError as e:
-        if is_json_mode():
-            print_json_error("NOT_FOUND", e.message)
-        else:
-            print_error(e.message)
-        raise typer.Exit(1)
+        emit_error("NOT_FOUND", e.message)
 
     if is_json_mode():
         print_json(draft)
     else:
         print_info(f"Entwurf: {draft['id']}")
-        print()
-        print(f"An:      {draft.get('to', '(kein Empfänger)')}")
+        lines = ["", f"An:      {draft.get('to', '(kein Empfänger)')}"]
         if draft.get("cc"):
-            print(f"Cc:      {draft['cc']}")
-        print(f"Betreff: {draft.get('subject', '(kein Betreff)')}")
+            lines.append(f"Cc:      {draft['cc']}")
+        lines.append(f"Betreff: {draft.get('subject', '(kein Betreff)')}")
         if draft.get("thread_id"):
-            print(f"Thread:  {draft['thread_id']}")
-        print()
+            lines.append(f"Thread:  {draft['thread_id']}")
+        lines.append("")
 
         # Show body
         body = draft.get("body_text") or draft.get("snippet", "")
         if body:
-            print(body)
+            lines.append(body)
 
         # Show attachments
         attachments = draft.get("attachments", [])
         if attachments:
-            print()
-            print("Anhänge:")
+            lines.append("")
+            lines.append("Anhänge:")
             for att in attachments:
                 size_mb = att["size"] / (1024 * 1024)
-                print(f"  - {att['filename']} ({size_mb:.1f} MB)")
+                lines.append(f"  - {att['filename']} ({size_mb:.1f} MB)")
+
+        print_text("\n".join(lines))
 
 
 @draft_app.command("send")
@@ -162,6 +150,8 @@ def send_command(
         gmail draft send r1234567890
         gmail draft send r1234567890 --account work@company.com
     """
+    from gmail_cli.services.gmail import DraftNotFoundError, SendError, send_draft
+
     try:
         result = send_draft(draft_id, account=account)
 
@@ -179,11 +169,7 @@ def send_command(
             print_info(f"Thread-ID:  {result.get('threadId')}")
 
     except DraftNotFoundError as e:
-        if is_json_mode():
-            print_json_error("NOT_FOUND", e.message)
-        else:
-            print_error(e.message)
-        raise typer.Exit(1)
+        emit_error("NOT_FOUND", e.message)
     except SendError as e:
         if is_json_mode():
             print_json_error("SEND_FAILED", e.message)
@@ -209,6 +195,8 @@ def delete_command(
         gmail draft delete r1234567890
         gmail draft delete r1234567890 --account work@company.com
     """
+    from gmail_cli.services.gmail import DraftNotFoundError, delete_draft
+
     try:
         delete_draft(draft_id, account=account)
 
@@ -223,8 +211,4 @@ def delete_command(
             print_success("Entwurf gelöscht.")
 
     except DraftNotFoundError as e:
-        if is_json_mode():
-            print_json_error("NOT_FOUND", e.message)
-        else:
-            print_error(e.message)
-        raise typer.Exit(1)
+        emit_error("NOT_FOUND", e.message)
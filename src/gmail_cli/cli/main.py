@@ -1,24 +1,76 @@
 """Main CLI application."""
 
-from typing import Annotated
+from importlib import import_module
+from typing import Annotated, Any
 
 import typer
+from typer.core import TyperGroup
+from typer.models import CommandInfo
 
 from gmail_cli import __version__
-from gmail_cli.cli.accounts import accounts_app
-from gmail_cli.cli.attachment import attachment_app, download_attachment_command, list_attachments
-from gmail_cli.cli.auth import auth_app
-from gmail_cli.cli.draft import draft_app
-from gmail_cli.cli.mark import mark_read_command, mark_unread_command
-from gmail_cli.cli.read import read_command
-from gmail_cli.cli.search import search_command
-from gmail_cli.cli.send import reply_command, send_command, sendas_command
-from gmail_cli.utils.output import set_json_mode
+
+# Commands are imported only when invoked (or when --help lists them), so
+# startup and --version don't pay for the Gmail API client imports.
+# Maps command name to (module path, attribute, help override). The attribute
+# is either a command function or a Typer sub-app. Order is the help order.
+LAZY_COMMANDS: dict[str, tuple[str, str, str | None]] = {
+    "search": ("gmail_cli.cli.search", "search_command", None),
+    "read": ("gmail_cli.cli.read", "read_command", None),
+    "send": ("gmail_cli.cli.send", "send_command", None),
+    "send-batch": ("gmail_cli.cli.send", "send_batch_command", None),
+    "reply": ("gmail_cli.cli.send", "reply_command", None),
+    "sendas": ("gmail_cli.cli.send", "sendas_command", None),
+    "mark-read": ("gmail_cli.cli.mark", "mark_read_command", None),
+    "mark-unread": ("gmail_cli.cli.mark", "mark_unread_command", None),
+    # Top-level shortcuts for common attachment operations
+    "download": (
+        "gmail_cli.cli.attachment",
+        "download_attachment_command",
+        "Download attachment (shortcut for 'attachment download').",
+    ),
+    "attachments": (
+        "gmail_cli.cli.attachment",
+        "list_attachments",
+        "List attachments (shortcut for 'attachment list').",
+    ),
+    "accounts": ("gmail_cli.cli.accounts", "accounts_app", None),
+    "auth": ("gmail_cli.cli.auth", "auth_app", None),
+    "attachment": ("gmail_cli.cli.attachment", "attachment_app", None),
+    "draft": ("gmail_cli.cli.draft", "draft_app", None),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that imports and builds commands on first use."""
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        """List registered commands followed by the lazily loaded ones."""
+        names = super().list_commands(ctx)
+        return names + [name for name in LAZY_COMMANDS if name not in names]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        """Resolve a command, importing its module on first access."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_COMMANDS:
+            module_path, attr, help_text = LAZY_COMMANDS[cmd_name]
+            target = getattr(import_module(module_path), attr)
+            if isinstance(target, typer.Typer):
+                command = typer.main.get_group(target)
+            else:
+                command = typer.main.get_command_from_info(
+                    CommandInfo(name=cmd_name, callback=target, help=help_text),
+                    pretty_exceptions_short=app.pretty_exceptions_short,
+                    rich_markup_mode=self.rich_markup_mode,
+                )
+            self.add_command(command, cmd_name)
+        return command
+
 
 app = typer.Typer(
     name="gmail",
     help="A command-line interface for Gmail, similar to gh CLI.",
     no_args_is_help=True,
+    cls=LazyTyperGroup,
 )
 
 
@@ -50,37 +102,9 @@ def main(
     ] = False,
 ) -> None:
     """Gmail CLI - Access Gmail from the command line."""
-    set_json_mode(json_output)
+    from gmail_cli.utils.output import set_json_mode
 
-
-# Register subcommands
-app.add_typer(accounts_app, name="accounts")
-app.add_typer(auth_app, name="auth")
-app.add_typer(attachment_app, name="attachment")
-app.add_typer(draft_app, name="draft")
-app.command("search")(search_command)
-app.command("read")(read_command)
-app.command("send")(send_command)
-app.command("reply")(reply_command)
-app.command("sendas")(sendas_command)
-app.command("mark-read")(mark_read_command)
-app.command("mark-unread")(mark_unread_command)
-
-# Top-level shortcuts for common attachment operations
-app.command("download", help="Download attachment (shortcut for 'attachment download').")(
-    download_attachment_command
-)
-app.command("attachments", help="List attachments (shortcut for 'attachment list').")(
-    list_attachments
-)
-
-# Top-level shortcuts for common attachment operations
-app.command("download", help="Download attachment (shortcut for 'attachment download').")(
-    download_attachment_command
-)
-app.command("attachments", help="List attachments (shortcut for 'attachment list').")(
-    list_attachments
-)
+    set_json_mode(json_output)
 
 
 if __name__ == "__main__":
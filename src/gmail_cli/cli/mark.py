@@ -4,59 +4,118 @@ from typing import Annotated
 
 import typer
 
+from gmail_cli.cli._common import AccountOption
 from gmail_cli.cli.auth import require_auth
-from gmail_cli.services.auth import resolve_account
-from gmail_cli.services.gmail import (
-    MessageNotFoundError,
-    mark_as_read,
-    mark_as_unread,
-)
 from gmail_cli.utils.output import (
     is_json_mode,
     print_error,
     print_json,
     print_success,
+    print_text,
 )
 
-# Account option type
-AccountOption = Annotated[
-    str | None,
-    typer.Option(
-        "--account",
-        "-A",
-        help="Account email to use. Defaults to the default account.",
-    ),
-]
+# Maximum number of concurrent per-message calls when batchModify is not used
+MAX_MARK_WORKERS = 8
+
+
+def _result_row(msg_id: str, error: Exception | None) -> dict[str, str]:
+    """Build the JSON result entry for one message."""
+    from gmail_cli.services.gmail import MessageNotFoundError
+
+    if error is None:
+        return {"id": msg_id, "status": "success"}
+    reason = "not_found" if isinstance(error, MessageNotFoundError) else str(error)
+    return {"id": msg_id, "status": "error", "error": reason}
+
+
+def _result_line(msg_id: str, error: Exception | None, action_de: str) -> str:
+    """Build the plain-text status line for one message in bulk output."""
+    from gmail_cli.services.gmail import MessageNotFoundError
+
+    if error is None:
+        return f"✓ {msg_id} als {action_de} markiert"
+    if isinstance(error, MessageNotFoundError):
+        return f"✗ Fehler: {msg_id}: Nachricht nicht gefunden"
+    return f"✗ Fehler: {msg_id}: {error}"
 
 
 def _mark_messages(message_ids: list[str], account: str | None, as_read: bool) -> None:
     """Internal helper to mark messages as read or unread."""
+    from googleapiclient.errors import HttpError
+
+    from gmail_cli.services.auth import resolve_account
+    from gmail_cli.services.gmail import (
+        MessageNotFoundError,
+        find_missing_messages,
+        get_rate_limit_wait,
+        gmail_worker_pool,
+        mark_as_read,
+        mark_as_read_batch,
+        mark_as_unread,
+        mark_as_unread_batch,
+    )
+
     account = resolve_account(account)
     action = "read" if as_read else "unread"
     action_de = "gelesen" if as_read else "ungelesen"
     mark_fn = mark_as_read if as_read else mark_as_unread
-
-    results = []
-    success_count = 0
-    error_count = 0
-
-    for msg_id in message_ids:
+    batch_fn = mark_as_read_batch if as_read else mark_as_unread_batch
+
+    # Drop repeated IDs (keeping order) so each message is modified only once
+    requested_count = len(message_ids)
+    message_ids = list(dict.fromkeys(message_ids))
+    skipped_duplicates = requested_count - len(message_ids)
+
+    wait_before = get_rate_limit_wait()
+
+    def _is_bad_request(error: Exception | None) -> bool:
+        return isinstance(error, HttpError) and error.resp.status in (400, 404)
+
+    # Several IDs go out as batchModify requests. They silently ignore unknown
+    # IDs, so look those up first to keep reporting them as not found. IDs in
+    # a batch rejected as a bad request (e.g. a malformed ID) are retried with
+    # one call per ID to find the bad ones; other errors apply to every ID
+    # the failed request covered.
+    outcome_by_id: dict[str, Exception | None] = {}
+    fallback_ids = message_ids
+    if len(message_ids) > 1:
         try:
-            mark_fn(msg_id, account=account)
-            success_count += 1
-            results.append({"id": msg_id, "status": "success"})
-            if not is_json_mode():
-                print_success(f"{msg_id} als {action_de} markiert")
-        except MessageNotFoundError:
-            error_count += 1
-            results.append({"id": msg_id, "status": "error", "error": "not_found"})
-            if not is_json_mode():
-                print_error(f"{msg_id}: Nachricht nicht gefunden")
+            missing = find_missing_messages(message_ids, account=account)
+            existing = [msg_id for msg_id in message_ids if msg_id not in missing]
+            failed = batch_fn(existing, account=account) if existing else {}
         except Exception as e:
-            error_count += 1
-            results.append({"id": msg_id, "status": "error", "error": str(e)})
-            if not is_json_mode():
-                print_error(f"{msg_id}: {e}")
+            if not _is_bad_request(e):
+                outcome_by_id = dict.fromkeys(message_ids, e)
+                fallback_ids = []
+        else:
+            outcome_by_id = {
+                msg_id: MessageNotFoundError(msg_id) if msg_id in missing else failed.get(msg_id)
+                for msg_id in message_ids
+            }
+            fallback_ids = [msg_id for msg_id in existing if _is_bad_request(failed.get(msg_id))]
+
+    if fallback_ids:
+
+        def _try_mark(msg_id: str) -> Exception | None:
+            try:
+                mark_fn(msg_id, account=account)
+            except Exception as e:
+                return e
+            return None
+
+        if len(fallback_ids) == 1:
+            outcome_by_id[fallback_ids[0]] = _try_mark(fallback_ids[0])
+        else:
+            # Per-ID calls are independent network round trips, so overlap them.
+            workers = min(MAX_MARK_WORKERS, len(fallback_ids))
+            with gmail_worker_pool(workers, account=account) as executor:
+                outcome_by_id.update(
+                    zip(fallback_ids, executor.map(_try_mark, fallback_ids), strict=True)
+                )
+
+    outcomes = [outcome_by_id[msg_id] for msg_id in message_ids]
+    success_count = outcomes.count(None)
+    error_count = len(message_ids) - success_count
 
     if is_json_mode():
         print_json(
@@ -65,11 +124,31 @@ def _mark_messages(message_ids: list[str], account: str | None, as_read: bool) -
                 "success_count": success_count,
                 "error_count": error_count,
                 "total": len(message_ids),
-                "results": results,
+                "skipped_duplicates": skipped_duplicates,
+                "rate_limit_wait_seconds": round(get_rate_limit_wait() - wait_before, 3),
+                "results": [
+                    _result_row(msg_id, error)
+                    for msg_id, error in zip(message_ids, outcomes, strict=True)
+                ],
             }
         )
-    elif len(message_ids) > 1:
-        typer.echo(f"\n{success_count}/{len(message_ids)} Nachrichten als {action_de} markiert")
+    elif len(message_ids) == 1:
+        msg_id, error = message_ids[0], outcomes[0]
+        if error is None:
+            print_success(f"{msg_id} als {action_de} markiert")
+        elif isinstance(error, MessageNotFoundError):
+            print_error(f"{msg_id}: Nachricht nicht gefunden")
+        else:
+            print_error(f"{msg_id}: {error}")
+    else:
+        # Collect the per-message lines and write them in one go instead of
+        # one console write (and flush) per ID
+        lines = [
+            _result_line(msg_id, error, action_de)
+            for msg_id, error in zip(message_ids, outcomes, strict=True)
+        ]
+        lines.append(f"\n{success_count}/{len(message_ids)} Nachrichten als {action_de} markiert")
+        print_text("\n".join(lines))
 
     if error_count > 0:
         raise typer.Exit(1)
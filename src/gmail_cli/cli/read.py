@@ -4,27 +4,15 @@ from typing import Annotated
 
 import typer
 
+from gmail_cli.cli._common import AccountOption
 from gmail_cli.cli.auth import require_auth
-from gmail_cli.services.gmail import get_email
-from gmail_cli.utils.html import html_to_text
 from gmail_cli.utils.output import (
+    emit_error,
     is_json_mode,
     print_email_detail,
-    print_error,
     print_json,
-    print_json_error,
 )
 
-# Account option type
-AccountOption = Annotated[
-    str | None,
-    typer.Option(
-        "--account",
-        "-A",
-        help="Account email to use. Defaults to the default account.",
-    ),
-]
-
 
 @require_auth
 def read_command(
@@ -42,6 +30,13 @@ def read_command(
             help="Show raw body without HTML conversion.",
         ),
     ] = False,
+    include_html: Annotated[
+        bool,
+        typer.Option(
+            "--include-html",
+            help="Include the HTML body in JSON output.",
+        ),
+    ] = False,
     account: AccountOption = None,
 ) -> None:
     """Read a full email by its message ID.
@@ -49,52 +44,48 @@ def read_command(
     Examples:
         gmail read 18c1234abcd5678
         gmail read 18c1234abcd5678 --raw
+        gmail read 18c1234abcd5678 --json --include-html
         gmail read 18c1234abcd5678 --account work@company.com
     """
+    from gmail_cli.services.gmail import get_email
+
     email = get_email(message_id, account=account)
 
     if not email:
-        if is_json_mode():
-            print_json_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
-        else:
-            print_error(f"E-Mail mit ID '{message_id}' nicht gefunden")
-        raise typer.Exit(1)
+        emit_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
 
     if is_json_mode():
-        print_json(
-            {
-                "id": email.id,
-                "thread_id": email.thread_id,
-                "subject": email.subject,
-                "sender": email.sender,
-                "recipients": email.recipients,
-                "cc": email.cc,
-                "date": email.date.isoformat(),
-                "body_text": email.body_text,
-                "body_html": email.body_html,
-                "snippet": email.snippet,
-                "labels": email.labels,
-                "is_read": email.is_read,
-                "attachments": [
-                    {
-                        "id": att.id,
-                        "filename": att.filename,
-                        "mime_type": att.mime_type,
-                        "size": att.size,
-                    }
-                    for att in email.attachments
-                ],
-            }
-        )
+        data = {
+            "id": email.id,
+            "thread_id": email.thread_id,
+            "subject": email.subject,
+            "sender": email.sender,
+            "recipients": email.recipients,
+            "cc": email.cc,
+            "date": email.date,
+            "body_text": email.body_text,
+            "snippet": email.snippet,
+            "labels": email.labels,
+            "is_read": email.is_read,
+            "attachments": email.attachments,
+        }
+        if include_html:
+            data["body_html"] = email.body_html
+        print_json(data)
+        return
+
+    # Determine body to display
+    if raw:
+        print_email_detail(email, email.body_text or email.body_html)
+        return
+
+    if email.body_text:
+        body = email.body_text
+    elif email.body_html:
+        from gmail_cli.utils.html import html_to_text
+
+        body = html_to_text(email.body_html)
     else:
-        # Determine body to display
-        if raw:
-            body = email.body_text or email.body_html
-        elif email.body_text:
-            body = email.body_text
-        elif email.body_html:
-            body = html_to_text(email.body_html)
-        else:
-            body = "(kein Inhalt)"
+        body = "(kein Inhalt)"
 
-        print_email_detail(email, body)
+    print_email_detail(email, body)
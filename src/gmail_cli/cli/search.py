@@ -4,25 +4,16 @@ from typing import Annotated
 
 import typer
 
+from gmail_cli.cli._common import AccountOption
 from gmail_cli.cli.auth import require_auth
-from gmail_cli.services.gmail import search_emails
 from gmail_cli.utils.output import (
+    emit_error,
     is_json_mode,
     print_info,
     print_json,
     print_search_results,
 )
 
-# Shared account option type
-AccountOption = Annotated[
-    str | None,
-    typer.Option(
-        "--account",
-        "-A",
-        help="Account email to use. Defaults to the default account.",
-    ),
-]
-
 
 @require_auth
 def search_command(
@@ -114,19 +105,24 @@ def search_command(
         gmail search --after 2025-01-01 --before 2025-12-31
         gmail search "project" --account work@company.com
     """
-    result = search_emails(
-        query=query,
-        from_addr=from_addr,
-        to_addr=to_addr,
-        subject=subject,
-        label=label,
-        after=after,
-        before=before,
-        has_attachment=has_attachment,
-        limit=limit,
-        page_token=page,
-        account=account,
-    )
+    from gmail_cli.services.gmail import EmptyDateRangeError, search_emails
+
+    try:
+        result = search_emails(
+            query=query,
+            from_addr=from_addr,
+            to_addr=to_addr,
+            subject=subject,
+            label=label,
+            after=after,
+            before=before,
+            has_attachment=has_attachment,
+            limit=limit,
+            page_token=page,
+            account=account,
+        )
+    except EmptyDateRangeError as e:
+        emit_error("INVALID_DATE_RANGE", e.message)
 
     if is_json_mode():
         print_json(
@@ -137,7 +133,7 @@ def search_command(
                         "thread_id": email.thread_id,
                         "subject": email.subject,
                         "sender": email.sender,
-                        "date": email.date.isoformat(),
+                        "date": email.date,
                         "snippet": email.snippet,
                         "is_read": email.is_read,
                         "labels": email.labels,
@@ -1,24 +1,18 @@
 """Send and reply CLI commands."""
 
+import json
+import locale
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
+from gmail_cli.cli._common import AccountOption
 from gmail_cli.cli.auth import require_auth
-from gmail_cli.services.gmail import (
-    SendError,
-    compose_email,
-    compose_reply,
-    create_draft,
-    get_email,
-    get_signature,
-    list_send_as_addresses,
-    send_email,
-)
-from gmail_cli.utils.html import html_to_text
-from gmail_cli.utils.markdown import markdown_to_html, wrap_html_for_email
 from gmail_cli.utils.output import (
+    emit_error,
     is_json_mode,
     print_error,
     print_info,
@@ -27,6 +21,154 @@ from gmail_cli.utils.output import (
     print_success,
 )
 
+# Existing reply prefix on a subject ("Re:", "RE:", ...)
+_RE_PREFIX = re.compile(r"^\s*re:", re.IGNORECASE)
+
+# Bodies longer than this (in characters) are rendered without being cached
+MAX_CACHED_MARKDOWN = 64_000
+
+
+@lru_cache(maxsize=128)
+def _render_markdown(body: str) -> str:
+    """Convert a Markdown body to email-ready HTML.
+
+    Results are cached, so repeated bodies are only rendered once per process.
+
+    Args:
+        body: Markdown source text.
+
+    Returns:
+        The rendered body wrapped in the email HTML template.
+    """
+    from gmail_cli.utils.markdown import markdown_to_html, wrap_html_for_email
+
+    return wrap_html_for_email(markdown_to_html(body))
+
+
+def _markdown_body_html(body: str) -> str:
+    """Render a Markdown body, using the cache only for bodies of typical size.
+
+    Rendering is a pure function of the body, so cached results are always
+    current; very large bodies bypass the cache to keep its memory bounded.
+
+    Args:
+        body: Markdown source text.
+
+    Returns:
+        The rendered body wrapped in the email HTML template.
+    """
+    if len(body) > MAX_CACHED_MARKDOWN:
+        return _render_markdown.__wrapped__(body)
+    return _render_markdown(body)
+
+
+@lru_cache(maxsize=4)
+def _signature_text(sig: str) -> str:
+    """Convert a signature to plain text, once per distinct signature.
+
+    Args:
+        sig: Signature HTML as stored in Gmail.
+
+    Returns:
+        The signature as plain text.
+    """
+    from gmail_cli.utils.html import html_to_text
+
+    return html_to_text(sig)
+
+
+def _append_signature(body_content: str, html_body: str | None, sig: str) -> tuple[str, str]:
+    """Append the Gmail signature to the plain text and HTML bodies.
+
+    Args:
+        body_content: Plain text body.
+        html_body: HTML body, or None in plain mode.
+        sig: Signature HTML as stored in Gmail.
+
+    Returns:
+        Tuple of (plain text body, HTML body), both ending with the signature.
+    """
+    # Plain text version: convert HTML signature to text and append
+    body_content = f"{body_content}\n\n--\n{_signature_text(sig)}"
+    if not html_body:
+        # Plain mode with signature: create minimal HTML for signature
+        html_body = "<div>" + body_content.replace("\n", "<br>") + "</div>"
+    return body_content, f"{html_body}<br><div>--</div>{sig}"
+
+
+def _read_body_file(body_file: str) -> str:
+    """Read an email body from a file.
+
+    The file is read in one call and decoded as UTF-8, falling back to the
+    locale encoding for files that are not valid UTF-8. Line endings are
+    normalized to "\n", as when reading in text mode.
+
+    Args:
+        body_file: Path to the body file.
+
+    Returns:
+        The file content.
+
+    Raises:
+        typer.Exit: If the file does not exist or cannot be decoded.
+    """
+    try:
+        data = Path(body_file).read_bytes()
+    except FileNotFoundError:
+        emit_error("FILE_NOT_FOUND", f"Datei nicht gefunden: {body_file}")
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        encoding = locale.getpreferredencoding(False)
+        try:
+            text = data.decode(encoding)
+        except UnicodeDecodeError:
+            emit_error(
+                "INVALID_ENCODING",
+                f"Datei ist weder UTF-8 noch {encoding}: {body_file}",
+            )
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _parse_batch_record(line: str) -> dict:
+    """Parse and validate one line of a send-batch file.
+
+    Args:
+        line: A JSON object with "to", "subject" and "body" and the optional
+            keys "cc", "bcc", "attach", "from" and "plain".
+
+    Returns:
+        The record, with "to", "cc", "bcc" and "attach" normalized to lists.
+
+    Raises:
+        ValueError: If the line is not valid JSON, misses a required field or
+            has a field of the wrong type.
+    """
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("Eintrag ist kein JSON-Objekt")
+
+    for key in ("to", "subject", "body"):
+        if not record.get(key):
+            raise ValueError(f"Pflichtfeld '{key}' fehlt")
+
+    for key in ("subject", "body", "from"):
+        if record.get(key) is not None and not isinstance(record[key], str):
+            raise ValueError(f"Feld '{key}' muss ein Text sein")
+
+    if record.get("plain") is not None and not isinstance(record["plain"], bool):
+        raise ValueError("Feld 'plain' muss true oder false sein")
+
+    for key in ("to", "cc", "bcc", "attach"):
+        value = record.get(key) or []
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"Feld '{key}' muss ein Text oder eine Liste von Texten sein")
+        record[key] = value
+
+    return record
+
 
 def _validate_send_as_address(from_addr: str, account: str | None = None) -> None:
     """Validate that the Send-As address is configured and verified.
@@ -38,7 +180,9 @@ def _validate_send_as_address(from_addr: str, account: str | None = None) -> Non
     Raises:
         typer.Exit: If the address is not valid.
     """
-    send_as_addresses = list_send_as_addresses(account=account)
+    from gmail_cli.services.gmail import list_send_as_addresses_cached
+
+    send_as_addresses = list_send_as_addresses_cached(account=account)
     valid_emails = [sa["email"].lower() for sa in send_as_addresses]
 
     if from_addr.lower() not in valid_emails:
@@ -56,17 +200,6 @@ def _validate_send_as_address(from_addr: str, account: str | None = None) -> Non
         raise typer.Exit(1)
 
 
-# Account option type
-AccountOption = Annotated[
-    str | None,
-    typer.Option(
-        "--account",
-        "-A",
-        help="Account email to use. Defaults to the default account.",
-    ),
-]
-
-
 @require_auth
 def send_command(
     to: Annotated[
@@ -172,50 +305,30 @@ def send_command(
         gmail send --to x@x.com --subject "Quick note" --body "Hi" --no-signature
         gmail send --to x@x.com --subject "Hi" --body "From alias" --from alias@example.com
     """
+    from gmail_cli.services.gmail import SendError, compose_email, create_draft, send_email
+
     # Get body content
     if body_file:
-        path = Path(body_file)
-        if not path.exists():
-            if is_json_mode():
-                print_json_error("FILE_NOT_FOUND", f"Datei nicht gefunden: {body_file}")
-            else:
-                print_error(f"Datei nicht gefunden: {body_file}")
-            raise typer.Exit(1)
-        body_content = path.read_text()
+        body_content = _read_body_file(body_file)
     elif body:
         body_content = body
     else:
-        if is_json_mode():
-            print_json_error("NO_BODY", "E-Mail-Text erforderlich (--body oder --body-file)")
-        else:
-            print_error("E-Mail-Text erforderlich (--body oder --body-file)")
-        raise typer.Exit(1)
+        emit_error("NO_BODY", "E-Mail-Text erforderlich (--body oder --body-file)")
 
     # Validate Send-As address if provided
     if from_addr:
         _validate_send_as_address(from_addr, account=account)
 
     # Prepare HTML body: Markdown conversion (default) or plain text
-    html_body = None
-    if not plain:
-        # Convert Markdown to HTML (default behavior)
-        html_body = markdown_to_html(body_content)
-        html_body = wrap_html_for_email(html_body)
+    html_body = None if plain else _markdown_body_html(body_content)
 
     # Handle signature
     if signature:
+        from gmail_cli.services.gmail import get_signature
+
         sig = get_signature(account=account)
         if sig:
-            # Plain text version: convert HTML signature to text and append
-            sig_text = html_to_text(sig)
-            body_content = f"{body_content}\n\n--\n{sig_text}"
-            # HTML version: append signature to HTML body
-            if html_body:
-                html_body = f"{html_body}<br><div>--</div>{sig}"
-            else:
-                # Plain mode with signature: create minimal HTML for signature
-                body_html = body_content.replace("\n", "<br>")
-                html_body = f"<div>{body_html}</div><br><div>--</div>{sig}"
+            body_content, html_body = _append_signature(body_content, html_body, sig)
 
     # Compose message
     message = compose_email(
@@ -374,89 +487,57 @@ def reply_command(
         gmail reply 18c1234abcd5678 --body "Review this later" --draft
         gmail reply 18c1234abcd5678 --body "From alias" --from alias@example.com
     """
+    from gmail_cli.services.gmail import (
+        SendError,
+        compose_reply,
+        create_draft,
+        get_email,
+        send_email,
+    )
+
     # Get original email
     email = get_email(message_id, account=account)
 
     if not email:
-        if is_json_mode():
-            print_json_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
-        else:
-            print_error(f"E-Mail mit ID '{message_id}' nicht gefunden")
-        raise typer.Exit(1)
+        emit_error("NOT_FOUND", f"E-Mail mit ID '{message_id}' nicht gefunden")
 
     # Get body content
     if body_file:
-        path = Path(body_file)
-        if not path.exists():
-            if is_json_mode():
-                print_json_error("FILE_NOT_FOUND", f"Datei nicht gefunden: {body_file}")
-            else:
-                print_error(f"Datei nicht gefunden: {body_file}")
-            raise typer.Exit(1)
-        body_content = path.read_text()
+        body_content = _read_body_file(body_file)
     elif body:
         body_content = body
     else:
-        if is_json_mode():
-            print_json_error("NO_BODY", "Antwort-Text erforderlich (--body oder --body-file)")
-        else:
-            print_error("Antwort-Text erforderlich (--body oder --body-file)")
-        raise typer.Exit(1)
+        emit_error("NO_BODY", "Antwort-Text erforderlich (--body oder --body-file)")
 
     # Validate Send-As address if provided
     if from_addr:
         _validate_send_as_address(from_addr, account=account)
 
     # Prepare HTML body: Markdown conversion (default) or plain text
-    html_body = None
-    if not plain:
-        # Convert Markdown to HTML (default behavior)
-        html_body = markdown_to_html(body_content)
-        html_body = wrap_html_for_email(html_body)
+    html_body = None if plain else _markdown_body_html(body_content)
 
     # Handle signature
     if signature:
+        from gmail_cli.services.gmail import get_signature
+
         sig = get_signature(account=account)
         if sig:
-            # Plain text version: convert HTML signature to text and append
-            sig_text = html_to_text(sig)
-            body_content = f"{body_content}\n\n--\n{sig_text}"
-            # HTML version: append signature to HTML body
-            if html_body:
-                html_body = f"{html_body}<br><div>--</div>{sig}"
-            else:
-                # Plain mode with signature: create minimal HTML for signature
-                body_html = body_content.replace("\n", "<br>")
-                html_body = f"<div>{body_html}</div><br><div>--</div>{sig}"
+            body_content, html_body = _append_signature(body_content, html_body, sig)
 
     # Determine recipients
     # Extract email from "Name <email>" format
-    sender_email = email.sender
-    if "<" in sender_email:
-        sender_email = sender_email.split("<")[1].rstrip(">")
+    sender_email = email.sender_email
 
     recipients = [sender_email]
-
     if reply_all:
-        # Add CC recipients
-        if email.cc:
-            recipients.extend(email.cc)
-        # Add other To recipients (excluding ourselves)
-        for r in email.recipients:
-            if r not in recipients:
-                recipients.append(r)
+        # Add CC and other To recipients, dropping duplicates in one pass
+        recipients = list(dict.fromkeys([sender_email, *email.cc, *email.recipients]))
 
     # Build reply subject
-    subject = email.subject
-    if not subject.lower().startswith("re:"):
-        subject = f"Re: {subject}"
+    subject = email.subject if _RE_PREFIX.match(email.subject) else f"Re: {email.subject}"
 
     # Build CC list: combine user-specified CC with original CC (if reply_all)
-    reply_cc = list(cc) if cc else []
-    if reply_all and email.cc:
-        for addr in email.cc:
-            if addr not in reply_cc:
-                reply_cc.append(addr)
+    reply_cc = list(dict.fromkeys([*(cc or []), *(email.cc if reply_all else [])]))
 
     # Compose reply
     message = compose_reply(
@@ -523,6 +604,134 @@ def reply_command(
         raise typer.Exit(1)
 
 
+@require_auth
+def send_batch_command(
+    path: Annotated[
+        str,
+        typer.Argument(
+            help="JSON Lines file with one email object per line.",
+        ),
+    ],
+    signature: Annotated[
+        bool,
+        typer.Option(
+            "--signature/--no-signature",
+            "--sig/--no-sig",
+            help="Include Gmail signature (default: enabled).",
+        ),
+    ] = True,
+    account: AccountOption = None,
+) -> None:
+    """Send several emails from a JSON Lines file.
+
+    Each line is an object with "to", "subject" and "body" and optionally
+    "cc", "bcc", "attach", "from" and "plain". The account, signature and
+    Send-As addresses are looked up once for the whole file. Lines that fail
+    are reported and skipped; the remaining emails are still sent.
+
+    Examples:
+        gmail send-batch sends.jsonl
+        gmail send-batch sends.jsonl --no-signature --account work@company.com
+    """
+    from gmail_cli.services.auth import (
+        AccountNotFoundError,
+        NoAccountConfiguredError,
+        resolve_account,
+    )
+    from gmail_cli.services.gmail import (
+        SendError,
+        compose_email,
+        get_signature,
+        list_send_as_addresses_cached,
+        send_email,
+    )
+
+    lines = _read_body_file(path).splitlines()
+
+    try:
+        account = resolve_account(account)
+    except AccountNotFoundError as e:
+        emit_error(
+            "ACCOUNT_NOT_FOUND",
+            f"Konto '{e.account}' nicht gefunden",
+            f"Verfügbare Konten: {', '.join(e.available)}",
+        )
+    except NoAccountConfiguredError:
+        emit_error("NOT_AUTHENTICATED", "Kein Konto konfiguriert")
+    sig = get_signature(account=account) if signature else None
+    send_as: set[str] | None = None  # Loaded on the first record with "from"
+
+    results = []
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = _parse_batch_record(line)
+
+            from_addr = record.get("from")
+            if from_addr:
+                if send_as is None:
+                    addresses = list_send_as_addresses_cached(account=account)
+                    send_as = {sa["email"].lower() for sa in addresses}
+                if from_addr.lower() not in send_as:
+                    raise ValueError(f"'{from_addr}' ist keine gültige Send-As Adresse")
+
+            body_content = record["body"]
+            html_body = None if record.get("plain") else _markdown_body_html(body_content)
+            if sig:
+                body_content, html_body = _append_signature(body_content, html_body, sig)
+
+            message = compose_email(
+                to=record["to"],
+                subject=record["subject"],
+                body=body_content,
+                cc=record["cc"],
+                bcc=record["bcc"],
+                attachments=record["attach"],
+                html_body=html_body,
+                from_addr=from_addr,
+            )
+            result = send_email(message, account=account)
+        except Exception as e:
+            # Record any failure (e.g. an expired token or a dropped
+            # connection) for this line and go on, so the summary still lists
+            # the lines that were already sent
+            error = e.message if isinstance(e, SendError) else str(e)
+            results.append({"line": line_no, "status": "error", "error": error})
+        else:
+            results.append(
+                {
+                    "line": line_no,
+                    "status": "sent",
+                    "message_id": result.get("id"),
+                    "thread_id": result.get("threadId"),
+                }
+            )
+
+    sent_count = sum(1 for r in results if r["status"] == "sent")
+    error_count = len(results) - sent_count
+
+    if is_json_mode():
+        print_json(
+            {
+                "sent_count": sent_count,
+                "error_count": error_count,
+                "total": len(results),
+                "results": results,
+            }
+        )
+    else:
+        for r in results:
+            if r["status"] == "sent":
+                print_success(f"Zeile {r['line']}: gesendet ({r['message_id']})")
+            else:
+                print_error(f"Zeile {r['line']}: {r['error']}")
+        typer.echo(f"\n{sent_count}/{len(results)} E-Mails gesendet")
+
+    if error_count > 0:
+        raise typer.Exit(1)
+
+
 @require_auth
 def sendas_command(
     account: AccountOption = None,
@@ -537,7 +746,9 @@ def sendas_command(
         gmail sendas --json
         gmail sendas --account work@company.com
     """
-    addresses = list_send_as_addresses(account=account)
+    from gmail_cli.services.gmail import list_send_as_addresses_cached
+
+    addresses = list_send_as_addresses_cached(account=account)
 
     if is_json_mode():
         print_json({"sendas": addresses, "count": len(addresses)})
@@ -2,8 +2,11 @@
 
 from dataclasses import dataclass
 
+# Display units indexed by (bit length - 1) // 10, i.e. by power of 1024
+_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024**2), ("GB", 1024**3))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Attachment:
     """An attachment of a Gmail message."""
 
@@ -16,9 +19,9 @@ class Attachment:
     @property
     def size_human(self) -> str:
         """Human-readable size."""
-        if self.size < 1024:
-            return f"{self.size} B"
-        elif self.size < 1024 * 1024:
-            return f"{self.size / 1024:.1f} KB"
-        else:
-            return f"{self.size / (1024 * 1024):.1f} MB"
+        size = self.size
+        index = min(max(0, (size.bit_length() - 1) // 10), len(_UNITS) - 1)
+        if index == 0:
+            return f"{size} B"
+        name, divisor = _UNITS[index]
+        return f"{size / divisor:.1f} {name}"
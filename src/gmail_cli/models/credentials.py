@@ -1,12 +1,19 @@
 """Credentials model for OAuth 2.0 authentication."""
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 
+# Tokens are refreshed this many seconds before they expire
+REFRESH_MARGIN = 300
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Credentials:
-    """OAuth 2.0 credentials for Gmail API access."""
+    """OAuth 2.0 credentials for Gmail API access.
+
+    A naive expiry is interpreted as UTC.
+    """
 
     access_token: str
     refresh_token: str
@@ -16,12 +23,19 @@ class Credentials:
     scopes: list[str]
     expiry: datetime
 
+    def _expiry_timestamp(self) -> float:
+        """Return the expiry as a POSIX timestamp, reading a naive expiry as UTC."""
+        expiry = self.expiry
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return expiry.timestamp()
+
     @property
     def is_expired(self) -> bool:
         """Check if access token is expired."""
-        return datetime.utcnow() >= self.expiry
+        return time.time() >= self._expiry_timestamp()
 
     @property
     def needs_refresh(self) -> bool:
         """Check if token expires soon (< 5 min)."""
-        return datetime.utcnow() >= (self.expiry - timedelta(minutes=5))
+        return time.time() >= self._expiry_timestamp() - REFRESH_MARGIN
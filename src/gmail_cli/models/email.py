@@ -1,14 +1,35 @@
 """Email model for Gmail messages."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from email.utils import parseaddr
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from gmail_cli.models.attachment import Attachment
 
+# "Name <address>" with an optionally quoted name
+_SENDER_RE = re.compile(r'^\s*"?(?P<name>[^"<]*?)"?\s*<(?P<email>[^>]+)>\s*$')
 
-@dataclass
+
+def _parse_sender(sender: str) -> tuple[str, str]:
+    """Split a From header value into (name, address).
+
+    Values without an address part are returned unchanged for both.
+    """
+    match = _SENDER_RE.match(sender)
+    if match:
+        return match["name"].strip(), match["email"]
+    if "<" in sender:
+        # Unusual quoting or trailing text: let the stdlib parser handle it
+        name, address = parseaddr(sender)
+        if address:
+            return name, address
+    return sender, sender
+
+
+@dataclass(slots=True)
 class Email:
     """A Gmail message with all relevant metadata."""
 
@@ -37,13 +58,9 @@ class Email:
     @property
     def sender_name(self) -> str:
         """Extract only the name from the sender."""
-        if "<" in self.sender:
-            return self.sender.split("<")[0].strip().strip('"')
-        return self.sender
+        return _parse_sender(self.sender)[0]
 
     @property
     def sender_email(self) -> str:
         """Extract only the email address from the sender."""
-        if "<" in self.sender and ">" in self.sender:
-            return self.sender.split("<")[1].split(">")[0]
-        return self.sender
+        return _parse_sender(self.sender)[1]
@@ -1,12 +1,14 @@
 """OAuth flow service for Gmail authentication with multi-account support."""
 
 import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+from gmail_cli.models.credentials import REFRESH_MARGIN
 from gmail_cli.services.credentials import (
     clear_all_accounts,
     delete_credentials,
@@ -26,6 +28,12 @@ SCOPES = [
     "https://www.googleapis.com/auth/gmail.modify",  # Required for marking read/unread
 ]
 
+# Access tokens expiring within this window are refreshed ahead of time
+REFRESH_SKEW = timedelta(seconds=REFRESH_MARGIN)
+
+# Legacy credentials are migrated at most once per process
+_migration_done = False
+
 
 class AccountNotFoundError(Exception):
     """Raised when a specified account is not found in the accounts list."""
@@ -128,9 +136,9 @@ def run_oauth_flow() -> tuple[Credentials, str]:
     )
 
     # Get email address for the authenticated user
-    from googleapiclient.discovery import build
+    from gmail_cli.services.gmail import build_gmail_service
 
-    service = build("gmail", "v1", credentials=credentials)
+    service = build_gmail_service(credentials)
     profile = service.users().getProfile(userId="me").execute()
     email = profile.get("emailAddress", "")
 
@@ -140,6 +148,23 @@ def run_oauth_flow() -> tuple[Credentials, str]:
     return credentials, email
 
 
+def _expires_soon(credentials: Credentials) -> bool:
+    """Check if an access token is expired or expires within REFRESH_SKEW.
+
+    Args:
+        credentials: OAuth credentials (expiry is naive UTC, as in google-auth).
+
+    Returns:
+        True if the token should be refreshed now.
+    """
+    if credentials.expired:
+        return True
+    expiry = credentials.expiry
+    if expiry is None:
+        return False
+    return expiry - datetime.now(timezone.utc).replace(tzinfo=None) < REFRESH_SKEW
+
+
 def get_credentials(account: str | None = None) -> Credentials | None:
     """Get valid credentials for an account, refreshing if necessary.
 
@@ -150,7 +175,10 @@ def get_credentials(account: str | None = None) -> Credentials | None:
         Valid credentials or None if not authenticated.
     """
     # Try migration first for backward compatibility
-    migrate_legacy_credentials()
+    global _migration_done
+    if not _migration_done:
+        migrate_legacy_credentials()
+        _migration_done = True
 
     # Resolve account if not specified
     if account is None:
@@ -164,12 +192,16 @@ def get_credentials(account: str | None = None) -> Credentials | None:
     if not credentials:
         return None
 
-    # Check if credentials need refresh
-    if credentials.expired and credentials.refresh_token:
+    # Refresh shortly before expiry so the token never lapses mid-command
+    if credentials.refresh_token and _expires_soon(credentials):
+        expired = credentials.expired
         try:
             credentials.refresh(Request())
             save_credentials(credentials, account=account)
         except Exception:
+            if not expired:
+                # Token is still valid; try again on the next call
+                return credentials
             # Refresh failed, need to re-authenticate
             delete_credentials(account=account)
             return None
@@ -263,11 +295,26 @@ def get_token_expiry(account: str | None = None) -> str | None:
         except (AccountNotFoundError, NoAccountConfiguredError):
             return None
 
-    credentials = load_credentials(account=account)
-    if not credentials or not credentials.expiry:
-        return None
+    return get_token_expiries([account])[account]
+
+
+def get_token_expiries(accounts: list[str]) -> dict[str, str | None]:
+    """Get the access token expiry times for several accounts in one pass.
 
-    return credentials.expiry.strftime("%Y-%m-%d %H:%M:%S")
+    Args:
+        accounts: Account emails to check.
+
+    Returns:
+        Mapping of account email to formatted expiry time, or None if unknown.
+    """
+    expiries: dict[str, str | None] = {}
+    for account in accounts:
+        credentials = load_credentials(account=account)
+        if not credentials or not credentials.expiry:
+            expiries[account] = None
+        else:
+            expiries[account] = credentials.expiry.isoformat(sep=" ", timespec="seconds")
+    return expiries
 
 
 def logout(account: str | None = None, all_accounts: bool = False) -> list[str]:
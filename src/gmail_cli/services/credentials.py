@@ -1,16 +1,83 @@
 """Keyring storage service for OAuth credentials with multi-account support."""
 
 import json
+import time
 from datetime import datetime
+from typing import Any
 
 import keyring
 from google.oauth2.credentials import Credentials
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 SERVICE_NAME = "gmail-cli"
 LEGACY_ACCOUNT_NAME = "oauth_credentials"  # Legacy single-account key
 ACCOUNTS_LIST_KEY = "accounts_list"
 DEFAULT_ACCOUNT_KEY = "default_account"
 
+# Recent keyring reads of the account index keys (ACCOUNTS_LIST_KEY,
+# DEFAULT_ACCOUNT_KEY) as (monotonic time, value). Writes in this module drop
+# the entry; the short TTL bounds staleness from writes by other processes.
+_KEYRING_CACHE_TTL = 2.0
+_keyring_cache: dict[str, tuple[float, str | None]] = {}
+
+# Parsed credentials per keyring key: (stored credentials JSON, credentials).
+# The stored JSON acts as the change marker, so a re-login, refresh or logout
+# (which rewrite or remove it) invalidates the entry.
+_credentials_cache: dict[str, tuple[str, Credentials]] = {}
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data to a compact JSON string, using orjson when available.
+
+    Args:
+        data: JSON-serializable value.
+
+    Returns:
+        JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _loads(data: str) -> Any:
+    """Parse a JSON string, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the latter either way.
+
+    Args:
+        data: JSON string.
+
+    Returns:
+        Parsed value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _cached_get(key: str) -> str | None:
+    """Read a keyring value, reusing a read from the last _KEYRING_CACHE_TTL seconds.
+
+    Args:
+        key: Keyring key to read.
+
+    Returns:
+        The stored value or None if not set.
+    """
+    now = time.monotonic()
+    cached = _keyring_cache.get(key)
+    if cached and now - cached[0] < _KEYRING_CACHE_TTL:
+        return cached[1]
+    value = keyring.get_password(SERVICE_NAME, key)
+    _keyring_cache[key] = (now, value)
+    return value
+
 
 def _get_account_key(email: str) -> str:
     """Get keyring key for account-specific credentials.
@@ -30,11 +97,11 @@ def list_accounts() -> list[str]:
     Returns:
         List of account email addresses.
     """
-    data = keyring.get_password(SERVICE_NAME, ACCOUNTS_LIST_KEY)
+    data = _cached_get(ACCOUNTS_LIST_KEY)
     if not data:
         return []
     try:
-        return json.loads(data)
+        return _loads(data)
     except json.JSONDecodeError:
         return []
 
@@ -45,7 +112,7 @@ def get_default_account() -> str | None:
     Returns:
         Default account email or None if not set.
     """
-    return keyring.get_password(SERVICE_NAME, DEFAULT_ACCOUNT_KEY)
+    return _cached_get(DEFAULT_ACCOUNT_KEY)
 
 
 def set_default_account(account: str) -> None:
@@ -54,19 +121,26 @@ def set_default_account(account: str) -> None:
     Args:
         account: Email address to set as default.
     """
+    _keyring_cache.pop(DEFAULT_ACCOUNT_KEY, None)
     keyring.set_password(SERVICE_NAME, DEFAULT_ACCOUNT_KEY, account)
 
 
-def _add_to_accounts_list(account: str) -> None:
+def _add_to_accounts_list(account: str) -> tuple[list[str], bool]:
     """Add an account to the accounts list if not already present.
 
     Args:
         account: Email address to add.
+
+    Returns:
+        Tuple of (updated accounts list, whether the account was added).
     """
     accounts = list_accounts()
-    if account not in accounts:
-        accounts.append(account)
-        keyring.set_password(SERVICE_NAME, ACCOUNTS_LIST_KEY, json.dumps(accounts))
+    if account in accounts:
+        return accounts, False
+    accounts.append(account)
+    _keyring_cache.pop(ACCOUNTS_LIST_KEY, None)
+    keyring.set_password(SERVICE_NAME, ACCOUNTS_LIST_KEY, _dumps(accounts))
+    return accounts, True
 
 
 def _remove_from_accounts_list(account: str) -> None:
@@ -78,7 +152,8 @@ def _remove_from_accounts_list(account: str) -> None:
     accounts = list_accounts()
     if account in accounts:
         accounts.remove(account)
-        keyring.set_password(SERVICE_NAME, ACCOUNTS_LIST_KEY, json.dumps(accounts))
+        _keyring_cache.pop(ACCOUNTS_LIST_KEY, None)
+        keyring.set_password(SERVICE_NAME, ACCOUNTS_LIST_KEY, _dumps(accounts))
 
 
 def save_credentials(credentials: Credentials, account: str | None = None) -> None:
@@ -88,27 +163,30 @@ def save_credentials(credentials: Credentials, account: str | None = None) -> No
         credentials: Google OAuth credentials to store.
         account: Account email address. If None, uses legacy single-account format.
     """
+    scopes = credentials.scopes
     creds_data = {
         "token": credentials.token,
         "refresh_token": credentials.refresh_token,
         "token_uri": credentials.token_uri,
         "client_id": credentials.client_id,
         "client_secret": credentials.client_secret,
-        "scopes": list(credentials.scopes) if credentials.scopes else [],
+        "scopes": scopes if isinstance(scopes, list) else list(scopes or ()),
         "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
     }
 
     if account:
         # Multi-account format
-        keyring.set_password(SERVICE_NAME, _get_account_key(account), json.dumps(creds_data))
-        _add_to_accounts_list(account)
+        _credentials_cache.pop(_get_account_key(account), None)
+        keyring.set_password(SERVICE_NAME, _get_account_key(account), _dumps(creds_data))
+        accounts, added = _add_to_accounts_list(account)
 
         # Set as default if first account
-        if len(list_accounts()) == 1:
+        if added and len(accounts) == 1:
             set_default_account(account)
     else:
         # Legacy single-account format (for backward compatibility)
-        keyring.set_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME, json.dumps(creds_data))
+        _credentials_cache.pop(LEGACY_ACCOUNT_NAME, None)
+        keyring.set_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME, _dumps(creds_data))
 
 
 def load_credentials(account: str | None = None) -> Credentials | None:
@@ -120,23 +198,25 @@ def load_credentials(account: str | None = None) -> Credentials | None:
     Returns:
         Credentials object if found, None otherwise.
     """
-    if account:
-        # Multi-account format
-        creds_json = keyring.get_password(SERVICE_NAME, _get_account_key(account))
-    else:
-        # Legacy single-account format
-        creds_json = keyring.get_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME)
+    # Multi-account format, or legacy single-account format
+    key = _get_account_key(account) if account else LEGACY_ACCOUNT_NAME
+    creds_json = keyring.get_password(SERVICE_NAME, key)
 
     if not creds_json:
+        _credentials_cache.pop(key, None)
         return None
 
+    cached = _credentials_cache.get(key)
+    if cached and cached[0] == creds_json:
+        return cached[1]
+
     try:
-        creds_data = json.loads(creds_json)
+        creds_data = _loads(creds_json)
         expiry = None
         if creds_data.get("expiry"):
             expiry = datetime.fromisoformat(creds_data["expiry"])
 
-        return Credentials(
+        credentials = Credentials(
             token=creds_data["token"],
             refresh_token=creds_data["refresh_token"],
             token_uri=creds_data["token_uri"],
@@ -148,6 +228,9 @@ def load_credentials(account: str | None = None) -> Credentials | None:
     except (json.JSONDecodeError, KeyError):
         return None
 
+    _credentials_cache[key] = (creds_json, credentials)
+    return credentials
+
 
 def delete_credentials(account: str | None = None) -> None:
     """Delete OAuth credentials from system keyring.
@@ -155,6 +238,7 @@ def delete_credentials(account: str | None = None) -> None:
     Args:
         account: Account email to delete. If None, deletes legacy format.
     """
+    _credentials_cache.pop(_get_account_key(account) if account else LEGACY_ACCOUNT_NAME, None)
     try:
         if account:
             # Multi-account format
@@ -168,6 +252,7 @@ def delete_credentials(account: str | None = None) -> None:
                 if accounts:
                     set_default_account(accounts[0])
                 else:
+                    _keyring_cache.pop(DEFAULT_ACCOUNT_KEY, None)
                     try:
                         keyring.delete_password(SERVICE_NAME, DEFAULT_ACCOUNT_KEY)
                     except keyring.errors.PasswordDeleteError:
@@ -204,10 +289,10 @@ def _get_email_from_credentials(credentials: Credentials) -> str | None:
     Returns:
         Email address or None if unable to determine.
     """
-    from googleapiclient.discovery import build
+    from gmail_cli.services.gmail import build_gmail_service
 
     try:
-        service = build("gmail", "v1", credentials=credentials)
+        service = build_gmail_service(credentials)
         profile = service.users().getProfile(userId="me").execute()
         return profile.get("emailAddress")
     except Exception:
@@ -228,7 +313,7 @@ def migrate_legacy_credentials() -> bool:
         return False
 
     # Check if already migrated (accounts_list exists)
-    if keyring.get_password(SERVICE_NAME, ACCOUNTS_LIST_KEY):
+    if _cached_get(ACCOUNTS_LIST_KEY):
         # Clean up legacy key if still present
         try:
             keyring.delete_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME)
@@ -280,6 +365,8 @@ def clear_all_accounts() -> None:
     Used for logout --all functionality.
     """
     accounts = list_accounts()
+    _keyring_cache.clear()
+    _credentials_cache.clear()
     for account in accounts:
         try:
             keyring.delete_password(SERVICE_NAME, _get_account_key(account))
@@ -1,30 +1,153 @@
 """Gmail API wrapper service."""
 
 import base64
+import io
 import mimetypes
+import os
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.generator import BytesGenerator
 from email.message import EmailMessage
-from email.utils import parsedate_to_datetime
+from email.utils import getaddresses, parsedate_to_datetime
 from pathlib import Path
 
 from google.auth.exceptions import RefreshError
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
 from gmail_cli.models.attachment import Attachment
 from gmail_cli.models.email import Email
 from gmail_cli.models.search import SearchResult
 from gmail_cli.services.auth import get_credentials
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 # Rate limiting settings
-MAX_RETRIES = 3
+MAX_RETRIES = 5
 BASE_DELAY = 1  # seconds
+MAX_DELAY = 32  # seconds
+RETRY_STATUSES = (429, 503)
+# Server errors that are also retried, but only for requests that are safe to
+# repeat; a send may have gone through before the error was returned
+TRANSIENT_STATUSES = (500, 502, 504)
+# Backoff delays are scaled by a random factor in this range so that
+# concurrent callers hitting the quota together do not retry in lockstep
+JITTER_RANGE = (0.5, 1.0)
+
+# Total seconds slept in retry backoff, shared by all threads
+_rate_limit_wait = 0.0
+_rate_limit_lock = threading.Lock()
+
+# Maximum number of message IDs per users.messages.batchModify request
+BATCH_MODIFY_MAX_IDS = 1000
+
+# Maximum number of sub-requests per Gmail HTTP batch request
+BATCH_MAX_REQUESTS = 100
+
+# Maximum number of concurrent single-message fetches when a batch entry failed
+MAX_FETCH_WORKERS = 8
+
+# Maximum number of batch requests in flight at once when a listing needs several
+MAX_BATCH_WORKERS = 4
+
+# Characters of base64 attachment data decoded per write (a multiple of 4)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Seconds a fetched Send-As list stays valid in list_send_as_addresses_cached
+SEND_AS_CACHE_TTL = 300
+
+# Headers fetched for email summaries (search results)
+SUMMARY_HEADERS = ["From", "To", "Subject", "Date"]
+
+# Partial-response mask for summaries: only the parts _parse_email_summary reads
+SUMMARY_FIELDS = "id,threadId,labelIds,snippet,internalDate,payload/headers"
+
+# Partial-response masks for list calls and draft metadata
+SEARCH_LIST_FIELDS = "messages/id,nextPageToken,resultSizeEstimate"
+DRAFT_LIST_FIELDS = "drafts/id"
+DRAFT_SUMMARY_FIELDS = "id,message(id,threadId,snippet,payload/headers)"
+
+# Characters that require a display name to be quoted (RFC 5322 specials)
+_NAME_SPECIALS_RE = re.compile(r'[][\\()<>@,:;".]')
+
+# Headers read from messages and drafts by the parsers below
+_SUMMARY_HEADER_NAMES = frozenset(SUMMARY_HEADERS)
+_EMAIL_HEADER_NAMES = frozenset({"From", "To", "Cc", "Subject", "Date", "Message-ID", "References"})
+_DRAFT_HEADER_NAMES = frozenset({"To", "Cc", "Subject"})
+
+
+# Gmail API services per account as (access token, service), so repeated calls
+# reuse one keep-alive HTTPS connection. httplib2 connections are not
+# thread-safe, so every thread gets its own cache.
+_service_cache = threading.local()
+
+# Send-As addresses per account as (monotonic fetch time, addresses)
+_send_as_cache: dict[str | None, tuple[float, list[dict]]] = {}
+
+# Primary signature per account, kept for the lifetime of the process
+_signature_cache: dict[str | None, str | None] = {}
+
+
+def _thread_services() -> dict[str | None, tuple[str, object]]:
+    """Return the service cache of the current thread."""
+    services = getattr(_service_cache, "services", None)
+    if services is None:
+        services = _service_cache.services = {}
+    return services
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Non-JSON bodies keep the stock handling
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def build_gmail_service(credentials):
+    """Build a Gmail API service from the discovery document bundled with the client.
+
+    Uses the static discovery document shipped with google-api-python-client and
+    skips the discovery cache lookup, so no network fetch or cache probing happens.
+    Responses are parsed with orjson when it is installed.
+
+    Args:
+        credentials: OAuth credentials for the service.
+
+    Returns:
+        Gmail API service object.
+    """
+    return build(
+        "gmail",
+        "v1",
+        credentials=credentials,
+        static_discovery=True,
+        cache_discovery=False,
+        model=_OrjsonModel() if orjson is not None else None,
+    )
 
 
 def get_gmail_service(account: str | None = None):
     """Get an authenticated Gmail API service.
 
+    The service is reused across calls in the same thread for as long as
+    the stored access token stays the same. In gmail_worker_pool threads the
+    credentials resolved by the pool's creator are used instead of the keyring.
+
     Args:
         account: Account email to use. If None, uses resolved account.
 
@@ -34,11 +157,51 @@ def get_gmail_service(account: str | None = None):
     Raises:
         Exception: If not authenticated.
     """
-    credentials = get_credentials(account=account)
+    pinned = getattr(_service_cache, "pinned", None)
+    if pinned is not None and pinned[0] == account:
+        # Worker of gmail_worker_pool: use the credentials resolved by the caller
+        credentials = pinned[1]
+    else:
+        credentials = get_credentials(account=account)
     if not credentials:
         raise Exception("Not authenticated. Run 'gmail auth login' first.")
 
-    return build("gmail", "v1", credentials=credentials)
+    services = _thread_services()
+    cached = services.get(account)
+    if cached is not None and cached[0] == credentials.token:
+        return cached[1]
+
+    service = build_gmail_service(credentials)
+    services[account] = (credentials.token, service)
+    return service
+
+
+def _pin_credentials(account: str | None, credentials) -> None:
+    """Thread initializer of gmail_worker_pool: remember the caller's credentials."""
+    _service_cache.pinned = (account, credentials)
+
+
+def gmail_worker_pool(max_workers: int, account: str | None = None) -> ThreadPoolExecutor:
+    """Create a thread pool for concurrent Gmail API calls on one account.
+
+    Credentials are loaded (and refreshed if due) once, on the calling thread.
+    Workers build their own service from them (httplib2 connections are not
+    thread-safe) and never read the keyring or refresh the token themselves,
+    as keyring backends are not documented as thread-safe.
+
+    Args:
+        max_workers: Maximum number of worker threads.
+        account: Account email the workers pass to Gmail service functions.
+
+    Returns:
+        A ThreadPoolExecutor whose workers use the caller's credentials.
+    """
+    credentials = get_credentials(account=account)
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=_pin_credentials,
+        initargs=(account, credentials),
+    )
 
 
 class TokenExpiredError(Exception):
@@ -52,12 +215,49 @@ class TokenExpiredError(Exception):
         super().__init__(msg)
 
 
-def _execute_with_retry(request, account: str | None = None):
+def _retry_delay(error: HttpError, attempt: int) -> float:
+    """Return how long to wait before retrying a rate-limited request.
+
+    A numeric Retry-After header from the server wins over the exponential
+    backoff, which is jittered by JITTER_RANGE. Either way the delay is capped
+    at MAX_DELAY.
+    """
+    retry_after = error.resp.get("retry-after")
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = random.uniform(*JITTER_RANGE) * BASE_DELAY * (2**attempt)
+    return min(max(delay, 0.0), MAX_DELAY)
+
+
+def _record_rate_limit_wait(seconds: float) -> None:
+    """Add a backoff sleep to the process-wide total."""
+    global _rate_limit_wait
+    with _rate_limit_lock:
+        _rate_limit_wait += seconds
+
+
+def get_rate_limit_wait() -> float:
+    """Get the total time spent sleeping on rate limits in this process.
+
+    Returns:
+        Seconds spent in retry backoff across all threads.
+    """
+    with _rate_limit_lock:
+        return _rate_limit_wait
+
+
+def _execute_with_retry(request, account: str | None = None, idempotent: bool = True):
     """Execute an API request with exponential backoff retry.
 
+    Requests rejected with a status in RETRY_STATUSES (rate limited or
+    temporarily unavailable) are retried up to MAX_RETRIES times. Idempotent
+    requests are also retried on TRANSIENT_STATUSES.
+
     Args:
         request: The API request to execute.
         account: Account email for error messages.
+        idempotent: Whether repeating the request after a server error is safe.
 
     Returns:
         The API response.
@@ -66,22 +266,37 @@ def _execute_with_retry(request, account: str | None = None):
         HttpError: If all retries fail.
         TokenExpiredError: If the token has expired or been revoked.
     """
-    for attempt in range(MAX_RETRIES):
+    statuses = RETRY_STATUSES + TRANSIENT_STATUSES if idempotent else RETRY_STATUSES
+    for attempt in range(MAX_RETRIES + 1):
         try:
             return request.execute()
         except RefreshError:
+            _thread_services().pop(account, None)
             raise TokenExpiredError(account)
         except HttpError as e:
-            if e.resp.status == 429:  # Rate limited
-                delay = BASE_DELAY * (2**attempt)
-                time.sleep(delay)
-            else:
+            if e.resp.status not in statuses or attempt == MAX_RETRIES:
                 raise
-    # Final attempt
+            delay = _retry_delay(e, attempt)
+            _record_rate_limit_wait(delay)
+            time.sleep(delay)
+
+
+class EmptyDateRangeError(ValueError):
+    """Error when the after/before filters of a search cannot match any email."""
+
+    def __init__(self, after: str, before: str):
+        self.after = after
+        self.before = before
+        self.message = f"--after ({after}) muss vor --before ({before}) liegen"
+        super().__init__(self.message)
+
+
+def _parse_query_date(value: str) -> datetime | None:
+    """Parse a YYYY-MM-DD (or YYYY/MM/DD) search date, None if in another format."""
     try:
-        return request.execute()
-    except RefreshError:
-        raise TokenExpiredError(account)
+        return datetime.fromisoformat(value.replace("/", "-"))
+    except ValueError:
+        return None
 
 
 def build_search_query(
@@ -108,7 +323,16 @@ def build_search_query(
 
     Returns:
         Combined Gmail search query string.
+
+    Raises:
+        EmptyDateRangeError: If after is not earlier than before, so that
+            Gmail could not return any email.
     """
+    if after and before:
+        after_date, before_date = _parse_query_date(after), _parse_query_date(before)
+        if after_date and before_date and after_date >= before_date:
+            raise EmptyDateRangeError(after, before)
+
     parts = []
 
     if query:
@@ -161,9 +385,10 @@ def search_emails(
 
     Returns:
         SearchResult with matching emails.
-    """
-    service = get_gmail_service(account=account)
 
+    Raises:
+        EmptyDateRangeError: If the date filters exclude every email.
+    """
     full_query = build_search_query(
         query=query,
         from_addr=from_addr,
@@ -175,6 +400,8 @@ def search_emails(
         has_attachment=has_attachment,
     )
 
+    service = get_gmail_service(account=account)
+
     # Get message list
     request = (
         service.users()
@@ -184,6 +411,7 @@ def search_emails(
             q=full_query,
             maxResults=limit,
             pageToken=page_token,
+            fields=SEARCH_LIST_FIELDS,
         )
     )
     response = _execute_with_retry(request, account=account)
@@ -192,12 +420,8 @@ def search_emails(
     next_page_token = response.get("nextPageToken")
     total_estimate = response.get("resultSizeEstimate", 0)
 
-    # Fetch message details for each result
-    emails = []
-    for msg in messages:
-        email = get_email_summary(msg["id"], account=account)
-        if email:
-            emails.append(email)
+    # Fetch message details for all results in batched requests
+    emails = _get_email_summaries(service, [msg["id"] for msg in messages], account=account)
 
     return SearchResult(
         emails=emails,
@@ -207,36 +431,73 @@ def search_emails(
     )
 
 
-def get_email_summary(message_id: str, account: str | None = None) -> Email | None:
-    """Get email summary (metadata only, not full body).
+def _extract_headers(payload: dict, wanted: frozenset[str]) -> dict[str, str]:
+    """Collect the wanted headers of a message payload.
+
+    Stops scanning once every wanted header was seen. If a header occurs more
+    than once, the first occurrence is used.
 
     Args:
-        message_id: Gmail message ID.
-        account: Account email to use. If None, uses resolved account.
+        payload: Message payload from the Gmail API.
+        wanted: Header names to collect (case-sensitive, as sent by Gmail).
 
     Returns:
-        Email with metadata, or None if not found.
+        Mapping of header name to value for the wanted headers present.
     """
-    service = get_gmail_service(account=account)
+    headers: dict[str, str] = {}
+    for header in payload.get("headers", ()):
+        name = header["name"]
+        if name in wanted and name not in headers:
+            headers[name] = header["value"]
+            if len(headers) == len(wanted):
+                break
+    return headers
 
-    try:
-        request = (
-            service.users()
-            .messages()
-            .get(
-                userId="me",
-                id=message_id,
-                format="metadata",
-                metadataHeaders=["From", "To", "Subject", "Date"],
-            )
+
+def _split_addresses(header: str) -> list[str]:
+    """Split an address list header into one "Name <address>" entry per recipient.
+
+    Unlike splitting on commas, this keeps quoted display names such as
+    "Doe, John" <john@example.com> intact.
+
+    Args:
+        header: Decoded To or Cc header value.
+
+    Returns:
+        Recipients in header order; display names are quoted where required.
+        A non-empty header without any parseable address (e.g. an empty
+        group like "undisclosed-recipients:;") is returned as a single entry.
+    """
+    if not header.strip():
+        return []
+    recipients = []
+    for name, address in getaddresses([header]):
+        if not address:
+            continue
+        if name and _NAME_SPECIALS_RE.search(name):
+            name = '"{}"'.format(name.replace("\\", "\\\\").replace('"', '\\"'))
+        recipients.append(f"{name} <{address}>" if name else address)
+    return recipients or [header.strip()]
+
+
+def _summary_request(service, message_id: str):
+    """Build the metadata-only messages.get request used for summaries."""
+    return (
+        service.users()
+        .messages()
+        .get(
+            userId="me",
+            id=message_id,
+            format="metadata",
+            metadataHeaders=SUMMARY_HEADERS,
+            fields=SUMMARY_FIELDS,
         )
-        msg = _execute_with_retry(request, account=account)
-    except HttpError as e:
-        if e.resp.status == 404:
-            return None
-        raise
+    )
 
-    headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
+
+def _parse_email_summary(msg: dict) -> Email:
+    """Build a summary Email from a metadata-format message resource."""
+    headers = _extract_headers(msg.get("payload", {}), _SUMMARY_HEADER_NAMES)
 
     # Parse date
     date_str = headers.get("Date", "")
@@ -260,6 +521,117 @@ def get_email_summary(message_id: str, account: str | None = None) -> Email | No
     )
 
 
+def _execute_batches(service, ids: list[str], build_request, callback, account=None) -> None:
+    """Run one request per ID in Gmail HTTP batches of up to BATCH_MAX_REQUESTS.
+
+    Sub-requests use the ID's position in ids as their request_id, so callers
+    can restore the original order. When several batches are needed they run
+    up to MAX_BATCH_WORKERS at a time in a gmail_worker_pool, each worker on its
+    own thread-local service (httplib2 connections are not thread-safe).
+
+    Args:
+        service: Gmail API service object, used when a single batch suffices.
+        ids: IDs to build sub-requests for.
+        build_request: Callable(service, id) returning the request for one ID.
+        callback: Batch callback receiving (request_id, response, exception).
+        account: Account email to use. If None, uses resolved account.
+    """
+    chunks = [
+        range(start, min(start + BATCH_MAX_REQUESTS, len(ids)))
+        for start in range(0, len(ids), BATCH_MAX_REQUESTS)
+    ]
+
+    def run_batch(indices: range, batch_service=None) -> None:
+        if batch_service is None:
+            batch_service = get_gmail_service(account=account)
+        batch = batch_service.new_batch_http_request(callback=callback)
+        for index in indices:
+            batch.add(build_request(batch_service, ids[index]), request_id=str(index))
+        _execute_with_retry(batch, account=account)
+
+    if len(chunks) <= 1:
+        for indices in chunks:
+            run_batch(indices, service)
+        return
+
+    with gmail_worker_pool(min(MAX_BATCH_WORKERS, len(chunks)), account=account) as executor:
+        # Consume the results so worker exceptions propagate
+        list(executor.map(run_batch, chunks))
+
+
+def _get_email_summaries(
+    service, message_ids: list[str], account: str | None = None
+) -> list[Email]:
+    """Fetch summaries for many messages using Gmail HTTP batch requests.
+
+    Up to BATCH_MAX_REQUESTS messages are fetched per round trip, with several
+    round trips in flight for long listings (see _execute_batches). Messages that
+    no longer exist are skipped; other per-message failures (e.g. rate limits)
+    are retried individually via get_email_summary, up to MAX_FETCH_WORKERS
+    at a time.
+
+    Args:
+        service: Gmail API service object.
+        message_ids: Gmail message IDs, in display order.
+        account: Account email to use. If None, uses resolved account.
+
+    Returns:
+        Email summaries in the order of message_ids.
+    """
+    responses: dict[str, dict] = {}
+    retry: set[str] = set()
+
+    def handle_response(request_id: str, response: dict, exception: Exception | None):
+        if exception is None:
+            responses[request_id] = response
+        elif not (isinstance(exception, HttpError) and exception.resp.status == 404):
+            retry.add(request_id)
+
+    _execute_batches(service, message_ids, _summary_request, handle_response, account=account)
+
+    retried: dict[str, Email | None] = {}
+    if retry:
+        request_ids = sorted(retry, key=int)
+        workers = min(MAX_FETCH_WORKERS, len(request_ids))
+        with gmail_worker_pool(workers, account=account) as executor:
+            summaries = executor.map(
+                lambda request_id: get_email_summary(message_ids[int(request_id)], account=account),
+                request_ids,
+            )
+            retried = dict(zip(request_ids, summaries, strict=True))
+
+    emails = []
+    for index in range(len(message_ids)):
+        request_id = str(index)
+        if request_id in responses:
+            emails.append(_parse_email_summary(responses[request_id]))
+        elif retried.get(request_id):
+            emails.append(retried[request_id])
+    return emails
+
+
+def get_email_summary(message_id: str, account: str | None = None) -> Email | None:
+    """Get email summary (metadata only, not full body).
+
+    Args:
+        message_id: Gmail message ID.
+        account: Account email to use. If None, uses resolved account.
+
+    Returns:
+        Email with metadata, or None if not found.
+    """
+    service = get_gmail_service(account=account)
+
+    try:
+        msg = _execute_with_retry(_summary_request(service, message_id), account=account)
+    except HttpError as e:
+        if e.resp.status == 404:
+            return None
+        raise
+
+    return _parse_email_summary(msg)
+
+
 def get_email(message_id: str, account: str | None = None) -> Email | None:
     """Get full email with body and attachments.
 
@@ -288,7 +660,7 @@ def get_email(message_id: str, account: str | None = None) -> Email | None:
             return None
         raise
 
-    headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
+    headers = _extract_headers(msg.get("payload", {}), _EMAIL_HEADER_NAMES)
 
     # Parse date
     date_str = headers.get("Date", "")
@@ -301,8 +673,8 @@ def get_email(message_id: str, account: str | None = None) -> Email | None:
     # Parse recipients
     to_header = headers.get("To", "")
     cc_header = headers.get("Cc", "")
-    recipients = [r.strip() for r in to_header.split(",") if r.strip()]
-    cc = [r.strip() for r in cc_header.split(",") if r.strip()]
+    recipients = _split_addresses(to_header)
+    cc = _split_addresses(cc_header)
 
     # Extract body and attachments
     body_text, body_html, attachments = _parse_message_parts(msg.get("payload", {}), message_id)
@@ -326,9 +698,21 @@ def get_email(message_id: str, account: str | None = None) -> Email | None:
     )
 
 
+def _decode_part_body(part: dict) -> str:
+    """Decode the inline base64url body data of a message part."""
+    data = part.get("body", {}).get("data", "")
+    if not data:
+        return ""
+    return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+
+
 def _parse_message_parts(payload: dict, message_id: str) -> tuple[str, str, list[Attachment]]:
     """Parse message payload to extract body and attachments.
 
+    Parts are walked depth-first in document order. The first non-empty
+    text/plain and text/html parts become the bodies; parts with a filename
+    below the root are attachments.
+
     Args:
         payload: Message payload from API.
         message_id: Message ID for attachment references.
@@ -340,58 +724,41 @@ def _parse_message_parts(payload: dict, message_id: str) -> tuple[str, str, list
     body_html = ""
     attachments = []
 
-    mime_type = payload.get("mimeType", "")
-
-    if mime_type == "text/plain":
-        data = payload.get("body", {}).get("data", "")
-        if data:
-            body_text = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-
-    elif mime_type == "text/html":
-        data = payload.get("body", {}).get("data", "")
-        if data:
-            body_html = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-
-    elif "multipart" in mime_type:
-        for part in payload.get("parts", []):
-            part_mime = part.get("mimeType", "")
-            filename = part.get("filename", "")
-
-            if filename:
-                # This is an attachment
-                attachment_id = part.get("body", {}).get("attachmentId", "")
-                size = part.get("body", {}).get("size", 0)
-                attachments.append(
-                    Attachment(
-                        id=attachment_id,
-                        message_id=message_id,
-                        filename=filename,
-                        mime_type=part_mime,
-                        size=size,
-                    )
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        mime_type = part.get("mimeType", "")
+        filename = part.get("filename", "") if part is not payload else ""
+
+        if filename:
+            # This is an attachment
+            body = part.get("body", {})
+            attachments.append(
+                Attachment(
+                    id=body.get("attachmentId", ""),
+                    message_id=message_id,
+                    filename=filename,
+                    mime_type=mime_type,
+                    size=body.get("size", 0),
                 )
-            elif part_mime == "text/plain":
-                data = part.get("body", {}).get("data", "")
-                if data:
-                    body_text = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-            elif part_mime == "text/html":
-                data = part.get("body", {}).get("data", "")
-                if data:
-                    body_html = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-            elif "multipart" in part_mime:
-                # Recursive parsing for nested multipart
-                sub_text, sub_html, sub_attachments = _parse_message_parts(part, message_id)
-                if not body_text:
-                    body_text = sub_text
-                if not body_html:
-                    body_html = sub_html
-                attachments.extend(sub_attachments)
+            )
+        elif mime_type == "text/plain":
+            if not body_text:
+                body_text = _decode_part_body(part)
+        elif mime_type == "text/html":
+            if not body_html:
+                body_html = _decode_part_body(part)
+        elif "multipart" in mime_type:
+            # Reversed so that popping visits the subparts in document order
+            stack.extend(reversed(part.get("parts", [])))
 
     return body_text, body_html, attachments
 
 
-def get_attachment(message_id: str, attachment_id: str, account: str | None = None) -> bytes | None:
-    """Get attachment data.
+def _get_attachment_data(
+    message_id: str, attachment_id: str, account: str | None = None
+) -> str | None:
+    """Fetch the base64url-encoded data of an attachment.
 
     Args:
         message_id: Gmail message ID.
@@ -399,7 +766,7 @@ def get_attachment(message_id: str, attachment_id: str, account: str | None = No
         account: Account email to use. If None, uses resolved account.
 
     Returns:
-        Attachment data as bytes, or None if not found.
+        Encoded attachment data, or None if not found.
     """
     service = get_gmail_service(account=account)
 
@@ -415,10 +782,26 @@ def get_attachment(message_id: str, attachment_id: str, account: str | None = No
             )
         )
         response = _execute_with_retry(request, account=account)
-        data = response.get("data", "")
-        return base64.urlsafe_b64decode(data)
     except HttpError:
         return None
+    return response.get("data", "")
+
+
+def get_attachment(message_id: str, attachment_id: str, account: str | None = None) -> bytes | None:
+    """Get attachment data.
+
+    Args:
+        message_id: Gmail message ID.
+        attachment_id: Attachment ID.
+        account: Account email to use. If None, uses resolved account.
+
+    Returns:
+        Attachment data as bytes, or None if not found.
+    """
+    data = _get_attachment_data(message_id, attachment_id, account=account)
+    if data is None:
+        return None
+    return base64.urlsafe_b64decode(data)
 
 
 def download_attachment(
@@ -426,6 +809,10 @@ def download_attachment(
 ) -> bool:
     """Download attachment to file.
 
+    The encoded data is decoded and written in DOWNLOAD_CHUNK_SIZE slices, so
+    the decoded file is never held in memory as a whole. The slices go to a
+    temporary file in the same directory that replaces output_path on success.
+
     Args:
         message_id: Gmail message ID.
         attachment_id: Attachment ID.
@@ -435,13 +822,25 @@ def download_attachment(
     Returns:
         True if download successful, False otherwise.
     """
-    data = get_attachment(message_id, attachment_id, account=account)
+    data = _get_attachment_data(message_id, attachment_id, account=account)
 
     if data is None:
         return False
 
-    with open(output_path, "wb") as f:
-        f.write(data)
+    # Write next to the target and move it into place only once complete, so
+    # a decoding error never leaves a truncated file (or clobbers an old one)
+    target = Path(output_path)
+    partial = target.with_name(f".{target.name}.part")
+    try:
+        with open(partial, "wb") as f:
+            for start in range(0, len(data), DOWNLOAD_CHUNK_SIZE):
+                chunk = data[start : start + DOWNLOAD_CHUNK_SIZE]
+                # Only the last slice can be short; restore any stripped padding
+                f.write(base64.urlsafe_b64decode(chunk + "=" * (-len(chunk) % 4)))
+        os.replace(partial, target)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
 
     return True
 
@@ -477,44 +876,101 @@ def list_send_as_addresses(account: str | None = None) -> list[dict]:
         return []
 
 
+def list_send_as_addresses_cached(
+    account: str | None = None, ttl: float = SEND_AS_CACHE_TTL
+) -> list[dict]:
+    """List Send-As addresses, reusing a recent result for the same account.
+
+    Args:
+        account: Account email to use. If None, uses resolved account.
+        ttl: Maximum age in seconds of a cached result.
+
+    Returns:
+        List of Send-As address dicts, as returned by list_send_as_addresses.
+    """
+    now = time.monotonic()
+    cached = _send_as_cache.get(account)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    addresses = list_send_as_addresses(account=account)
+    _send_as_cache[account] = (now, addresses)
+    return addresses
+
+
 def get_signature(account: str | None = None) -> str | None:
     """Get the user's Gmail signature.
 
+    The signature is fetched once per account and then served from memory.
+
     Args:
         account: Account email to use. If None, uses resolved account.
 
     Returns:
         The signature HTML/text, or None if not set.
     """
+    if account in _signature_cache:
+        return _signature_cache[account]
+
     service = get_gmail_service(account=account)
 
     try:
         # Get send-as settings (includes signature)
         request = service.users().settings().sendAs().list(userId="me")
         response = _execute_with_retry(request, account=account)
-
-        send_as_list = response.get("sendAs", [])
-        for send_as in send_as_list:
-            if send_as.get("isPrimary", False):
-                signature = send_as.get("signature", "")
-                return signature if signature else None
-
-        return None
     except HttpError:
         return None
 
+    signature = None
+    for send_as in response.get("sendAs", []):
+        if send_as.get("isPrimary", False):
+            signature = send_as.get("signature", "") or None
+            break
 
-def compose_email(
+    _signature_cache[account] = signature
+    return signature
+
+
+def clear_signature_cache() -> None:
+    """Forget all cached signatures."""
+    _signature_cache.clear()
+
+
+def _add_attachments(msg: EmailMessage, attachments: list[str]) -> None:
+    """Attach files to a message, skipping paths that do not exist.
+
+    Each file is read in one call and handed to the message, which keeps the
+    base64-encoded form; the raw bytes are released after each attachment.
+
+    Args:
+        msg: Message to attach the files to.
+        attachments: File paths to attach.
+    """
+    for filepath in attachments:
+        path = Path(filepath)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+
+        mime_type, _ = mimetypes.guess_type(path.name)
+        maintype, subtype = (mime_type or "application/octet-stream").split("/", 1)
+        msg.add_attachment(data, maintype=maintype, subtype=subtype, filename=path.name)
+
+
+def _build_raw_message(
     to: list[str],
     subject: str,
     body: str,
+    *,
     cc: list[str] | None = None,
     bcc: list[str] | None = None,
     attachments: list[str] | None = None,
     html_body: str | None = None,
     from_addr: str | None = None,
-) -> dict:
-    """Compose an email message.
+    in_reply_to: tuple[str, list[str]] | None = None,
+) -> str:
+    """Build a MIME message and encode it for the Gmail API.
 
     Args:
         to: List of recipient email addresses.
@@ -525,9 +981,11 @@ def compose_email(
         attachments: List of file paths to attach.
         html_body: Optional HTML version of the body.
         from_addr: Optional Send-As address to send from.
+        in_reply_to: Optional (Message-ID, previous references) of the email
+            being replied to; sets the threading headers.
 
     Returns:
-        Message dict ready for Gmail API.
+        The message as a base64url-encoded string.
     """
     msg = EmailMessage()
     msg["To"] = ", ".join(to)
@@ -540,6 +998,12 @@ def compose_email(
     if bcc:
         msg["Bcc"] = ", ".join(bcc)
 
+    # Threading headers
+    if in_reply_to:
+        message_id, references = in_reply_to
+        msg["In-Reply-To"] = message_id
+        msg["References"] = " ".join([*references, message_id])
+
     # Set plain text content
     msg.set_content(body)
 
@@ -549,28 +1013,50 @@ def compose_email(
 
     # Add attachments
     if attachments:
-        for filepath in attachments:
-            path = Path(filepath)
-            if not path.exists():
-                continue
-
-            mime_type, _ = mimetypes.guess_type(str(path))
-            if mime_type is None:
-                mime_type = "application/octet-stream"
-
-            maintype, subtype = mime_type.split("/", 1)
-
-            with open(path, "rb") as f:
-                data = f.read()
-                msg.add_attachment(
-                    data,
-                    maintype=maintype,
-                    subtype=subtype,
-                    filename=path.name,
-                )
+        _add_attachments(msg, attachments)
+
+    # Same output as msg.as_bytes(), encoded straight from the buffer to skip one copy
+    buffer = io.BytesIO()
+    BytesGenerator(buffer, mangle_from_=False, policy=msg.policy).flatten(msg)
+    with buffer.getbuffer() as view:
+        return base64.urlsafe_b64encode(view).decode("ascii")
+
+
+def compose_email(
+    to: list[str],
+    subject: str,
+    body: str,
+    cc: list[str] | None = None,
+    bcc: list[str] | None = None,
+    attachments: list[str] | None = None,
+    html_body: str | None = None,
+    from_addr: str | None = None,
+) -> dict:
+    """Compose an email message.
+
+    Args:
+        to: List of recipient email addresses.
+        subject: Email subject.
+        body: Email body text (plain text).
+        cc: List of CC recipients.
+        bcc: List of BCC recipients.
+        attachments: List of file paths to attach.
+        html_body: Optional HTML version of the body.
+        from_addr: Optional Send-As address to send from.
 
-    # Encode for Gmail API
-    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
+    Returns:
+        Message dict ready for Gmail API.
+    """
+    raw = _build_raw_message(
+        to,
+        subject,
+        body,
+        cc=cc,
+        bcc=bcc,
+        attachments=attachments,
+        html_body=html_body,
+        from_addr=from_addr,
+    )
     return {"raw": raw}
 
 
@@ -603,50 +1089,16 @@ def compose_reply(
     Returns:
         Message dict ready for Gmail API with thread info.
     """
-    msg = EmailMessage()
-    msg["To"] = ", ".join(to)
-    msg["Subject"] = subject
-
-    if from_addr:
-        msg["From"] = from_addr
-    if cc:
-        msg["Cc"] = ", ".join(cc)
-
-    # Threading headers
-    msg["In-Reply-To"] = message_id
-    all_refs = (references or []) + [message_id]
-    msg["References"] = " ".join(all_refs)
-
-    # Set plain text content
-    msg.set_content(body)
-
-    # Add HTML alternative if provided
-    if html_body:
-        msg.add_alternative(html_body, subtype="html")
-
-    # Add attachments
-    if attachments:
-        for filepath in attachments:
-            path = Path(filepath)
-            if not path.exists():
-                continue
-
-            mime_type, _ = mimetypes.guess_type(str(path))
-            if mime_type is None:
-                mime_type = "application/octet-stream"
-
-            maintype, subtype = mime_type.split("/", 1)
-
-            with open(path, "rb") as f:
-                data = f.read()
-                msg.add_attachment(
-                    data,
-                    maintype=maintype,
-                    subtype=subtype,
-                    filename=path.name,
-                )
-
-    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
+    raw = _build_raw_message(
+        to,
+        subject,
+        body,
+        cc=cc,
+        attachments=attachments,
+        html_body=html_body,
+        from_addr=from_addr,
+        in_reply_to=(message_id, references or []),
+    )
     return {"raw": raw, "threadId": thread_id}
 
 
@@ -685,7 +1137,7 @@ def send_email(message: dict, account: str | None = None) -> dict:
 
     try:
         request = service.users().messages().send(userId="me", body=message)
-        return _execute_with_retry(request, account=account)
+        return _execute_with_retry(request, account=account, idempotent=False)
     except HttpError as e:
         error_msg = str(e)
         if e.resp.status == 400:
@@ -715,7 +1167,7 @@ def create_draft(message: dict, account: str | None = None) -> dict:
     try:
         body = {"message": message}
         request = service.users().drafts().create(userId="me", body=body)
-        return _execute_with_retry(request, account=account)
+        return _execute_with_retry(request, account=account, idempotent=False)
     except HttpError as e:
         error_msg = str(e)
         if e.resp.status == 400:
@@ -727,13 +1179,23 @@ def create_draft(message: dict, account: str | None = None) -> dict:
         raise SendError(error_msg, e.resp.status) from e
 
 
+def _draft_summary_request(service, draft_id: str):
+    """Build the metadata-only drafts.get request used for draft listings."""
+    return (
+        service.users()
+        .drafts()
+        .get(userId="me", id=draft_id, format="metadata", fields=DRAFT_SUMMARY_FIELDS)
+    )
+
+
 def list_drafts(
     account: str | None = None,
     max_results: int = 20,
 ) -> list[dict]:
     """List all drafts.
 
-    Uses batch requests to fetch draft details efficiently.
+    Uses batch requests to fetch draft details efficiently. Drafts deleted
+    while listing are skipped; other per-draft failures are retried singly.
 
     Args:
         account: Account email to use. If None, uses resolved account.
@@ -744,7 +1206,9 @@ def list_drafts(
     """
     service = get_gmail_service(account=account)
 
-    request = service.users().drafts().list(userId="me", maxResults=max_results)
+    request = (
+        service.users().drafts().list(userId="me", maxResults=max_results, fields=DRAFT_LIST_FIELDS)
+    )
     response = _execute_with_retry(request, account=account)
 
     drafts = response.get("drafts", [])
@@ -752,18 +1216,52 @@ def list_drafts(
     if not drafts:
         return []
 
-    # Use batch request to fetch all draft details at once
-    result = []
-    errors = []
+    # Use batch requests to fetch all draft details with few round trips
+    responses: dict[str, dict] = {}
+    retry: set[str] = set()
+
+    def handle_response(request_id: str, response: dict, exception: Exception | None):
+        if exception is None:
+            responses[request_id] = response
+        elif not (isinstance(exception, HttpError) and exception.resp.status == 404):
+            retry.add(request_id)
 
-    def handle_response(_request_id: str, response: dict, exception: Exception | None):
-        if exception is not None:
-            errors.append(exception)
-            return
+    draft_ids = [draft["id"] for draft in drafts]
+    _execute_batches(service, draft_ids, _draft_summary_request, handle_response, account=account)
+
+    # Drafts deleted in the meantime (404) are skipped; other failures (e.g.
+    # rate limits) are fetched again singly, where errors are retried or raised
+    if retry:
+        request_ids = sorted(retry, key=int)
+
+        def refetch(request_id: str) -> dict | None:
+            request = _draft_summary_request(
+                get_gmail_service(account=account), draft_ids[int(request_id)]
+            )
+            try:
+                return _execute_with_retry(request, account=account)
+            except HttpError as e:
+                if e.resp.status == 404:
+                    return None
+                raise
+
+        workers = min(MAX_FETCH_WORKERS, len(request_ids))
+        with gmail_worker_pool(workers, account=account) as executor:
+            for request_id, response in zip(
+                request_ids, executor.map(refetch, request_ids), strict=True
+            ):
+                if response is not None:
+                    responses[request_id] = response
+
+    result = []
+    for index in range(len(draft_ids)):
+        response = responses.get(str(index))
+        if response is None:
+            continue
 
         # Parse message headers
         message = response.get("message", {})
-        headers = {h["name"]: h["value"] for h in message.get("payload", {}).get("headers", [])}
+        headers = _extract_headers(message.get("payload", {}), _DRAFT_HEADER_NAMES)
 
         result.append(
             {
@@ -777,21 +1275,6 @@ def list_drafts(
             }
         )
 
-    batch = service.new_batch_http_request(callback=handle_response)
-
-    for draft in drafts:
-        batch.add(
-            service.users()
-            .drafts()
-            .get(
-                userId="me",
-                id=draft["id"],
-                format="metadata",
-            )
-        )
-
-    batch.execute()
-
     return result
 
 
@@ -816,21 +1299,16 @@ def get_draft(
     service = get_gmail_service(account=account)
 
     try:
-        format_type = "full" if include_body else "metadata"
-        request = (
-            service.users()
-            .drafts()
-            .get(
-                userId="me",
-                id=draft_id,
-                format=format_type,
-            )
-        )
+        if include_body:
+            options = {"format": "full"}
+        else:
+            options = {"format": "metadata", "fields": DRAFT_SUMMARY_FIELDS}
+        request = service.users().drafts().get(userId="me", id=draft_id, **options)
         response = _execute_with_retry(request, account=account)
 
         # Parse message headers
         message = response.get("message", {})
-        headers = {h["name"]: h["value"] for h in message.get("payload", {}).get("headers", [])}
+        headers = _extract_headers(message.get("payload", {}), _DRAFT_HEADER_NAMES)
 
         result = {
             "id": response["id"],
@@ -886,7 +1364,7 @@ def send_draft(draft_id: str, account: str | None = None) -> dict:
                 body={"id": draft_id},
             )
         )
-        return _execute_with_retry(request, account=account)
+        return _execute_with_retry(request, account=account, idempotent=False)
     except HttpError as e:
         if e.resp.status == 404:
             raise DraftNotFoundError(draft_id) from e
@@ -973,6 +1451,80 @@ def modify_message_labels(
         raise
 
 
+def find_missing_messages(message_ids: list[str], account: str | None = None) -> set[str]:
+    """Find which of the given messages do not exist, using HTTP batch requests.
+
+    users.messages.batchModify silently ignores unknown IDs, so callers that
+    need per-message status check existence first. Each message is requested
+    with an ID-only response; only a 404 counts as missing, other per-message
+    failures are left for the follow-up call to report.
+
+    Args:
+        message_ids: Gmail message IDs.
+        account: Account email to use. If None, uses resolved account.
+
+    Returns:
+        The IDs that returned 404 Not Found.
+    """
+    service = get_gmail_service(account=account)
+    missing: set[str] = set()
+
+    def handle_response(request_id: str, _response: dict, exception: Exception | None):
+        if isinstance(exception, HttpError) and exception.resp.status == 404:
+            missing.add(message_ids[int(request_id)])
+
+    def exists_request(batch_service, message_id: str):
+        return (
+            batch_service.users()
+            .messages()
+            .get(userId="me", id=message_id, format="minimal", fields="id")
+        )
+
+    _execute_batches(service, message_ids, exists_request, handle_response, account=account)
+    return missing
+
+
+def batch_modify_message_labels(
+    message_ids: list[str],
+    add_labels: list[str] | None = None,
+    remove_labels: list[str] | None = None,
+    account: str | None = None,
+) -> dict[str, Exception]:
+    """Modify labels on many messages with users.messages.batchModify.
+
+    IDs are sent in chunks of BATCH_MODIFY_MAX_IDS, one request per chunk.
+    The API reports no per-message status: unknown IDs are silently ignored
+    (see find_missing_messages). A failing chunk does not stop the others;
+    its error is reported for each of its IDs.
+
+    Args:
+        message_ids: Gmail message IDs.
+        add_labels: Labels to add to the messages.
+        remove_labels: Labels to remove from the messages.
+        account: Account email to use. If None, uses resolved account.
+
+    Returns:
+        The error for each ID whose chunk failed; empty if all chunks applied.
+    """
+    service = get_gmail_service(account=account)
+
+    body = {}
+    if add_labels:
+        body["addLabelIds"] = add_labels
+    if remove_labels:
+        body["removeLabelIds"] = remove_labels
+
+    errors: dict[str, Exception] = {}
+    for start in range(0, len(message_ids), BATCH_MODIFY_MAX_IDS):
+        chunk = message_ids[start : start + BATCH_MODIFY_MAX_IDS]
+        request = service.users().messages().batchModify(userId="me", body={**body, "ids": chunk})
+        try:
+            _execute_with_retry(request, account=account)
+        except Exception as e:
+            errors.update(dict.fromkeys(chunk, e))
+    return errors
+
+
 def mark_as_read(message_id: str, account: str | None = None) -> dict:
     """Mark a message as read by removing UNREAD label.
 
@@ -1011,3 +1563,31 @@ def mark_as_unread(message_id: str, account: str | None = None) -> dict:
         add_labels=["UNREAD"],
         account=account,
     )
+
+
+def mark_as_read_batch(message_ids: list[str], account: str | None = None) -> dict[str, Exception]:
+    """Mark several messages as read with a single batchModify call per chunk.
+
+    Args:
+        message_ids: Gmail message IDs.
+        account: Account email to use. If None, uses resolved account.
+
+    Returns:
+        The error for each ID whose chunk failed; empty if all chunks applied.
+    """
+    return batch_modify_message_labels(message_ids, remove_labels=["UNREAD"], account=account)
+
+
+def mark_as_unread_batch(
+    message_ids: list[str], account: str | None = None
+) -> dict[str, Exception]:
+    """Mark several messages as unread with a single batchModify call per chunk.
+
+    Args:
+        message_ids: Gmail message IDs.
+        account: Account email to use. If None, uses resolved account.
+
+    Returns:
+        The error for each ID whose chunk failed; empty if all chunks applied.
+    """
+    return batch_modify_message_labels(message_ids, add_labels=["UNREAD"], account=account)
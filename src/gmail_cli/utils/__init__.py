@@ -1,6 +1,5 @@
 """Utility functions for Gmail CLI."""
 
-from gmail_cli.utils.html import html_to_text
 from gmail_cli.utils.output import (
     console,
     print_error,
@@ -17,3 +16,12 @@ __all__ = [
     "print_success",
     "print_table",
 ]
+
+
+def __getattr__(name: str):
+    # html2text is slow to import, so html_to_text is loaded on first access
+    if name == "html_to_text":
+        from gmail_cli.utils.html import html_to_text
+
+        return html_to_text
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,13 @@
 """HTML to text conversion utility."""
 
+import re
+
 import html2text
 
+# Blocks whose content never shows up in the text output; dropping them up
+# front spares html2text from tokenizing large inline stylesheets and scripts
+_INVISIBLE_BLOCK_RE = re.compile(r"<(style|script|head)\b[^>]*>.*?</\1\s*>", re.I | re.S)
+
 
 def html_to_text(html_content: str) -> str:
     """Convert HTML content to readable plain text.
@@ -17,4 +23,4 @@ def html_to_text(html_content: str) -> str:
     h.ignore_images = True
     h.ignore_emphasis = False
     h.body_width = 0  # Don't wrap lines
-    return h.handle(html_content).strip()
+    return h.handle(_INVISIBLE_BLOCK_RE.sub("", html_content)).strip()
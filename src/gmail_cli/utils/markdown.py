@@ -1,6 +1,7 @@
 """Markdown to HTML conversion utility for email body."""
 
 import re
+import threading
 
 import markdown
 
@@ -13,6 +14,69 @@ _INLINE_CODE_STYLE = (
     "background-color: #f6f8fa; padding: 0.2em 0.4em; border-radius: 3px; "
     "font-family: ui-monospace, SFMono-Regular, monospace; font-size: 85%;"
 )
+_PRE_CODE_STYLE = "font-family: inherit; font-size: inherit; background: none; padding: 0;"
+_TAG_STYLES = {
+    "table": "border-collapse: collapse; width: 100%; margin: 16px 0;",
+    "th": (
+        "border: 1px solid #ddd; padding: 8px 12px; background-color: #f6f8fa; "
+        "text-align: left; font-weight: 600;"
+    ),
+    "td": "border: 1px solid #ddd; padding: 8px 12px;",
+    "tr": "border-bottom: 1px solid #ddd;",
+    "pre": (
+        "background-color: #f6f8fa; border-radius: 6px; padding: 16px; overflow-x: auto; "
+        "font-family: ui-monospace, SFMono-Regular, 'SF Mono', Menlo, Consolas, "
+        "'Liberation Mono', monospace; font-size: 85%; line-height: 1.45;"
+    ),
+    "blockquote": (
+        "margin: 16px 0; padding: 0 16px; color: #656d76; border-left: 4px solid #d0d7de;"
+    ),
+}
+
+# Styled opening tags, rendered once rather than formatted per match
+_STYLED_OPEN_TAGS = {tag: f'<{tag} style="{style}">' for tag, style in _TAG_STYLES.items()}
+_INLINE_CODE_OPEN = f'<code style="{_INLINE_CODE_STYLE}"'
+_PRE_CODE_STYLE_ATTR = f' style="{_PRE_CODE_STYLE}">'
+
+# All tags that receive inline styles, matched in a single pass over the HTML:
+# fenced code blocks (pre + code), plain block tags, and unstyled inline code
+_STYLED_TAG_RE = re.compile(
+    r"<pre([^>]*)><code([^>]*)>"
+    r"|<(table|th|td|tr|pre|blockquote)>"
+    r"|<code(?![^>]*style=)([^>]*)>"
+)
+
+# Per-thread Markdown converter, built on first use and reset between documents
+_converter = threading.local()
+
+
+def _get_converter() -> markdown.Markdown:
+    """Get this thread's Markdown converter, configured with the GFM extensions.
+
+    Markdown instances keep per-document state and are not thread-safe, so
+    each thread builds one and resets it before every conversion.
+
+    Returns:
+        A reset Markdown instance ready for convert().
+    """
+    md = getattr(_converter, "md", None)
+    if md is None:
+        md = markdown.Markdown(
+            extensions=[
+                "markdown.extensions.tables",
+                "markdown.extensions.fenced_code",
+                "markdown.extensions.nl2br",
+                "pymdownx.tilde",  # Strikethrough ~~text~~
+                "pymdownx.tasklist",  # Task lists - [x]
+            ],
+            extension_configs={
+                "pymdownx.tasklist": {
+                    "clickable_checkbox": False,
+                },
+            },
+        )
+        _converter.md = md
+    return md.reset()
 
 
 def markdown_to_html(markdown_text: str) -> str:
@@ -41,103 +105,23 @@ def markdown_to_html(markdown_text: str) -> str:
     if not markdown_text:
         return ""
 
-    # Configure Markdown with GFM extensions
-    md = markdown.Markdown(
-        extensions=[
-            "markdown.extensions.tables",
-            "markdown.extensions.fenced_code",
-            "markdown.extensions.nl2br",
-            "pymdownx.tilde",  # Strikethrough ~~text~~
-            "pymdownx.tasklist",  # Task lists - [x]
-        ],
-        extension_configs={
-            "pymdownx.tasklist": {
-                "clickable_checkbox": False,
-            },
-        },
-    )
-
     # Convert Markdown to HTML
-    html = md.convert(markdown_text)
+    html = _get_converter().convert(markdown_text)
 
     # Post-process: Add inline CSS for email client compatibility
-    html = _add_table_styles(html)
-    html = _add_code_styles(html)
-    html = _add_blockquote_styles(html)
-
-    return html
-
-
-def _add_table_styles(html: str) -> str:
-    """Add inline CSS to tables for email client compatibility."""
-    # Style the table element
-    html = re.sub(
-        r"<table>",
-        '<table style="border-collapse: collapse; width: 100%; margin: 16px 0;">',
-        html,
-    )
-
-    # Style table headers
-    html = re.sub(
-        r"<th>",
-        '<th style="border: 1px solid #ddd; padding: 8px 12px; background-color: #f6f8fa; text-align: left; font-weight: 600;">',
-        html,
-    )
-
-    # Style table cells
-    html = re.sub(
-        r"<td>",
-        '<td style="border: 1px solid #ddd; padding: 8px 12px;">',
-        html,
-    )
-
-    # Style table rows for alternating colors
-    html = re.sub(
-        r"<tr>",
-        '<tr style="border-bottom: 1px solid #ddd;">',
-        html,
-    )
-
-    return html
-
-
-def _add_code_styles(html: str) -> str:
-    """Add inline CSS to code blocks for email client compatibility."""
-    # Style fenced code blocks (pre > code)
-    html = re.sub(
-        r"<pre>",
-        "<pre style=\"background-color: #f6f8fa; border-radius: 6px; padding: 16px; overflow-x: auto; font-family: ui-monospace, SFMono-Regular, 'SF Mono', Menlo, Consolas, 'Liberation Mono', monospace; font-size: 85%; line-height: 1.45;\">",
-        html,
-    )
-
-    # Style code elements inside pre (remove extra styling since pre handles it)
-    html = re.sub(
-        r"<pre([^>]*)><code([^>]*)>",
-        r"<pre\1><code\2 style=\"font-family: inherit; font-size: inherit; background: none; padding: 0;\">",
-        html,
-    )
-
-    # Style inline code (not inside pre)
-    # We already styled code inside pre above, so now style remaining <code> tags
-    # that don't have a style attribute yet (these are inline code)
-    html = re.sub(
-        r"<code(?![^>]*style=)([^>]*)>",
-        rf'<code style="{_INLINE_CODE_STYLE}"\1>',
-        html,
-    )
-
-    return html
-
-
-def _add_blockquote_styles(html: str) -> str:
-    """Add inline CSS to blockquotes for email client compatibility."""
-    html = re.sub(
-        r"<blockquote>",
-        '<blockquote style="margin: 16px 0; padding: 0 16px; color: #656d76; border-left: 4px solid #d0d7de;">',
-        html,
-    )
-
-    return html
+    return _STYLED_TAG_RE.sub(_style_tag, html)
+
+
+def _style_tag(match: re.Match[str]) -> str:
+    """Return the inline-styled replacement for one _STYLED_TAG_RE match."""
+    pre_attrs, pre_code_attrs, tag, code_attrs = match.groups()
+    if tag is not None:
+        return _STYLED_OPEN_TAGS[tag]
+    if code_attrs is not None:
+        return _INLINE_CODE_OPEN + code_attrs + ">"
+    # Fenced code block: pre carries the styling, code inside it is neutralized
+    pre = f"<pre{pre_attrs}>" if pre_attrs else _STYLED_OPEN_TAGS["pre"]
+    return pre + "<code" + pre_code_attrs + _PRE_CODE_STYLE_ATTR
 
 
 def wrap_html_for_email(html_body: str) -> str:
@@ -2,12 +2,21 @@
 
 import json
 import sys
-from typing import Any
+from collections.abc import Iterable, Sequence
+from dataclasses import fields, is_dataclass
+from datetime import date
+from typing import Any, NoReturn
 
+import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 # Force UTF-8 encoding on Windows to prevent UnicodeEncodeError
 # with special characters like ● ✓ ✗ ℹ 📎
 if sys.platform == "win32":
@@ -63,9 +72,60 @@ def print_info(message: str) -> None:
     console.print(f"[blue]ℹ[/blue] {message}")
 
 
+def _json_default(value: Any) -> Any:
+    """Encode values the stdlib encoder can't handle, matching orjson's output.
+
+    Dates become ISO 8601 strings and dataclass instances become objects.
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    return str(value)
+
+
+def _dump_json(data: dict[str, Any] | list[Any]) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available.
+
+    datetime values are emitted in ISO 8601 by both encoders.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, indent=2, default=_json_default, ensure_ascii=False).encode("utf-8")
+
+
 def print_json(data: dict[str, Any] | list[Any]) -> None:
-    """Print data as formatted JSON."""
-    console.print(json.dumps(data, indent=2, default=str, ensure_ascii=False))
+    """Print data as formatted JSON.
+
+    The encoded bytes are written straight to stdout, bypassing Rich markup
+    and wrapping so large payloads are emitted verbatim.
+    """
+    _write_stdout(_dump_json(data))
+
+
+def print_text(text: str) -> None:
+    """Print plain text verbatim as UTF-8, bypassing Rich and print().
+
+    Intended for large blocks such as email bodies.
+    """
+    _write_stdout(text.encode("utf-8"))
+
+
+def _write_stdout(payload: bytes) -> None:
+    """Write encoded bytes plus a newline directly to the stdout buffer."""
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        stdout.write(payload.decode("utf-8") + "\n")
+        return
+    stdout.flush()
+    buffer.write(payload)
+    buffer.write(b"\n")
+    buffer.flush()
 
 
 def print_json_error(code: str, message: str, details: str | None = None) -> None:
@@ -80,13 +140,35 @@ def print_json_error(code: str, message: str, details: str | None = None) -> Non
     print_json(error_data)
 
 
+def emit_error(code: str, message: str, details: str | None = None, exit_code: int = 1) -> NoReturn:
+    """Report an error in the active output mode and exit.
+
+    Args:
+        code: Machine-readable error code for JSON output.
+        message: Error message.
+        details: Optional additional details.
+        exit_code: Process exit code.
+
+    Raises:
+        typer.Exit: Always.
+    """
+    if _json_mode:
+        print_json_error(code, message, details)
+    else:
+        print_error(message, details=details)
+    raise typer.Exit(exit_code)
+
+
 def print_table(
     title: str | None,
     columns: list[str],
-    rows: list[list[str]],
+    rows: Iterable[Sequence[str]],
     footer: str | None = None,
 ) -> None:
-    """Print a formatted table."""
+    """Print a formatted table.
+
+    Rows may be any iterable (e.g. a generator); it is consumed once.
+    """
     if _json_mode:
         return
 
@@ -173,12 +255,8 @@ def print_search_results(result: Any) -> None:
         # Format status indicator
         status = " " if email.is_read else "[bold blue]●[/bold blue]"
 
-        # Format sender (extract name or email)
-        sender = email.sender
-        if "<" in sender:
-            # Extract name before email, fallback to email if no name
-            name_part = sender.split("<")[0].strip().strip('"')
-            sender = name_part or sender.split("<")[1].rstrip(">")
+        # Format sender (extract name, fallback to email if no name)
+        sender = email.sender_name or email.sender_email
 
         # Truncate if needed
         if len(sender) > 28:
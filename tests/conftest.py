@@ -4,11 +4,48 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+from googleapiclient.errors import HttpError
 
 from gmail_cli.models.attachment import Attachment
 from gmail_cli.models.email import Email
 
 
+@pytest.fixture(autouse=True)
+def _reset_migration_flag():
+    """Reset the once-per-process legacy migration flag between tests."""
+    from gmail_cli.services import auth
+
+    auth._migration_done = False
+    yield
+    auth._migration_done = False
+
+
+@pytest.fixture(autouse=True)
+def _reset_keyring_cache():
+    """Clear the in-process keyring read and parsed credentials caches between tests."""
+    from gmail_cli.services import credentials
+
+    credentials._keyring_cache.clear()
+    credentials._credentials_cache.clear()
+    yield
+    credentials._keyring_cache.clear()
+    credentials._credentials_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_service_cache():
+    """Clear the Gmail service, Send-As and signature caches between tests."""
+    from gmail_cli.services import gmail
+
+    gmail._thread_services().clear()
+    gmail._send_as_cache.clear()
+    gmail.clear_signature_cache()
+    yield
+    gmail._thread_services().clear()
+    gmail._send_as_cache.clear()
+    gmail.clear_signature_cache()
+
+
 @pytest.fixture
 def sample_email() -> Email:
     """Create a sample email for testing."""
@@ -120,6 +157,28 @@ def mock_gmail_service() -> MagicMock:
         "labelIds": ["SENT"],
     }
 
+    # Mock new_batch_http_request(): executes each added request and reports
+    # the result to the batch callback, like googleapiclient's BatchHttpRequest
+    def new_batch_http_request(callback=None):
+        added = []
+        mock_batch = MagicMock()
+
+        def add(request, request_id=None):
+            added.append((request_id or str(len(added) + 1), request))
+
+        def execute():
+            for request_id, request in added:
+                try:
+                    callback(request_id, request.execute(), None)
+                except HttpError as e:
+                    callback(request_id, None, e)
+
+        mock_batch.add.side_effect = add
+        mock_batch.execute.side_effect = execute
+        return mock_batch
+
+    mock_service.new_batch_http_request.side_effect = new_batch_http_request
+
     return mock_service
 
 
@@ -15,8 +15,8 @@ class TestAccountsList:
     def test_accounts_list_shows_accounts_with_default_marker(self) -> None:
         """Test that accounts list shows all accounts with default marked."""
         with (
-            patch("gmail_cli.cli.accounts.list_accounts") as mock_list,
-            patch("gmail_cli.cli.accounts.get_default_account") as mock_default,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
         ):
             mock_list.return_value = ["user@gmail.com", "work@company.com"]
             mock_default.return_value = "user@gmail.com"
@@ -31,8 +31,8 @@ class TestAccountsList:
     def test_accounts_list_no_accounts_shows_error(self) -> None:
         """Test that accounts list shows error when no accounts configured."""
         with (
-            patch("gmail_cli.cli.accounts.list_accounts") as mock_list,
-            patch("gmail_cli.cli.accounts.get_default_account") as mock_default,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
         ):
             mock_list.return_value = []
             mock_default.return_value = None
@@ -41,12 +41,13 @@ class TestAccountsList:
 
             assert result.exit_code == 1
             assert "Keine Konten konfiguriert" in result.output
+            mock_default.assert_not_called()
 
     def test_accounts_list_json_output(self) -> None:
         """Test that accounts list outputs JSON when --json flag is used."""
         with (
-            patch("gmail_cli.cli.accounts.list_accounts") as mock_list,
-            patch("gmail_cli.cli.accounts.get_default_account") as mock_default,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
         ):
             mock_list.return_value = ["user@gmail.com", "work@company.com"]
             mock_default.return_value = "user@gmail.com"
@@ -62,8 +63,8 @@ class TestAccountsList:
     def test_accounts_list_json_empty(self) -> None:
         """Test that accounts list outputs empty JSON array when no accounts."""
         with (
-            patch("gmail_cli.cli.accounts.list_accounts") as mock_list,
-            patch("gmail_cli.cli.accounts.get_default_account") as mock_default,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
         ):
             mock_list.return_value = []
             mock_default.return_value = None
@@ -76,8 +77,8 @@ class TestAccountsList:
     def test_accounts_list_single_account(self) -> None:
         """Test accounts list with single account."""
         with (
-            patch("gmail_cli.cli.accounts.list_accounts") as mock_list,
-            patch("gmail_cli.cli.accounts.get_default_account") as mock_default,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
         ):
             mock_list.return_value = ["only@gmail.com"]
             mock_default.return_value = "only@gmail.com"
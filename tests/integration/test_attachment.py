@@ -1,5 +1,6 @@
 """Integration tests for attachment CLI commands."""
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import patch
 
@@ -17,7 +18,7 @@ class TestAttachmentList:
 
     def test_attachment_list_requires_authentication(self) -> None:
         """Test that attachment list requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["attachment", "list", "msg123"])
@@ -27,8 +28,8 @@ class TestAttachmentList:
     def test_attachment_list_shows_attachments(self) -> None:
         """Test that attachment list displays attachments."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = Email(
@@ -66,8 +67,8 @@ class TestAttachmentList:
     def test_attachment_list_shows_no_attachments_message(self) -> None:
         """Test message when email has no attachments."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = Email(
@@ -88,8 +89,8 @@ class TestAttachmentList:
     def test_attachment_list_email_not_found(self) -> None:
         """Test error when email not found."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = None
@@ -102,8 +103,8 @@ class TestAttachmentList:
     def test_attachment_list_json_output(self) -> None:
         """Test attachment list with JSON output."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = Email(
@@ -137,7 +138,7 @@ class TestAttachmentDownload:
 
     def test_attachment_download_requires_authentication(self) -> None:
         """Test that attachment download requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["attachment", "download", "msg123", "document.pdf"])
@@ -147,9 +148,9 @@ class TestAttachmentDownload:
     def test_attachment_download_saves_file(self, tmp_path) -> None:
         """Test that attachment download saves file."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
-            patch("gmail_cli.cli.attachment.download_attachment") as mock_download,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
+            patch("gmail_cli.services.gmail.download_attachment") as mock_download,
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = Email(
@@ -191,8 +192,8 @@ class TestAttachmentDownload:
     def test_attachment_download_not_found(self) -> None:
         """Test error when attachment not found."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = Email(
@@ -213,8 +214,8 @@ class TestAttachmentDownload:
     def test_attachment_download_email_not_found(self) -> None:
         """Test error when email not found for download."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = None
@@ -227,8 +228,8 @@ class TestAttachmentDownload:
     def test_attachment_download_no_attachments(self) -> None:
         """Test error when email has no attachments."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = Email(
@@ -249,8 +250,8 @@ class TestAttachmentDownload:
     def test_attachment_download_specific_not_found(self) -> None:
         """Test error when specific attachment not found but others exist."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = Email(
@@ -281,9 +282,10 @@ class TestAttachmentDownload:
     def test_attachment_download_all(self) -> None:
         """Test downloading all attachments."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
-            patch("gmail_cli.cli.attachment.download_attachment") as mock_download,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
+            patch("gmail_cli.services.gmail.download_attachment") as mock_download,
+            patch("gmail_cli.services.gmail.get_credentials"),
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = Email(
@@ -321,12 +323,55 @@ class TestAttachmentDownload:
             assert result.exit_code == 0
             assert mock_download.call_count == 2
 
+    def test_attachment_download_all_keeps_order_in_json(self, tmp_path) -> None:
+        """Test that concurrent --all downloads report results in attachment order."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
+            patch("gmail_cli.services.gmail.download_attachment") as mock_download,
+            patch("gmail_cli.services.gmail.get_credentials") as mock_creds,
+        ):
+            mock_auth.return_value = True
+            mock_get_email.return_value = Email(
+                id="msg123",
+                thread_id="thread123",
+                subject="Test Email",
+                sender="sender@example.com",
+                recipients=["recipient@example.com"],
+                date=datetime(2025, 12, 1, 10, 30, 0, tzinfo=timezone.utc),
+                snippet="Test...",
+                attachments=[
+                    Attachment(
+                        id=f"att{i}",
+                        message_id="msg123",
+                        filename=f"file{i}.txt",
+                        mime_type="text/plain",
+                        size=10,
+                    )
+                    for i in range(5)
+                ],
+            )
+            mock_download.return_value = True
+
+            result = runner.invoke(
+                app,
+                ["--json", "attachment", "download", "msg123", "--all", "-o", str(tmp_path)],
+            )
+
+            assert result.exit_code == 0
+            data = json.loads(result.output)
+            assert [d["filename"] for d in data["downloaded"]] == [f"file{i}.txt" for i in range(5)]
+            assert data["downloaded"][0]["path"] == str(tmp_path / "file0.txt")
+            assert mock_download.call_count == 5
+            # Credentials are resolved once, before the download pool starts
+            mock_creds.assert_called_once()
+
     def test_attachment_download_failed(self) -> None:
         """Test error when download fails."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
-            patch("gmail_cli.cli.attachment.download_attachment") as mock_download,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
+            patch("gmail_cli.services.gmail.download_attachment") as mock_download,
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = Email(
@@ -357,9 +402,9 @@ class TestAttachmentDownload:
     def test_attachment_download_json_output(self) -> None:
         """Test download with JSON output."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.attachment.get_email") as mock_get_email,
-            patch("gmail_cli.cli.attachment.download_attachment") as mock_download,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
+            patch("gmail_cli.services.gmail.download_attachment") as mock_download,
         ):
             mock_auth.return_value = True
             mock_get_email.return_value = Email(
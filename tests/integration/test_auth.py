@@ -15,9 +15,9 @@ class TestAuthLogin:
     def test_login_opens_browser_for_oauth(self) -> None:
         """Test that login initiates OAuth flow."""
         with (
-            patch("gmail_cli.cli.auth.run_oauth_flow") as mock_oauth,
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.has_credentials") as mock_has,
+            patch("gmail_cli.services.auth.run_oauth_flow") as mock_oauth,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.has_credentials") as mock_has,
         ):
             mock_list.return_value = []
             mock_has.return_value = False
@@ -34,8 +34,8 @@ class TestAuthLogin:
     def test_login_prompts_when_already_authenticated(self) -> None:
         """Test that login prompts when already authenticated."""
         with (
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.has_credentials") as mock_has,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.has_credentials") as mock_has,
         ):
             mock_list.return_value = ["existing@gmail.com"]
             mock_has.return_value = True
@@ -52,7 +52,7 @@ class TestAuthLogout:
 
     def test_logout_deletes_credentials(self) -> None:
         """Test that logout deletes stored credentials."""
-        with patch("gmail_cli.cli.auth.logout") as mock_logout:
+        with patch("gmail_cli.services.auth.logout") as mock_logout:
             result = runner.invoke(app, ["auth", "logout"])
 
             mock_logout.assert_called_once()
@@ -60,7 +60,7 @@ class TestAuthLogout:
 
     def test_logout_succeeds_when_no_credentials(self) -> None:
         """Test that logout succeeds even without credentials."""
-        with patch("gmail_cli.cli.auth.logout") as mock_logout:
+        with patch("gmail_cli.services.auth.logout") as mock_logout:
             mock_logout.return_value = None  # No error
 
             result = runner.invoke(app, ["auth", "logout"])
@@ -74,13 +74,13 @@ class TestAuthStatus:
     def test_status_shows_authenticated_when_valid(self) -> None:
         """Test that status shows authenticated with valid credentials."""
         with (
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.get_default_account") as mock_default,
-            patch("gmail_cli.cli.auth.get_token_expiry") as mock_expiry,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
+            patch("gmail_cli.services.auth.get_token_expiries") as mock_expiry,
         ):
             mock_list.return_value = ["user@gmail.com"]
             mock_default.return_value = "user@gmail.com"
-            mock_expiry.return_value = "2025-12-01 16:30:00"
+            mock_expiry.return_value = {"user@gmail.com": "2025-12-01 16:30:00"}
 
             result = runner.invoke(app, ["auth", "status"])
 
@@ -89,7 +89,7 @@ class TestAuthStatus:
 
     def test_status_shows_not_authenticated_when_invalid(self) -> None:
         """Test that status shows not authenticated without credentials."""
-        with patch("gmail_cli.cli.auth.list_accounts") as mock_list:
+        with patch("gmail_cli.services.credentials.list_accounts") as mock_list:
             mock_list.return_value = []
 
             result = runner.invoke(app, ["auth", "status"])
@@ -99,13 +99,13 @@ class TestAuthStatus:
     def test_status_json_output(self) -> None:
         """Test that status outputs valid JSON with --json flag."""
         with (
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.get_default_account") as mock_default,
-            patch("gmail_cli.cli.auth.get_token_expiry") as mock_expiry,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
+            patch("gmail_cli.services.auth.get_token_expiries") as mock_expiry,
         ):
             mock_list.return_value = ["user@gmail.com"]
             mock_default.return_value = "user@gmail.com"
-            mock_expiry.return_value = "2025-12-01T16:30:00Z"
+            mock_expiry.return_value = {"user@gmail.com": "2025-12-01T16:30:00Z"}
 
             result = runner.invoke(app, ["--json", "auth", "status"])
 
@@ -119,9 +119,9 @@ class TestMultiAccountLogin:
     def test_first_login_sets_default(self) -> None:
         """T029: Test that first login sets account as default."""
         with (
-            patch("gmail_cli.cli.auth.run_oauth_flow") as mock_oauth,
-            patch("gmail_cli.cli.auth.has_credentials") as mock_has,
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
+            patch("gmail_cli.services.auth.run_oauth_flow") as mock_oauth,
+            patch("gmail_cli.services.credentials.has_credentials") as mock_has,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
         ):
             mock_has.return_value = False
             mock_list.return_value = []  # No accounts yet
@@ -139,10 +139,10 @@ class TestMultiAccountLogin:
     def test_second_login_adds_to_list(self) -> None:
         """T030: Test that second login adds account to list without changing default."""
         with (
-            patch("gmail_cli.cli.auth.run_oauth_flow") as mock_oauth,
-            patch("gmail_cli.cli.auth.has_credentials") as mock_has,
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.get_default_account") as mock_default,
+            patch("gmail_cli.services.auth.run_oauth_flow") as mock_oauth,
+            patch("gmail_cli.services.credentials.has_credentials") as mock_has,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
         ):
             mock_has.return_value = False
             mock_list.return_value = ["first@gmail.com"]  # One account already
@@ -160,10 +160,10 @@ class TestMultiAccountLogin:
     def test_legacy_migration_on_login(self) -> None:
         """T031: Test that legacy credentials are migrated on login check."""
         with (
-            patch("gmail_cli.cli.auth.has_credentials") as mock_has,
+            patch("gmail_cli.services.credentials.has_credentials") as mock_has,
             patch("gmail_cli.services.auth.migrate_legacy_credentials") as mock_migrate,
-            patch("gmail_cli.cli.auth.run_oauth_flow") as mock_oauth,
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
+            patch("gmail_cli.services.auth.run_oauth_flow") as mock_oauth,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
         ):
             mock_has.return_value = False
             mock_migrate.return_value = True  # Migration occurred
@@ -185,15 +185,18 @@ class TestAccountManagement:
     def test_status_lists_all_accounts(self) -> None:
         """T038: Test auth status lists all configured accounts."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.get_default_account") as mock_default,
-            patch("gmail_cli.cli.auth.get_token_expiry") as mock_expiry,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
+            patch("gmail_cli.services.auth.get_token_expiries") as mock_expiry,
         ):
             mock_auth.return_value = True
             mock_list.return_value = ["user@gmail.com", "work@company.com"]
             mock_default.return_value = "user@gmail.com"
-            mock_expiry.return_value = "2025-12-01 16:30:00"
+            mock_expiry.return_value = {
+                "user@gmail.com": "2025-12-01 16:30:00",
+                "work@company.com": "2025-12-01 17:00:00",
+            }
 
             result = runner.invoke(app, ["auth", "status"])
 
@@ -204,8 +207,8 @@ class TestAccountManagement:
     def test_set_default_changes_default(self) -> None:
         """T039: Test auth set-default changes the default account."""
         with (
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.set_default_account") as mock_set,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.set_default_account") as mock_set,
         ):
             mock_list.return_value = ["user@gmail.com", "work@company.com"]
 
@@ -217,7 +220,7 @@ class TestAccountManagement:
     def test_logout_account_removes_specific_account(self) -> None:
         """T040: Test auth logout --account removes specific account."""
         with (
-            patch("gmail_cli.cli.auth.logout") as mock_logout,
+            patch("gmail_cli.services.auth.logout") as mock_logout,
         ):
             mock_logout.return_value = ["work@company.com"]
 
@@ -229,7 +232,7 @@ class TestAccountManagement:
     def test_logout_all_removes_all_accounts(self) -> None:
         """T041: Test auth logout --all removes all accounts."""
         with (
-            patch("gmail_cli.cli.auth.logout") as mock_logout,
+            patch("gmail_cli.services.auth.logout") as mock_logout,
         ):
             mock_logout.return_value = ["user@gmail.com", "work@company.com"]
 
@@ -245,9 +248,9 @@ class TestAuthToken:
     def test_token_outputs_credentials_json(self) -> None:
         """Test that token outputs raw credentials JSON."""
         with (
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.get_default_account") as mock_default,
-            patch("gmail_cli.cli.auth.get_raw_credentials_json") as mock_get_json,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_default_account") as mock_default,
+            patch("gmail_cli.services.credentials.get_raw_credentials_json") as mock_get_json,
         ):
             mock_list.return_value = ["user@gmail.com"]
             mock_default.return_value = "user@gmail.com"
@@ -262,8 +265,8 @@ class TestAuthToken:
     def test_token_with_specific_account(self) -> None:
         """Test that token works with --account flag."""
         with (
-            patch("gmail_cli.cli.auth.list_accounts") as mock_list,
-            patch("gmail_cli.cli.auth.get_raw_credentials_json") as mock_get_json,
+            patch("gmail_cli.services.credentials.list_accounts") as mock_list,
+            patch("gmail_cli.services.credentials.get_raw_credentials_json") as mock_get_json,
         ):
             mock_list.return_value = ["user@gmail.com", "work@company.com"]
             mock_get_json.return_value = '{"token": "work_token"}'
@@ -275,7 +278,7 @@ class TestAuthToken:
 
     def test_token_fails_when_not_authenticated(self) -> None:
         """Test that token fails when no accounts configured."""
-        with patch("gmail_cli.cli.auth.list_accounts") as mock_list:
+        with patch("gmail_cli.services.credentials.list_accounts") as mock_list:
             mock_list.return_value = []
 
             result = runner.invoke(app, ["auth", "token"])
@@ -285,7 +288,7 @@ class TestAuthToken:
 
     def test_token_fails_for_unknown_account(self) -> None:
         """Test that token fails for non-existent account."""
-        with patch("gmail_cli.cli.auth.list_accounts") as mock_list:
+        with patch("gmail_cli.services.credentials.list_accounts") as mock_list:
             mock_list.return_value = ["user@gmail.com"]
 
             result = runner.invoke(app, ["auth", "token", "--account", "unknown@gmail.com"])
@@ -15,7 +15,7 @@ class TestDraftListCommand:
 
     def test_draft_list_requires_authentication(self) -> None:
         """Test that draft list requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["draft", "list"])
@@ -25,8 +25,8 @@ class TestDraftListCommand:
     def test_draft_list_shows_drafts(self) -> None:
         """Test listing drafts."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.list_drafts") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_drafts") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = [
@@ -54,8 +54,8 @@ class TestDraftListCommand:
     def test_draft_list_empty(self) -> None:
         """Test listing drafts when none exist."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.list_drafts") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_drafts") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = []
@@ -68,8 +68,8 @@ class TestDraftListCommand:
     def test_draft_list_with_limit(self) -> None:
         """Test listing drafts with limit option."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.list_drafts") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_drafts") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = []
@@ -82,8 +82,8 @@ class TestDraftListCommand:
     def test_draft_list_json_output(self) -> None:
         """Test listing drafts with JSON output."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.list_drafts") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_drafts") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = [
@@ -103,8 +103,8 @@ class TestDraftShowCommand:
     def test_draft_show_displays_details(self) -> None:
         """Test showing draft details."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.get_draft") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_draft") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = {
@@ -128,8 +128,8 @@ class TestDraftShowCommand:
     def test_draft_show_not_found(self) -> None:
         """Test showing non-existent draft."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.get_draft") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_draft") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.side_effect = DraftNotFoundError("invalid_id")
@@ -143,8 +143,8 @@ class TestDraftShowCommand:
     def test_draft_show_with_attachments(self) -> None:
         """Test showing draft with attachments."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.get_draft") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_draft") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = {
@@ -170,8 +170,8 @@ class TestDraftSendCommand:
     def test_draft_send_success(self) -> None:
         """Test sending a draft successfully."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.send_draft") as mock_send,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_draft") as mock_send,
         ):
             mock_auth.return_value = True
             mock_send.return_value = {
@@ -188,8 +188,8 @@ class TestDraftSendCommand:
     def test_draft_send_not_found(self) -> None:
         """Test sending non-existent draft."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.send_draft") as mock_send,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_draft") as mock_send,
         ):
             mock_auth.return_value = True
             mock_send.side_effect = DraftNotFoundError("invalid_id")
@@ -203,8 +203,8 @@ class TestDraftSendCommand:
     def test_draft_send_failure(self) -> None:
         """Test draft send failure."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.send_draft") as mock_send,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_draft") as mock_send,
         ):
             mock_auth.return_value = True
             mock_send.side_effect = SendError("Failed to send", 400)
@@ -220,8 +220,8 @@ class TestDraftDeleteCommand:
     def test_draft_delete_success(self) -> None:
         """Test deleting a draft successfully."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.delete_draft") as mock_delete,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.delete_draft") as mock_delete,
         ):
             mock_auth.return_value = True
             mock_delete.return_value = None
@@ -234,8 +234,8 @@ class TestDraftDeleteCommand:
     def test_draft_delete_not_found(self) -> None:
         """Test deleting non-existent draft."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.delete_draft") as mock_delete,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.delete_draft") as mock_delete,
         ):
             mock_auth.return_value = True
             mock_delete.side_effect = DraftNotFoundError("invalid_id")
@@ -253,10 +253,10 @@ class TestSendWithDraftFlag:
     def test_send_with_draft_flag_creates_draft(self) -> None:
         """Test sending with --draft flag creates a draft instead of sending."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.create_draft") as mock_create,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.create_draft") as mock_create,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None
@@ -288,11 +288,11 @@ class TestReplyWithDraftFlag:
     def test_reply_with_draft_flag_creates_draft(self) -> None:
         """Test reply with --draft flag creates a draft instead of sending."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.create_draft") as mock_create,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_email") as mock_get_email,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.create_draft") as mock_create,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_email") as mock_get_email,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None
@@ -328,8 +328,8 @@ class TestDraftMultiAccount:
     def test_draft_list_with_account_option(self) -> None:
         """Test listing drafts for specific account."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.list_drafts") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_drafts") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = []
@@ -345,8 +345,8 @@ class TestDraftMultiAccount:
     def test_draft_show_with_account_option(self) -> None:
         """Test showing draft for specific account."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.draft.get_draft") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_draft") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = {
@@ -0,0 +1,59 @@
+"""Integration tests for the root CLI application."""
+
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from gmail_cli.cli.main import LAZY_COMMANDS, app
+
+runner = CliRunner()
+
+
+class TestLazyCommands:
+    """Tests for lazily loaded commands."""
+
+    def test_help_lists_all_commands(self) -> None:
+        """Test that --help lists every lazily registered command."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in LAZY_COMMANDS:
+            assert name in result.output
+
+    def test_version_does_not_import_commands(self) -> None:
+        """Test that --version does not import any command module."""
+        code = (
+            "import sys\n"
+            "from gmail_cli.cli.main import app\n"
+            "try:\n"
+            "    app(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('gmail_cli.cli.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert "gmail-cli version" in result.stdout
+        assert result.stdout.strip().endswith("['gmail_cli.cli.main']")
+
+    @pytest.mark.parametrize("command", ["mark-read", "read", "search", "send", "reply"])
+    def test_command_help_does_not_load_services(self, command: str) -> None:
+        """Test that --help on a command imports neither the services nor html2text."""
+        code = (
+            "import sys\n"
+            "from gmail_cli.cli.main import app\n"
+            "try:\n"
+            f"    app([{command!r}, '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(any(m.startswith(('gmail_cli.services', 'html2text')) for m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().endswith("False")
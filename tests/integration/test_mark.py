@@ -1,8 +1,9 @@
 """Integration tests for mark-read/mark-unread CLI commands."""
 
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from googleapiclient.errors import HttpError
 from typer.testing import CliRunner
 
 from gmail_cli.cli.main import app
@@ -10,12 +11,19 @@ from gmail_cli.cli.main import app
 runner = CliRunner()
 
 
+def _http_error(status: int) -> HttpError:
+    """Build an HttpError with the given status code."""
+    resp = MagicMock()
+    resp.status = status
+    return HttpError(resp, b"error")
+
+
 class TestMarkReadCommand:
     """Tests for gmail mark-read command."""
 
     def test_mark_read_requires_authentication(self) -> None:
         """Test that mark-read requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["mark-read", "msg123"])
@@ -25,9 +33,9 @@ class TestMarkReadCommand:
     def test_mark_read_single_message(self) -> None:
         """Test marking a single message as read."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_read") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_read") as mock_mark,
         ):
             mock_auth.return_value = True
             mock_resolve.return_value = "user@gmail.com"
@@ -42,26 +50,28 @@ class TestMarkReadCommand:
     def test_mark_read_multiple_messages(self) -> None:
         """Test marking multiple messages as read."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_read") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_read") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_read_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
         ):
             mock_auth.return_value = True
             mock_resolve.return_value = "user@gmail.com"
-            mock_mark.return_value = {"id": "msg", "labelIds": ["INBOX"]}
 
             result = runner.invoke(app, ["mark-read", "msg1", "msg2", "msg3"])
 
             assert result.exit_code == 0
-            assert mock_mark.call_count == 3
+            mock_batch.assert_called_once_with(["msg1", "msg2", "msg3"], account="user@gmail.com")
+            mock_mark.assert_not_called()
             assert "3/3" in result.output
 
     def test_mark_read_handles_not_found(self) -> None:
         """Test that mark-read handles MessageNotFoundError."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_read") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_read") as mock_mark,
         ):
             from gmail_cli.services.gmail import MessageNotFoundError
 
@@ -77,9 +87,9 @@ class TestMarkReadCommand:
     def test_mark_read_json_output(self) -> None:
         """Test that mark-read outputs valid JSON."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_read") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_read") as mock_mark,
         ):
             mock_auth.return_value = True
             mock_resolve.return_value = "user@gmail.com"
@@ -95,9 +105,9 @@ class TestMarkReadCommand:
     def test_mark_read_with_account(self) -> None:
         """Test mark-read with account option."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_read") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_read") as mock_mark,
         ):
             mock_auth.return_value = True
             mock_resolve.return_value = "work@company.com"
@@ -114,7 +124,7 @@ class TestMarkUnreadCommand:
 
     def test_mark_unread_requires_authentication(self) -> None:
         """Test that mark-unread requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["mark-unread", "msg123"])
@@ -124,9 +134,9 @@ class TestMarkUnreadCommand:
     def test_mark_unread_single_message(self) -> None:
         """Test marking a single message as unread."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
         ):
             mock_auth.return_value = True
             mock_resolve.return_value = "user@gmail.com"
@@ -141,31 +151,37 @@ class TestMarkUnreadCommand:
     def test_mark_unread_multiple_messages(self) -> None:
         """Test marking multiple messages as unread."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
         ):
             mock_auth.return_value = True
             mock_resolve.return_value = "user@gmail.com"
-            mock_mark.return_value = {"id": "msg", "labelIds": ["UNREAD"]}
 
             result = runner.invoke(app, ["mark-unread", "msg1", "msg2"])
 
             assert result.exit_code == 0
-            assert mock_mark.call_count == 2
+            mock_batch.assert_called_once_with(["msg1", "msg2"], account="user@gmail.com")
+            mock_mark.assert_not_called()
             assert "2/2" in result.output
 
     def test_mark_unread_partial_failure(self) -> None:
-        """Test that mark-unread continues on partial failure."""
+        """Test that a failed batch falls back to per-message calls."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+            patch("gmail_cli.services.gmail.get_credentials"),
         ):
             from gmail_cli.services.gmail import MessageNotFoundError
 
             mock_auth.return_value = True
             mock_resolve.return_value = "user@gmail.com"
+            mock_batch.side_effect = _http_error(400)
             mock_mark.side_effect = [
                 {"id": "msg1", "labelIds": []},
                 MessageNotFoundError("msg2"),
@@ -175,14 +191,48 @@ class TestMarkUnreadCommand:
             result = runner.invoke(app, ["mark-unread", "msg1", "msg2", "msg3"])
 
             assert result.exit_code == 1
+            assert mock_mark.call_count == 3
             assert "2/3" in result.output
 
+    def test_mark_unread_bulk_output_keeps_message_order(self) -> None:
+        """Test that bulk text output lists every message in argument order."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+            patch("gmail_cli.services.gmail.get_credentials"),
+        ):
+            from gmail_cli.services.gmail import MessageNotFoundError
+
+            def mark(msg_id: str, **_kwargs: str) -> dict:
+                if msg_id == "msg2":
+                    raise MessageNotFoundError(msg_id)
+                return {"id": msg_id, "labelIds": ["UNREAD"]}
+
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_batch.side_effect = _http_error(400)
+            mock_mark.side_effect = mark
+
+            result = runner.invoke(app, ["mark-unread", "msg1", "msg2", "msg3"])
+
+            assert result.exit_code == 1
+            lines = result.output.splitlines()
+            assert lines[:3] == [
+                "✓ msg1 als ungelesen markiert",
+                "✗ Fehler: msg2: Nachricht nicht gefunden",
+                "✓ msg3 als ungelesen markiert",
+            ]
+            assert lines[-1] == "2/3 Nachrichten als ungelesen markiert"
+
     def test_mark_unread_json_output(self) -> None:
         """Test that mark-unread outputs valid JSON."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.mark.resolve_account") as mock_resolve,
-            patch("gmail_cli.cli.mark.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
         ):
             mock_auth.return_value = True
             mock_resolve.return_value = "user@gmail.com"
@@ -194,3 +244,182 @@ class TestMarkUnreadCommand:
             data = json.loads(result.output)
             assert data["action"] == "unread"
             assert data["success_count"] == 1
+
+    def test_mark_unread_fallback_keeps_order_in_json(self) -> None:
+        """Test that per-message fallback results keep the argument order."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+        ):
+            from gmail_cli.services.gmail import MessageNotFoundError
+
+            def mark(msg_id: str, **_kwargs: object) -> dict:
+                if msg_id == "msg2":
+                    raise MessageNotFoundError(msg_id)
+                return {"id": msg_id, "labelIds": ["UNREAD"]}
+
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_batch.side_effect = _http_error(400)
+            mock_mark.side_effect = mark
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2", "msg3"])
+
+            assert result.exit_code == 1
+            data = json.loads(result.output)
+            assert [r["id"] for r in data["results"]] == ["msg1", "msg2", "msg3"]
+            assert [r["status"] for r in data["results"]] == ["success", "error", "success"]
+            # Fallback workers reuse credentials resolved on the calling thread
+            mock_get_creds.assert_called_once_with(account="user@gmail.com")
+
+    def test_mark_unread_skips_duplicate_ids(self) -> None:
+        """Test that repeated IDs are only marked once."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2", "msg1"])
+
+            assert result.exit_code == 0
+            mock_batch.assert_called_once_with(["msg1", "msg2"], account="user@gmail.com")
+            data = json.loads(result.output)
+            assert data["total"] == 2
+            assert data["skipped_duplicates"] == 1
+            assert data["rate_limit_wait_seconds"] == 0
+
+    def test_mark_unread_reports_missing_ids_after_batch(self) -> None:
+        """Test that IDs batchModify would silently skip are reported as not found."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value={"msg2"}),
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2", "msg3"])
+
+            assert result.exit_code == 1
+            mock_batch.assert_called_once_with(["msg1", "msg3"], account="user@gmail.com")
+            mock_mark.assert_not_called()
+            data = json.loads(result.output)
+            assert data["results"][1] == {"id": "msg2", "status": "error", "error": "not_found"}
+            assert data["success_count"] == 2
+
+    def test_mark_unread_batch_server_error_is_not_retried_per_id(self) -> None:
+        """Test that a non-400/404 batch failure is reported for every ID without fan-out."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch", return_value={}) as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_batch.side_effect = _http_error(429)
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2"])
+
+            assert result.exit_code == 1
+            mock_mark.assert_not_called()
+            data = json.loads(result.output)
+            assert data["error_count"] == 2
+
+    def test_mark_unread_batch_token_expired_is_reported_per_id(self) -> None:
+        """Test that an expired token during the batch is reported for every ID."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch") as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+        ):
+            from gmail_cli.services.gmail import TokenExpiredError
+
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_batch.side_effect = TokenExpiredError("user@gmail.com")
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2"])
+
+            assert result.exit_code == 1
+            mock_mark.assert_not_called()
+            data = json.loads(result.output)
+            assert [r["id"] for r in data["results"]] == ["msg1", "msg2"]
+            assert all("expired" in r["error"] for r in data["results"])
+
+    def test_mark_unread_lookup_connection_error_is_reported_per_id(self) -> None:
+        """Test that a non-HTTP failure while looking up IDs yields per-ID results."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch") as mock_batch,
+            patch(
+                "gmail_cli.services.gmail.find_missing_messages",
+                side_effect=ConnectionError("Verbindung abgebrochen"),
+            ),
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2"])
+
+            assert result.exit_code == 1
+            mock_batch.assert_not_called()
+            mock_mark.assert_not_called()
+            data = json.loads(result.output)
+            assert data["error_count"] == 2
+            assert [r["error"] for r in data["results"]] == ["Verbindung abgebrochen"] * 2
+
+    def test_mark_unread_failed_chunk_only_fails_its_ids(self) -> None:
+        """Test that IDs in chunks that were applied are reported as marked."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch") as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_batch.return_value = {"msg3": _http_error(500)}
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2", "msg3"])
+
+            assert result.exit_code == 1
+            mock_mark.assert_not_called()
+            data = json.loads(result.output)
+            assert [r["status"] for r in data["results"]] == ["success", "success", "error"]
+
+    def test_mark_unread_bad_request_chunk_falls_back_for_its_ids_only(self) -> None:
+        """Test that only IDs of a chunk rejected as a bad request are retried singly."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.mark_as_unread") as mock_mark,
+            patch("gmail_cli.services.gmail.mark_as_unread_batch") as mock_batch,
+            patch("gmail_cli.services.gmail.find_missing_messages", return_value=set()),
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_batch.return_value = {"msg3": _http_error(400)}
+
+            result = runner.invoke(app, ["--json", "mark-unread", "msg1", "msg2", "msg3"])
+
+            assert result.exit_code == 0
+            mock_mark.assert_called_once_with("msg3", account="user@gmail.com")
+            data = json.loads(result.output)
+            assert data["success_count"] == 3
@@ -1,5 +1,6 @@
 """Integration tests for read CLI command."""
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import patch
 
@@ -15,7 +16,7 @@ class TestReadCommand:
 
     def test_read_requires_authentication(self) -> None:
         """Test that read requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["read", "msg123"])
@@ -25,8 +26,8 @@ class TestReadCommand:
     def test_read_displays_email_content(self) -> None:
         """Test that read displays email content."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.read.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             from gmail_cli.models.email import Email
 
@@ -51,8 +52,8 @@ class TestReadCommand:
     def test_read_shows_not_found_message(self) -> None:
         """Test that read shows message when email not found."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.read.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = None
@@ -64,8 +65,8 @@ class TestReadCommand:
     def test_read_json_output(self) -> None:
         """Test that read outputs valid JSON with --json flag."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.read.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             from gmail_cli.models.email import Email
 
@@ -86,12 +87,38 @@ class TestReadCommand:
             assert result.exit_code == 0
             assert "msg123" in result.output
             assert "Test Subject" in result.output
+            assert "body_html" not in result.output
+
+    def test_read_json_include_html(self) -> None:
+        """Test that --include-html adds the HTML body to JSON output."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+        ):
+            from gmail_cli.models.email import Email
+
+            mock_auth.return_value = True
+            mock_get.return_value = Email(
+                id="msg123",
+                thread_id="thread123",
+                subject="HTML Email",
+                sender="sender@example.com",
+                recipients=["recipient@example.com"],
+                date=datetime(2025, 12, 1, 10, 30, 0, tzinfo=timezone.utc),
+                snippet="Test...",
+                body_html="<p>Hello</p>",
+            )
+
+            result = runner.invoke(app, ["--json", "read", "msg123", "--include-html"])
+
+            assert result.exit_code == 0
+            assert json.loads(result.output)["body_html"] == "<p>Hello</p>"
 
     def test_read_with_html_conversion(self) -> None:
         """Test that HTML emails are converted to text."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.read.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             from gmail_cli.models.email import Email
 
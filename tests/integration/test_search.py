@@ -15,7 +15,7 @@ class TestSearchCommand:
 
     def test_search_requires_authentication(self) -> None:
         """Test that search requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["search", "test"])
@@ -25,8 +25,8 @@ class TestSearchCommand:
     def test_search_displays_results_table(self) -> None:
         """Test that search displays results in table format."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.search.search_emails") as mock_search,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.search_emails") as mock_search,
         ):
             from datetime import datetime
 
@@ -59,8 +59,8 @@ class TestSearchCommand:
     def test_search_with_filters(self) -> None:
         """Test search with filter options."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.search.search_emails") as mock_search,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.search_emails") as mock_search,
         ):
             from gmail_cli.models.search import SearchResult
 
@@ -90,8 +90,8 @@ class TestSearchCommand:
     def test_search_json_output(self) -> None:
         """Test that search outputs valid JSON with --json flag."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.search.search_emails") as mock_search,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.search_emails") as mock_search,
         ):
             from gmail_cli.models.search import SearchResult
 
@@ -108,11 +108,27 @@ class TestSearchCommand:
             assert result.exit_code == 0
             assert "emails" in result.output
 
+    def test_search_rejects_empty_date_range_without_api_call(self) -> None:
+        """Test that --after later than --before fails before any Gmail request."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_service,
+        ):
+            mock_auth.return_value = True
+
+            result = runner.invoke(
+                app, ["--json", "search", "--after", "2025-12-01", "--before", "2025-01-01"]
+            )
+
+            assert result.exit_code == 1
+            assert "INVALID_DATE_RANGE" in result.output
+            mock_service.assert_not_called()
+
     def test_search_shows_no_results_message(self) -> None:
         """Test that search shows message when no results found."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.search.search_emails") as mock_search,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.search_emails") as mock_search,
         ):
             from gmail_cli.models.search import SearchResult
 
@@ -137,8 +153,8 @@ class TestSearchWithAccount:
         import os
 
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.search.search_emails") as mock_search,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.search_emails") as mock_search,
             patch.dict(os.environ, {"GMAIL_ACCOUNT": "env@gmail.com"}),
         ):
             from gmail_cli.models.search import SearchResult
@@ -162,8 +178,8 @@ class TestSearchWithAccount:
         import os
 
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.search.search_emails") as mock_search,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.search_emails") as mock_search,
             patch.dict(os.environ, {"GMAIL_ACCOUNT": "env@gmail.com"}),
         ):
             from gmail_cli.models.search import SearchResult
@@ -1,5 +1,6 @@
 """Integration tests for send/reply CLI commands."""
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import patch
 
@@ -17,7 +18,7 @@ class TestSendCommand:
 
     def test_send_requires_authentication(self) -> None:
         """Test that send requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(
@@ -30,10 +31,10 @@ class TestSendCommand:
     def test_send_with_required_options(self) -> None:
         """Test sending email with required options."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -51,7 +52,7 @@ class TestSendCommand:
 
     def test_send_requires_recipient(self) -> None:
         """Test that send requires --to option."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = True
 
             result = runner.invoke(
@@ -65,10 +66,10 @@ class TestSendCommand:
     def test_send_shows_error_details(self) -> None:
         """Test that send shows detailed error message on failure."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -87,7 +88,7 @@ class TestSendCommand:
 
     def test_send_requires_body(self) -> None:
         """Test that send requires body content."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = True
 
             result = runner.invoke(
@@ -104,10 +105,10 @@ class TestSendCommand:
         body_file.write_text("Hello from file!")
 
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -132,9 +133,79 @@ class TestSendCommand:
             call_kwargs = mock_compose.call_args.kwargs
             assert call_kwargs["body"] == "Hello from file!"
 
+    def test_send_body_file_is_read_as_utf8(self, tmp_path) -> None:
+        """Test that body files are decoded as UTF-8 regardless of locale."""
+        body_file = tmp_path / "body.txt"
+        body_file.write_bytes("Grüße ✓".encode())
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
+            patch("gmail_cli.cli.send.locale.getpreferredencoding", return_value="ascii"),
+        ):
+            mock_auth.return_value = True
+            mock_sig.return_value = None
+            mock_compose.return_value = {"raw": "test"}
+            mock_send.return_value = {"id": "sent123", "threadId": "thread123"}
+
+            result = runner.invoke(
+                app,
+                ["send", "--to", "a@example.com", "--subject", "T", "--body-file", str(body_file)],
+            )
+
+            assert result.exit_code == 0
+            assert mock_compose.call_args.kwargs["body"] == "Grüße ✓"
+
+    def test_send_body_file_crlf_is_normalized(self, tmp_path) -> None:
+        """Test that Windows line endings in body files become plain newlines."""
+        body_file = tmp_path / "body.md"
+        body_file.write_bytes(b"Line one\r\nLine two\r\n")
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
+        ):
+            mock_auth.return_value = True
+            mock_sig.return_value = None
+            mock_compose.return_value = {"raw": "test"}
+            mock_send.return_value = {"id": "sent123", "threadId": "thread123"}
+
+            result = runner.invoke(
+                app,
+                ["send", "--to", "a@example.com", "--subject", "T", "--body-file", str(body_file)],
+            )
+
+            assert result.exit_code == 0
+            call_kwargs = mock_compose.call_args.kwargs
+            assert call_kwargs["body"] == "Line one\nLine two\n"
+            assert "\r" not in call_kwargs["html_body"]
+
+    def test_send_body_file_undecodable(self, tmp_path) -> None:
+        """Test a clean error when the body file matches neither UTF-8 nor the locale."""
+        body_file = tmp_path / "body.txt"
+        body_file.write_bytes(b"Gr\xfc\xdfe")
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.cli.send.locale.getpreferredencoding", return_value="utf-8"),
+        ):
+            mock_auth.return_value = True
+
+            result = runner.invoke(
+                app,
+                ["send", "--to", "a@example.com", "--subject", "T", "--body-file", str(body_file)],
+            )
+
+            assert result.exit_code == 1
+            assert "weder UTF-8" in result.output
+
     def test_send_body_file_not_found(self) -> None:
         """Test error when body file doesn't exist."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = True
 
             result = runner.invoke(
@@ -156,10 +227,10 @@ class TestSendCommand:
     def test_send_with_signature(self) -> None:
         """Test sending email with Gmail signature."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = "<div>My Signature</div>"
@@ -188,10 +259,10 @@ class TestSendCommand:
     def test_send_json_output(self) -> None:
         """Test send command with JSON output."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -218,10 +289,10 @@ class TestSendCommand:
     def test_send_default_includes_signature(self) -> None:
         """Test that send includes signature by default (no flag needed)."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = "<div>My Signature</div>"
@@ -250,10 +321,10 @@ class TestSendCommand:
     def test_send_no_signature_excludes_signature(self) -> None:
         """Test that --no-signature flag excludes signature."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = "<div>My Signature</div>"
@@ -283,10 +354,10 @@ class TestSendCommand:
     def test_send_no_signature_when_none_configured(self) -> None:
         """Test that send works gracefully when no signature is configured."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -314,10 +385,10 @@ class TestSendCommand:
     def test_send_with_sig_shorthand(self) -> None:
         """Test that --sig shorthand works (backwards compatibility)."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = "<div>My Signature</div>"
@@ -350,7 +421,7 @@ class TestReplyCommand:
 
     def test_reply_requires_authentication(self) -> None:
         """Test that reply requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(
@@ -363,11 +434,11 @@ class TestReplyCommand:
     def test_reply_to_email(self) -> None:
         """Test replying to an email."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -392,11 +463,43 @@ class TestReplyCommand:
 
             assert result.exit_code == 0
 
+    def test_reply_extracts_sender_and_keeps_existing_prefix(self) -> None:
+        """Test that the reply goes to the bare sender address without a doubled prefix."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
+        ):
+            mock_auth.return_value = True
+            mock_sig.return_value = None
+            mock_get.return_value = Email(
+                id="msg123",
+                thread_id="thread123",
+                subject="RE: Original Subject",
+                sender='"Max Mustermann" <max@example.com>',
+                recipients=["me@example.com"],
+                date=datetime(2025, 12, 1, 10, 30, 0, tzinfo=timezone.utc),
+                snippet="Test...",
+                message_id="<original@gmail.com>",
+                references=[],
+            )
+            mock_compose.return_value = {"raw": "test", "threadId": "thread123"}
+            mock_send.return_value = {"id": "reply123", "threadId": "thread123"}
+
+            result = runner.invoke(app, ["reply", "msg123", "--body", "Thanks!"])
+
+            assert result.exit_code == 0
+            call_kwargs = mock_compose.call_args[1]
+            assert call_kwargs["to"] == ["max@example.com"]
+            assert call_kwargs["subject"] == "RE: Original Subject"
+
     def test_reply_email_not_found(self) -> None:
         """Test error when replying to non-existent email."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
         ):
             mock_auth.return_value = True
             mock_get.return_value = None
@@ -411,11 +514,11 @@ class TestReplyCommand:
     def test_reply_with_cc(self) -> None:
         """Test replying to an email with CC recipients."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -447,11 +550,11 @@ class TestReplyCommand:
     def test_reply_with_multiple_cc(self) -> None:
         """Test replying with multiple CC recipients."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -491,11 +594,11 @@ class TestReplyCommand:
     def test_reply_all_with_cc_merges_recipients(self) -> None:
         """Test that reply all merges user CC with original CC."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -533,14 +636,50 @@ class TestReplyCommand:
             assert "new-cc@example.com" in call_kwargs["cc"]
             assert "original-cc@example.com" in call_kwargs["cc"]
 
+    def test_reply_all_drops_duplicate_addresses(self) -> None:
+        """Test that reply all lists each address once, keeping first-seen order."""
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
+        ):
+            mock_auth.return_value = True
+            mock_sig.return_value = None
+            mock_get.return_value = Email(
+                id="msg123",
+                thread_id="thread123",
+                subject="Original Subject",
+                sender="sender@example.com",
+                recipients=["me@example.com", "sender@example.com", "cc@example.com"],
+                cc=["cc@example.com", "cc@example.com"],
+                date=datetime(2025, 12, 1, 10, 30, 0, tzinfo=timezone.utc),
+                snippet="Test...",
+                message_id="<original@gmail.com>",
+                references=[],
+            )
+            mock_compose.return_value = {"raw": "test", "threadId": "thread123"}
+            mock_send.return_value = {"id": "reply123", "threadId": "thread123"}
+
+            result = runner.invoke(
+                app,
+                ["reply", "msg123", "--body", "Thanks!", "--all", "--cc", "cc@example.com"],
+            )
+
+            assert result.exit_code == 0
+            call_kwargs = mock_compose.call_args.kwargs
+            assert call_kwargs["to"] == ["sender@example.com", "cc@example.com", "me@example.com"]
+            assert call_kwargs["cc"] == ["cc@example.com"]
+
     def test_reply_default_includes_signature(self) -> None:
         """Test that reply includes signature by default (no flag needed)."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = "<div>My Signature</div>"
@@ -572,11 +711,11 @@ class TestReplyCommand:
     def test_reply_no_signature_excludes_signature(self) -> None:
         """Test that reply --no-signature excludes signature."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = "<div>My Signature</div>"
@@ -611,7 +750,7 @@ class TestSendAsCommand:
 
     def test_sendas_requires_authentication(self) -> None:
         """Test that sendas requires authentication."""
-        with patch("gmail_cli.cli.auth.is_authenticated") as mock_auth:
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
             mock_auth.return_value = False
 
             result = runner.invoke(app, ["sendas"])
@@ -621,8 +760,8 @@ class TestSendAsCommand:
     def test_sendas_lists_addresses(self) -> None:
         """Test listing Send-As addresses."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.list_send_as_addresses") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_send_as_addresses_cached") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = [
@@ -650,8 +789,8 @@ class TestSendAsCommand:
     def test_sendas_empty_list(self) -> None:
         """Test handling empty Send-As list."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.list_send_as_addresses") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_send_as_addresses_cached") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = []
@@ -664,8 +803,8 @@ class TestSendAsCommand:
     def test_sendas_json_output(self) -> None:
         """Test JSON output for sendas command."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.list_send_as_addresses") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_send_as_addresses_cached") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = [
@@ -690,11 +829,11 @@ class TestSendWithFromOption:
     def test_send_with_valid_from_address(self) -> None:
         """Test sending with valid --from address."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.list_send_as_addresses") as mock_list,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_send_as_addresses_cached") as mock_list,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_list.return_value = [
@@ -727,8 +866,8 @@ class TestSendWithFromOption:
     def test_send_with_invalid_from_address(self) -> None:
         """Test sending with invalid --from address fails."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.list_send_as_addresses") as mock_list,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_send_as_addresses_cached") as mock_list,
         ):
             mock_auth.return_value = True
             mock_list.return_value = [
@@ -757,11 +896,11 @@ class TestSendWithFromOption:
     def test_send_from_address_case_insensitive(self) -> None:
         """Test that --from address validation is case insensitive."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.list_send_as_addresses") as mock_list,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.list_send_as_addresses_cached") as mock_list,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_list.return_value = [
@@ -787,3 +926,174 @@ class TestSendWithFromOption:
             )
 
             assert result.exit_code == 0
+
+
+class TestSendBatchCommand:
+    """Tests for gmail send-batch command."""
+
+    def test_send_batch_sends_each_record_with_one_setup(self, tmp_path) -> None:
+        """Test that all records are sent while signature and account load once."""
+        batch_file = tmp_path / "sends.jsonl"
+        batch_file.write_text(
+            '{"to": "a@example.com", "subject": "One", "body": "Hi A"}\n'
+            "\n"
+            '{"to": ["b@example.com"], "subject": "Two", "body": "Hi B", "plain": true}\n'
+        )
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_sig.return_value = "<b>Sig</b>"
+            mock_compose.return_value = {"raw": "test"}
+            mock_send.return_value = {"id": "sent123", "threadId": "thread123"}
+
+            result = runner.invoke(app, ["send-batch", str(batch_file)])
+
+            assert result.exit_code == 0
+            assert "2/2" in result.output
+            mock_resolve.assert_called_once()
+            mock_sig.assert_called_once_with(account="user@gmail.com")
+            assert mock_send.call_count == 2
+            first, second = (c.kwargs for c in mock_compose.call_args_list)
+            assert first["to"] == ["a@example.com"]
+            assert "Hi A" in first["html_body"]
+            assert first["html_body"].endswith("<b>Sig</b>")
+            assert first["body"].endswith("--\n**Sig**")
+            assert second["to"] == ["b@example.com"]
+            assert second["html_body"].startswith("<div>Hi B")
+
+    def test_send_batch_reports_invalid_lines_and_continues(self, tmp_path) -> None:
+        """Test that bad records are reported in JSON and the rest is still sent."""
+        batch_file = tmp_path / "sends.jsonl"
+        batch_file.write_text(
+            '{"to": "a@example.com", "subject": "One"}\n'
+            "not json\n"
+            '{"to": "b@example.com", "subject": "Two", "body": "Hi", "from": "x@example.com"}\n'
+            '{"to": "c@example.com", "subject": "Three", "body": "Hi"}\n'
+        )
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.list_send_as_addresses_cached") as mock_list,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_list.return_value = [{"email": "user@gmail.com"}]
+            mock_compose.return_value = {"raw": "test"}
+            mock_send.return_value = {"id": "sent123", "threadId": "thread123"}
+
+            result = runner.invoke(app, ["--json", "send-batch", str(batch_file), "--no-signature"])
+
+            assert result.exit_code == 1
+            data = json.loads(result.output)
+            assert data["sent_count"] == 1
+            assert data["error_count"] == 3
+            assert [r["status"] for r in data["results"]] == ["error", "error", "error", "sent"]
+            assert "body" in data["results"][0]["error"]
+            assert data["results"][3]["line"] == 4
+            mock_send.assert_called_once()
+
+    def test_send_batch_rejects_wrongly_typed_fields(self, tmp_path) -> None:
+        """Test that records with wrongly typed fields fail per line instead of aborting."""
+        batch_file = tmp_path / "sends.jsonl"
+        batch_file.write_text(
+            '{"to": 42, "subject": "One", "body": "Hi"}\n'
+            '{"to": "a@example.com", "subject": "Two", "body": ["Hi"]}\n'
+            '{"to": "a@example.com", "subject": "Three", "body": "Hi", "cc": {"x": 1}}\n'
+            '{"to": "a@example.com", "subject": "Four", "body": "Hi", "attach": [1]}\n'
+            '{"to": "c@example.com", "subject": "Five", "body": "Hi"}\n'
+        )
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_compose.return_value = {"raw": "test"}
+            mock_send.return_value = {"id": "sent123", "threadId": "thread123"}
+
+            result = runner.invoke(app, ["--json", "send-batch", str(batch_file), "--no-signature"])
+
+            assert result.exit_code == 1
+            data = json.loads(result.output)
+            assert [r["status"] for r in data["results"]] == ["error"] * 4 + ["sent"]
+            assert "'to'" in data["results"][0]["error"]
+            assert "'body'" in data["results"][1]["error"]
+            mock_send.assert_called_once()
+
+    def test_send_batch_keeps_going_after_unexpected_send_failure(self, tmp_path) -> None:
+        """Test that a non-SendError mid-batch is recorded and the summary still printed."""
+        batch_file = tmp_path / "sends.jsonl"
+        batch_file.write_text(
+            '{"to": "a@example.com", "subject": "One", "body": "Hi"}\n'
+            '{"to": "b@example.com", "subject": "Two", "body": "Hi"}\n'
+            '{"to": "c@example.com", "subject": "Three", "body": "Hi"}\n'
+        )
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+        ):
+            mock_auth.return_value = True
+            mock_resolve.return_value = "user@gmail.com"
+            mock_compose.return_value = {"raw": "test"}
+            mock_send.side_effect = [
+                {"id": "sent1", "threadId": "thread1"},
+                ConnectionResetError("Verbindung zurückgesetzt"),
+                {"id": "sent3", "threadId": "thread3"},
+            ]
+
+            result = runner.invoke(app, ["--json", "send-batch", str(batch_file), "--no-signature"])
+
+            assert result.exit_code == 1
+            data = json.loads(result.output)
+            assert [r["status"] for r in data["results"]] == ["sent", "error", "sent"]
+            assert data["results"][1]["error"] == "Verbindung zurückgesetzt"
+            assert data["results"][2]["message_id"] == "sent3"
+            assert data["sent_count"] == 2
+
+    def test_send_batch_unknown_account(self, tmp_path) -> None:
+        """Test that an unknown --account is reported as an error, not a traceback."""
+        batch_file = tmp_path / "sends.jsonl"
+        batch_file.write_text('{"to": "a@example.com", "subject": "One", "body": "Hi"}\n')
+
+        with (
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.auth.resolve_account") as mock_resolve,
+        ):
+            from gmail_cli.services.auth import AccountNotFoundError
+
+            mock_auth.return_value = True
+            mock_resolve.side_effect = AccountNotFoundError("x@example.com", ["user@gmail.com"])
+
+            result = runner.invoke(
+                app, ["--json", "send-batch", str(batch_file), "--account", "x@example.com"]
+            )
+
+            assert result.exit_code == 1
+            data = json.loads(result.output)
+            assert data["code"] == "ACCOUNT_NOT_FOUND"
+
+    def test_send_batch_file_not_found(self) -> None:
+        """Test error when the batch file doesn't exist."""
+        with patch("gmail_cli.services.auth.is_authenticated") as mock_auth:
+            mock_auth.return_value = True
+
+            result = runner.invoke(app, ["send-batch", "/nonexistent/sends.jsonl"])
+
+            assert result.exit_code == 1
+            assert "Datei nicht gefunden" in result.output
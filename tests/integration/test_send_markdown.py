@@ -17,10 +17,10 @@ class TestSendWithMarkdown:
     def test_send_with_bold_converts_to_html(self) -> None:
         """Markdown bold text is converted to HTML strong tags."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -54,10 +54,10 @@ class TestSendWithMarkdown:
 | Cell 1   | Cell 2   |"""
 
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -91,10 +91,10 @@ def hello():
 ```"""
 
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -124,10 +124,10 @@ def hello():
     def test_send_plain_no_html_conversion(self) -> None:
         """With --plain flag and --no-signature, no HTML is generated."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -158,10 +158,10 @@ def hello():
     def test_send_with_signature_combines_html(self) -> None:
         """Markdown body + HTML signature are properly combined."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_compose.return_value = {"raw": "test"}
@@ -216,11 +216,11 @@ class TestReplyWithMarkdown:
     def test_reply_with_markdown_converts_to_html(self) -> None:
         """Reply with Markdown body is converted to HTML."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -248,11 +248,11 @@ class TestReplyWithMarkdown:
     def test_reply_with_signature_combines_markdown_and_sig(self) -> None:
         """Reply with Markdown and --signature combines both properly."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_get.return_value = self._create_mock_email()
@@ -281,11 +281,11 @@ class TestReplyWithMarkdown:
     def test_reply_plain_no_html_conversion(self) -> None:
         """Reply with --plain and --no-signature does NOT generate HTML."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_reply") as mock_compose,
-            patch("gmail_cli.cli.send.get_email") as mock_get,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_reply") as mock_compose,
+            patch("gmail_cli.services.gmail.get_email") as mock_get,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_sig.return_value = None  # No signature configured
@@ -318,10 +318,10 @@ class TestPlainTextMode:
     def test_plain_with_signature_uses_html_for_signature(self) -> None:
         """With --plain and --signature, signature is still HTML."""
         with (
-            patch("gmail_cli.cli.auth.is_authenticated") as mock_auth,
-            patch("gmail_cli.cli.send.send_email") as mock_send,
-            patch("gmail_cli.cli.send.compose_email") as mock_compose,
-            patch("gmail_cli.cli.send.get_signature") as mock_sig,
+            patch("gmail_cli.services.auth.is_authenticated") as mock_auth,
+            patch("gmail_cli.services.gmail.send_email") as mock_send,
+            patch("gmail_cli.services.gmail.compose_email") as mock_compose,
+            patch("gmail_cli.services.gmail.get_signature") as mock_sig,
         ):
             mock_auth.return_value = True
             mock_compose.return_value = {"raw": "test"}
@@ -350,3 +350,50 @@ class TestPlainTextMode:
             # Even in plain mode, signature requires HTML
             assert call_kwargs.get("html_body") is not None
             assert "signature" in call_kwargs["html_body"].lower()
+
+
+class TestRenderCaches:
+    """Tests for the cached Markdown and signature rendering helpers."""
+
+    def test_repeated_body_is_rendered_once(self) -> None:
+        """The same body is converted only once per process."""
+        from gmail_cli.cli.send import _render_markdown
+
+        _render_markdown.cache_clear()
+        with patch("gmail_cli.utils.markdown.markdown_to_html", return_value="<p>x</p>") as mock_md:
+            first = _render_markdown("**cached**")
+            second = _render_markdown("**cached**")
+
+        assert first == second
+        assert "<p>x</p>" in first
+        mock_md.assert_called_once_with("**cached**")
+        _render_markdown.cache_clear()
+
+    def test_large_body_is_not_cached(self) -> None:
+        """Bodies above MAX_CACHED_MARKDOWN are rendered every time and never cached."""
+        from gmail_cli.cli.send import _markdown_body_html, _render_markdown
+
+        _render_markdown.cache_clear()
+        with (
+            patch("gmail_cli.cli.send.MAX_CACHED_MARKDOWN", 5),
+            patch("gmail_cli.utils.markdown.markdown_to_html", return_value="<p>x</p>") as mock_md,
+        ):
+            _markdown_body_html("**large**")
+            _markdown_body_html("**large**")
+
+        assert mock_md.call_count == 2
+        assert _render_markdown.cache_info().currsize == 0
+
+    def test_signature_text_is_converted_once(self) -> None:
+        """The same signature is converted to plain text only once."""
+        from gmail_cli.cli.send import _append_signature, _signature_text
+
+        _signature_text.cache_clear()
+        with patch("gmail_cli.utils.html.html_to_text", return_value="Max") as mock_text:
+            first = _append_signature("Hi", None, "<b>Max</b>")
+            second = _append_signature("Hi", "<p>Hi</p>", "<b>Max</b>")
+
+        mock_text.assert_called_once_with("<b>Max</b>")
+        assert first[0] == second[0] == "Hi\n\n--\nMax"
+        assert second[1] == "<p>Hi</p><br><div>--</div><b>Max</b>"
+        _signature_text.cache_clear()
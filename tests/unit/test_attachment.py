@@ -45,9 +45,9 @@ class TestAttachmentDownload:
     def test_download_attachment_writes_file(self, tmp_path) -> None:
         """Test downloading attachment to file."""
         with (
-            patch("gmail_cli.services.gmail.get_attachment") as mock_get,
+            patch("gmail_cli.services.gmail._get_attachment_data") as mock_get,
         ):
-            mock_get.return_value = b"File content here"
+            mock_get.return_value = "RmlsZSBjb250ZW50IGhlcmU="  # "File content here"
 
             from gmail_cli.services.gmail import download_attachment
 
@@ -60,7 +60,7 @@ class TestAttachmentDownload:
 
     def test_download_attachment_returns_false_on_error(self, tmp_path) -> None:
         """Test that download returns False when attachment not found."""
-        with patch("gmail_cli.services.gmail.get_attachment") as mock_get:
+        with patch("gmail_cli.services.gmail._get_attachment_data") as mock_get:
             mock_get.return_value = None
 
             from gmail_cli.services.gmail import download_attachment
@@ -70,3 +70,79 @@ class TestAttachmentDownload:
 
             assert result is False
             assert not output_path.exists()
+
+    def test_download_attachment_decodes_in_chunks(self, tmp_path) -> None:
+        """Test that chunked decoding reproduces the file, also without padding."""
+        import base64
+        import os
+
+        content = os.urandom(1001)
+        encoded = base64.urlsafe_b64encode(content).decode().rstrip("=")
+
+        with (
+            patch("gmail_cli.services.gmail._get_attachment_data", return_value=encoded),
+            patch("gmail_cli.services.gmail.DOWNLOAD_CHUNK_SIZE", 8),
+        ):
+            from gmail_cli.services.gmail import download_attachment
+
+            output_path = tmp_path / "blob.bin"
+            assert download_attachment("msg123", "att456", str(output_path)) is True
+
+            assert output_path.read_bytes() == content
+
+    def test_download_attachment_leaves_no_partial_file_on_bad_data(self, tmp_path) -> None:
+        """Test that a decoding error keeps the existing file and removes the temp file."""
+        import binascii
+
+        import pytest
+
+        # The first slice decodes fine, the second has an impossible length
+        encoded = "RmlsZSBj" + "Q"
+
+        output_path = tmp_path / "test.pdf"
+        output_path.write_bytes(b"old content")
+
+        with (
+            patch("gmail_cli.services.gmail._get_attachment_data", return_value=encoded),
+            patch("gmail_cli.services.gmail.DOWNLOAD_CHUNK_SIZE", 8),
+        ):
+            from gmail_cli.services.gmail import download_attachment
+
+            with pytest.raises(binascii.Error):
+                download_attachment("msg123", "att456", str(output_path))
+
+        assert output_path.read_bytes() == b"old content"
+        assert [p.name for p in tmp_path.iterdir()] == ["test.pdf"]
+
+
+class TestAttachmentModel:
+    """Tests for the Attachment dataclass."""
+
+    def test_attachment_is_immutable_and_hashable(self, sample_attachment) -> None:
+        """Test that attachments are frozen and usable in sets."""
+        import dataclasses
+
+        import pytest
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_attachment.filename = "other.pdf"
+
+        copy = dataclasses.replace(sample_attachment)
+        assert {sample_attachment, copy} == {sample_attachment}
+        assert not hasattr(sample_attachment, "__dict__")
+
+    def test_size_human_units(self, sample_attachment) -> None:
+        """Test that sizes pick the largest unit not exceeding them."""
+        import dataclasses
+
+        expected = {
+            0: "0 B",
+            1023: "1023 B",
+            1024: "1.0 KB",
+            128307: "125.3 KB",
+            1024**2 - 1: "1024.0 KB",
+            1024**2: "1.0 MB",
+            5 * 1024**3: "5.0 GB",
+        }
+        for size, text in expected.items():
+            assert dataclasses.replace(sample_attachment, size=size).size_human == text
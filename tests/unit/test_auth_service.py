@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 from gmail_cli.services.auth import (
     get_credentials,
+    get_token_expiries,
     get_token_expiry,
     get_user_email,
     is_authenticated,
@@ -92,6 +93,86 @@ class TestAuthService:
 
             assert get_credentials() is None
 
+    def test_get_credentials_migrates_legacy_credentials_once(self) -> None:
+        """Test that the legacy migration check runs only on the first call."""
+        with (
+            patch("gmail_cli.services.auth.migrate_legacy_credentials") as mock_migrate,
+            patch("gmail_cli.services.auth.load_credentials") as mock_load,
+        ):
+            mock_migrate.return_value = False
+            mock_load.return_value = None
+
+            get_credentials(account="user@gmail.com")
+            get_credentials(account="user@gmail.com")
+
+            mock_migrate.assert_called_once()
+
+    def test_get_credentials_refreshes_token_close_to_expiry(self) -> None:
+        """Test that a token expiring within the refresh window is refreshed early."""
+        from datetime import datetime, timedelta, timezone
+
+        from google.oauth2.credentials import Credentials
+
+        creds = Credentials(
+            token="t",
+            refresh_token="r",
+            expiry=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=4),
+        )
+        with (
+            patch("gmail_cli.services.auth.migrate_legacy_credentials"),
+            patch("gmail_cli.services.auth.load_credentials", return_value=creds),
+            patch("gmail_cli.services.auth.save_credentials") as mock_save,
+            patch("gmail_cli.services.auth.Request"),
+            patch.object(Credentials, "refresh") as mock_refresh,
+        ):
+            assert get_credentials(account="user@gmail.com") is creds
+
+            mock_refresh.assert_called_once()
+            mock_save.assert_called_once_with(creds, account="user@gmail.com")
+
+    def test_get_credentials_keeps_valid_token_when_early_refresh_fails(self) -> None:
+        """Test that a failed early refresh keeps the still-valid credentials."""
+        from datetime import datetime, timedelta, timezone
+
+        from google.oauth2.credentials import Credentials
+
+        creds = Credentials(
+            token="t",
+            refresh_token="r",
+            expiry=datetime.now(timezone.utc).replace(tzinfo=None)
+            + timedelta(minutes=4, seconds=30),
+        )
+        with (
+            patch("gmail_cli.services.auth.migrate_legacy_credentials"),
+            patch("gmail_cli.services.auth.load_credentials", return_value=creds),
+            patch("gmail_cli.services.auth.delete_credentials") as mock_delete,
+            patch("gmail_cli.services.auth.Request"),
+            patch.object(Credentials, "refresh", side_effect=Exception("offline")),
+        ):
+            assert get_credentials(account="user@gmail.com") is creds
+
+            mock_delete.assert_not_called()
+
+    def test_get_credentials_does_not_refresh_fresh_token(self) -> None:
+        """Test that a token far from expiry is used as is."""
+        from datetime import datetime, timedelta, timezone
+
+        from google.oauth2.credentials import Credentials
+
+        creds = Credentials(
+            token="t",
+            refresh_token="r",
+            expiry=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=30),
+        )
+        with (
+            patch("gmail_cli.services.auth.migrate_legacy_credentials"),
+            patch("gmail_cli.services.auth.load_credentials", return_value=creds),
+            patch.object(Credentials, "refresh") as mock_refresh,
+        ):
+            assert get_credentials(account="user@gmail.com") is creds
+
+            mock_refresh.assert_not_called()
+
 
 class TestAccountResolution:
     """Tests for multi-account resolution (T010-T012)."""
@@ -307,6 +388,26 @@ class TestTokenExpiry:
 
             assert result is None
 
+    def test_get_token_expiries_returns_mapping_per_account(self) -> None:
+        """Test get_token_expiries returns one entry per requested account."""
+        from datetime import datetime
+
+        creds_by_account = {
+            "user@gmail.com": MagicMock(expiry=datetime(2025, 12, 1, 16, 30, 0)),
+            "work@company.com": None,
+        }
+
+        with patch("gmail_cli.services.auth.load_credentials") as mock_load:
+            mock_load.side_effect = lambda account: creds_by_account[account]
+
+            result = get_token_expiries(["user@gmail.com", "work@company.com"])
+
+            assert result == {
+                "user@gmail.com": "2025-12-01 16:30:00",
+                "work@company.com": None,
+            }
+            assert mock_load.call_count == 2
+
 
 class TestIsAuthenticatedWithAccount:
     """Tests for is_authenticated with specific account."""
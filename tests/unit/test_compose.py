@@ -50,6 +50,55 @@ class TestComposeEmail:
 
         assert message is not None
 
+    def test_raw_message_matches_as_bytes_output(self) -> None:
+        """Test that the encoded message equals EmailMessage.as_bytes() for the same message."""
+        import base64
+        from email.message import EmailMessage
+
+        from gmail_cli.services import gmail
+
+        built: list[EmailMessage] = []
+
+        class RecordingMessage(EmailMessage):
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                super().__init__(*args, **kwargs)
+                built.append(self)
+
+        with patch("gmail_cli.services.gmail.EmailMessage", RecordingMessage):
+            raw = gmail._build_raw_message(
+                ["recipient@example.com"], "Grüße", "From the top\nÄnderung", html_body="<p>x</p>"
+            )
+
+        assert base64.urlsafe_b64decode(raw) == built[0].as_bytes()
+
+    def test_reply_attachments_are_encoded_and_missing_files_skipped(self, tmp_path) -> None:
+        """Test that reply attachments are added like in compose_email."""
+        import base64
+        import email
+        from email import policy
+
+        test_file = tmp_path / "report.pdf"
+        test_file.write_bytes(b"%PDF-1.4 data")
+
+        from gmail_cli.services.gmail import compose_reply
+
+        message = compose_reply(
+            to=["recipient@example.com"],
+            subject="Re: Report",
+            body="Attached",
+            thread_id="thread123",
+            message_id="<orig@example.com>",
+            attachments=[str(test_file), str(tmp_path / "missing.txt")],
+        )
+
+        parsed = email.message_from_bytes(
+            base64.urlsafe_b64decode(message["raw"]), policy=policy.default
+        )
+        attached = list(parsed.iter_attachments())
+        assert [part.get_filename() for part in attached] == ["report.pdf"]
+        assert attached[0].get_content_type() == "application/pdf"
+        assert attached[0].get_content() == b"%PDF-1.4 data"
+
 
 class TestSendEmail:
     """Tests for email sending functionality."""
@@ -222,3 +271,63 @@ class TestListSendAsAddresses:
             result = list_send_as_addresses()
 
             assert result == []
+
+    def test_cached_list_reuses_result_per_account(self) -> None:
+        """Test that the cached variant fetches once per account until the TTL expires."""
+        with patch("gmail_cli.services.gmail.list_send_as_addresses") as mock_list:
+            mock_list.return_value = [{"email": "primary@example.com"}]
+
+            from gmail_cli.services.gmail import list_send_as_addresses_cached
+
+            first = list_send_as_addresses_cached(account="user@gmail.com")
+            second = list_send_as_addresses_cached(account="user@gmail.com")
+            list_send_as_addresses_cached(account="work@company.com")
+            list_send_as_addresses_cached(account="user@gmail.com", ttl=0)
+
+            assert first is second
+            assert [c.kwargs["account"] for c in mock_list.call_args_list] == [
+                "user@gmail.com",
+                "work@company.com",
+                "user@gmail.com",
+            ]
+
+
+class TestGetSignature:
+    """Tests for fetching the Gmail signature."""
+
+    def test_signature_is_fetched_once_per_account(self) -> None:
+        """Test that repeated lookups for one account hit the API once."""
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get_service,
+            patch("gmail_cli.services.gmail._execute_with_retry") as mock_execute,
+        ):
+            mock_get_service.return_value = MagicMock()
+            mock_execute.return_value = {
+                "sendAs": [
+                    {"sendAsEmail": "alias@example.com", "isPrimary": False, "signature": "x"},
+                    {"sendAsEmail": "me@example.com", "isPrimary": True, "signature": "<b>Me</b>"},
+                ]
+            }
+
+            from gmail_cli.services.gmail import clear_signature_cache, get_signature
+
+            assert get_signature(account="me@example.com") == "<b>Me</b>"
+            assert get_signature(account="me@example.com") == "<b>Me</b>"
+            assert mock_execute.call_count == 1
+
+            clear_signature_cache()
+            get_signature(account="me@example.com")
+            assert mock_execute.call_count == 2
+
+    def test_empty_signature_returns_none(self) -> None:
+        """Test that an empty primary signature is reported as None."""
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get_service,
+            patch("gmail_cli.services.gmail._execute_with_retry") as mock_execute,
+        ):
+            mock_get_service.return_value = MagicMock()
+            mock_execute.return_value = {"sendAs": [{"isPrimary": True, "signature": ""}]}
+
+            from gmail_cli.services.gmail import get_signature
+
+            assert get_signature() is None
@@ -24,6 +24,32 @@ class TestCredentialsStorage:
 
             mock_keyring.set_password.assert_called()
 
+    def test_saved_credentials_round_trip(self) -> None:
+        """Test that the stored blob is compact JSON that load_credentials reads back."""
+        store: dict[str, str] = {}
+        with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
+            mock_keyring.set_password.side_effect = lambda _s, k, v: store.__setitem__(k, v)
+            mock_keyring.get_password.side_effect = lambda _s, k: store.get(k)
+
+            from gmail_cli.services.credentials import load_credentials, save_credentials
+
+            mock_creds = MagicMock()
+            mock_creds.token = "access_token"
+            mock_creds.refresh_token = "refresh_token"
+            mock_creds.token_uri = "https://oauth2.googleapis.com/token"
+            mock_creds.client_id = "client_id"
+            mock_creds.client_secret = "client_secret"
+            mock_creds.scopes = ["scope"]
+            mock_creds.expiry = datetime(2025, 12, 1, 16, 30, 0, tzinfo=UTC)
+
+            save_credentials(mock_creds)
+
+            assert ", " not in store["oauth_credentials"]
+            result = load_credentials()
+            assert result is not None
+            assert result.token == "access_token"
+            assert result.scopes == ["scope"]
+
     def test_load_credentials_returns_none_when_not_found(self) -> None:
         """Test that load returns None when no credentials exist."""
         with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
@@ -200,6 +226,41 @@ class TestMultiAccountCredentials:
             list_calls = [c for c in calls if "accounts_list" in str(c)]
             assert len(list_calls) == 1
 
+    def test_save_credentials_sets_default_only_for_first_new_account(self) -> None:
+        """Test that the first account becomes default and a re-save reads the list once."""
+        import json
+
+        with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
+            store = {"accounts_list": json.dumps([])}
+            mock_keyring.get_password.side_effect = lambda _service, key: store.get(key)
+            mock_keyring.set_password.side_effect = lambda _service, key, value: store.update(
+                {key: value}
+            )
+
+            from gmail_cli.services.credentials import _keyring_cache, save_credentials
+
+            mock_creds = MagicMock()
+            mock_creds.token = "access_token"
+            mock_creds.refresh_token = "refresh_token"
+            mock_creds.token_uri = "https://oauth2.googleapis.com/token"
+            mock_creds.client_id = "client_id"
+            mock_creds.client_secret = "client_secret"
+            mock_creds.scopes = ["gmail.readonly"]
+            mock_creds.expiry = None
+
+            save_credentials(mock_creds, account="new@gmail.com")
+            assert store["default_account"] == "new@gmail.com"
+
+            # A refresh re-saves the same account: no default rewrite, one list read
+            _keyring_cache.clear()
+            mock_keyring.reset_mock(return_value=False, side_effect=False)
+            save_credentials(mock_creds, account="new@gmail.com")
+
+            keys_read = [c.args[1] for c in mock_keyring.get_password.call_args_list]
+            keys_written = [c.args[1] for c in mock_keyring.set_password.call_args_list]
+            assert keys_read == ["accounts_list"]
+            assert keys_written == ["oauth_new@gmail.com"]
+
     def test_load_credentials_with_account_loads_from_account_key(self) -> None:
         """T007: Test load_credentials loads from account-specific key."""
         with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
@@ -325,6 +386,33 @@ class TestMultiAccountCredentials:
             delete_calls = mock_keyring.delete_password.call_args_list
             assert len(delete_calls) >= 2  # At least the two account credentials
 
+    def test_clear_all_accounts_continues_past_missing_credentials(self) -> None:
+        """Test that every account is deleted even if one has no stored credentials."""
+        import json
+
+        import keyring
+
+        with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
+            accounts = [f"user{i}@gmail.com" for i in range(5)]
+            mock_keyring.errors = keyring.errors
+            mock_keyring.get_password.return_value = json.dumps(accounts)
+
+            def delete_password(_service: str, key: str) -> None:
+                if key == "oauth_user2@gmail.com":
+                    raise keyring.errors.PasswordDeleteError(key)
+
+            mock_keyring.delete_password.side_effect = delete_password
+
+            from gmail_cli.services.credentials import clear_all_accounts
+
+            clear_all_accounts()
+
+            deleted = {c.args[1] for c in mock_keyring.delete_password.call_args_list}
+            assert deleted == {f"oauth_{a}" for a in accounts} | {
+                "accounts_list",
+                "default_account",
+            }
+
     def test_has_credentials_with_account(self) -> None:
         """Test has_credentials with specific account."""
         with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
@@ -336,3 +424,105 @@ class TestMultiAccountCredentials:
 
             assert result is True
             mock_keyring.get_password.assert_called_with("gmail-cli", "oauth_test@gmail.com")
+
+
+class TestKeyringReadCache:
+    """Tests for the in-process cache of account index reads."""
+
+    def test_repeated_reads_hit_keyring_once(self) -> None:
+        """Test that accounts list and default account are read once within the TTL."""
+        with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
+            mock_keyring.get_password.side_effect = lambda _service, key: {
+                "accounts_list": '["user@gmail.com"]',
+                "default_account": "user@gmail.com",
+            }[key]
+
+            from gmail_cli.services.credentials import get_default_account, list_accounts
+
+            for _ in range(3):
+                assert list_accounts() == ["user@gmail.com"]
+                assert get_default_account() == "user@gmail.com"
+
+            assert mock_keyring.get_password.call_count == 2
+
+    def test_writes_invalidate_cached_reads(self) -> None:
+        """Test that writing through this module drops the cached value."""
+        with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
+            store = {"accounts_list": '["user@gmail.com"]', "default_account": "user@gmail.com"}
+            mock_keyring.get_password.side_effect = lambda _service, key: store.get(key)
+            mock_keyring.set_password.side_effect = lambda _service, key, value: store.update(
+                {key: value}
+            )
+
+            from gmail_cli.services.credentials import (
+                _add_to_accounts_list,
+                get_default_account,
+                list_accounts,
+                set_default_account,
+            )
+
+            list_accounts()
+            get_default_account()
+            _add_to_accounts_list("work@company.com")
+            set_default_account("work@company.com")
+
+            assert list_accounts() == ["user@gmail.com", "work@company.com"]
+            assert get_default_account() == "work@company.com"
+
+    def test_cached_value_expires(self) -> None:
+        """Test that a cached read is repeated once the TTL has passed."""
+        with (
+            patch("gmail_cli.services.credentials.keyring") as mock_keyring,
+            patch("gmail_cli.services.credentials.time.monotonic") as mock_clock,
+        ):
+            mock_keyring.get_password.return_value = "user@gmail.com"
+            mock_clock.side_effect = [100.0, 101.0, 103.0]
+
+            from gmail_cli.services.credentials import get_default_account
+
+            get_default_account()
+            get_default_account()
+            get_default_account()
+
+            assert mock_keyring.get_password.call_count == 2
+
+
+class TestParsedCredentialsCache:
+    """Tests for reusing parsed credentials while the stored JSON is unchanged."""
+
+    CREDS = {
+        "token": "access_token",
+        "refresh_token": "refresh_token",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "client_id",
+        "client_secret": "client_secret",
+        "expiry": "2025-12-01T16:30:00",
+    }
+
+    def test_unchanged_json_returns_same_object(self) -> None:
+        """Test that loading unchanged credentials skips parsing."""
+        import json
+
+        with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
+            mock_keyring.get_password.return_value = json.dumps(self.CREDS)
+
+            from gmail_cli.services.credentials import load_credentials
+
+            first = load_credentials(account="user@gmail.com")
+            assert load_credentials(account="user@gmail.com") is first
+
+    def test_changed_json_is_parsed_again(self) -> None:
+        """Test that rewritten credentials in the keyring are picked up."""
+        import json
+
+        with patch("gmail_cli.services.credentials.keyring") as mock_keyring:
+            mock_keyring.get_password.return_value = json.dumps(self.CREDS)
+
+            from gmail_cli.services.credentials import load_credentials
+
+            load_credentials(account="user@gmail.com")
+            mock_keyring.get_password.return_value = json.dumps({**self.CREDS, "token": "new"})
+
+            result = load_credentials(account="user@gmail.com")
+            assert result is not None
+            assert result.token == "new"
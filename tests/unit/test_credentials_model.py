@@ -0,0 +1,100 @@
+"""Unit tests for the Credentials model."""
+
+import dataclasses
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from gmail_cli.models.credentials import REFRESH_MARGIN, Credentials
+
+NOW = datetime(2025, 12, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _credentials(expiry: datetime) -> Credentials:
+    """Build credentials expiring at the given time."""
+    return Credentials(
+        access_token="access",
+        refresh_token="refresh",
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client",
+        client_secret="secret",
+        scopes=["https://www.googleapis.com/auth/gmail.modify"],
+        expiry=expiry,
+    )
+
+
+def _at(moment: datetime):
+    """Patch the model's clock to the given moment."""
+    return patch("gmail_cli.models.credentials.time.time", return_value=moment.timestamp())
+
+
+class TestCredentialsModel:
+    """Tests for the Credentials dataclass."""
+
+    def test_is_frozen_and_slotted(self) -> None:
+        """Test that fields cannot be reassigned and no instance dict exists."""
+        credentials = _credentials(NOW)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            credentials.access_token = "other"  # type: ignore[misc]
+        assert not hasattr(credentials, "__dict__")
+
+    def test_serializes_only_public_fields(self) -> None:
+        """Test that asdict and repr contain only the declared fields."""
+        credentials = _credentials(NOW)
+
+        assert list(dataclasses.asdict(credentials)) == [
+            "access_token",
+            "refresh_token",
+            "token_uri",
+            "client_id",
+            "client_secret",
+            "scopes",
+            "expiry",
+        ]
+        assert "_expiry" not in repr(credentials)
+
+    def test_not_expired_before_expiry(self) -> None:
+        """Test that the token is valid up to the second before expiry."""
+        credentials = _credentials(NOW)
+
+        with _at(NOW - timedelta(seconds=1)):
+            assert not credentials.is_expired
+
+    def test_expired_at_expiry(self) -> None:
+        """Test that the token counts as expired from its expiry on."""
+        credentials = _credentials(NOW)
+
+        with _at(NOW):
+            assert credentials.is_expired
+
+    def test_needs_refresh_boundary_at_refresh_margin(self) -> None:
+        """Test that refresh is due exactly REFRESH_MARGIN seconds before expiry."""
+        credentials = _credentials(NOW)
+        refresh_at = NOW - timedelta(seconds=REFRESH_MARGIN)
+
+        with _at(refresh_at - timedelta(seconds=1)):
+            assert not credentials.needs_refresh
+        with _at(refresh_at):
+            assert credentials.needs_refresh
+            assert not credentials.is_expired
+
+    def test_naive_expiry_is_read_as_utc(self) -> None:
+        """Test that a naive expiry is compared as UTC, not local time."""
+        credentials = _credentials(NOW.replace(tzinfo=None))
+
+        with _at(NOW - timedelta(seconds=1)):
+            assert not credentials.is_expired
+        with _at(NOW):
+            assert credentials.is_expired
+
+    def test_aware_expiry_in_other_zone(self) -> None:
+        """Test that an expiry in another timezone is compared by instant."""
+        berlin = timezone(timedelta(hours=1))
+        credentials = _credentials(NOW.astimezone(berlin))
+
+        with _at(NOW):
+            assert credentials.is_expired
+        with _at(NOW - timedelta(seconds=REFRESH_MARGIN + 1)):
+            assert not credentials.needs_refresh
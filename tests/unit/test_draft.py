@@ -6,6 +6,8 @@ import pytest
 from googleapiclient.errors import HttpError
 
 from gmail_cli.services.gmail import (
+    DRAFT_LIST_FIELDS,
+    DRAFT_SUMMARY_FIELDS,
     DraftNotFoundError,
     SendError,
     create_draft,
@@ -130,8 +132,12 @@ class TestListDrafts:
 
             result = list_drafts(max_results=10)
 
-            # Should call list
+            # Should call list, asking only for the draft IDs
             mock_service.users.return_value.drafts.return_value.list.assert_called_once()
+            list_call = mock_service.users.return_value.drafts.return_value.list.call_args
+            assert list_call.kwargs["fields"] == DRAFT_LIST_FIELDS
+            get_call = mock_service.users.return_value.drafts.return_value.get.call_args
+            assert get_call.kwargs["fields"] == DRAFT_SUMMARY_FIELDS
             # Result is a list
             assert isinstance(result, list)
 
@@ -150,6 +156,75 @@ class TestListDrafts:
 
             assert result == []
 
+    def test_list_drafts_chunks_batches_and_keeps_order(self, mock_gmail_service) -> None:
+        """Test that drafts are fetched in batches of BATCH_MAX_REQUESTS, in list order."""
+        drafts = mock_gmail_service.users.return_value.drafts.return_value
+        drafts.list.return_value.execute.return_value = {
+            "drafts": [{"id": f"r{i}"} for i in range(5)]
+        }
+
+        def get(**kwargs):
+            request = MagicMock()
+            request.execute.return_value = {"id": kwargs["id"], "message": {"id": "m"}}
+            return request
+
+        drafts.get.side_effect = get
+
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get_service,
+            patch("gmail_cli.services.gmail.BATCH_MAX_REQUESTS", 2),
+            patch("gmail_cli.services.gmail.get_credentials"),
+        ):
+            mock_get_service.return_value = mock_gmail_service
+
+            result = list_drafts(max_results=5)
+
+        assert [draft["id"] for draft in result] == [f"r{i}" for i in range(5)]
+        assert mock_gmail_service.new_batch_http_request.call_count == 3
+
+    def test_list_drafts_skips_deleted_and_refetches_failed_drafts(
+        self, mock_gmail_service
+    ) -> None:
+        """Test that 404 entries are skipped and other batch failures are fetched again."""
+        from googleapiclient.errors import HttpError
+
+        drafts = mock_gmail_service.users.return_value.drafts.return_value
+        drafts.list.return_value.execute.return_value = {
+            "drafts": [{"id": "r0"}, {"id": "gone"}, {"id": "limited"}]
+        }
+        attempts: dict[str, int] = {}
+
+        def get(**kwargs):
+            draft_id = kwargs["id"]
+            request = MagicMock()
+
+            def execute():
+                attempts[draft_id] = attempts.get(draft_id, 0) + 1
+                status = 404 if draft_id == "gone" else 429
+                if draft_id == "gone" or (draft_id == "limited" and attempts[draft_id] == 1):
+                    resp = MagicMock()
+                    resp.status = status
+                    raise HttpError(resp, b"error")
+                return {"id": draft_id, "message": {"id": "m"}}
+
+            request.execute.side_effect = execute
+            return request
+
+        drafts.get.side_effect = get
+
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get_service,
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+        ):
+            mock_get_service.return_value = mock_gmail_service
+
+            result = list_drafts()
+
+        assert [draft["id"] for draft in result] == ["r0", "limited"]
+        assert attempts == {"r0": 1, "gone": 1, "limited": 2}
+        # The refetch pool reuses credentials resolved on this thread
+        mock_get_creds.assert_called_once()
+
 
 class TestGetDraft:
     """Tests for get_draft function."""
@@ -236,6 +311,7 @@ class TestGetDraft:
             # Verify metadata format was used
             call_args = mock_service.users.return_value.drafts.return_value.get.call_args
             assert call_args.kwargs["format"] == "metadata"
+            assert call_args.kwargs["fields"] == DRAFT_SUMMARY_FIELDS
 
 
 class TestSendDraft:
@@ -92,6 +92,77 @@ class TestEmailParser:
         assert attachments[0].id == "att123"
         assert attachments[0].size == 1024
 
+    def test_parse_nested_multipart_in_document_order(self) -> None:
+        """Test that nested parts yield the first bodies and attachments in order."""
+        import base64
+
+        from gmail_cli.services.gmail import _parse_message_parts
+
+        def text(mime: str, value: str) -> dict:
+            data = base64.urlsafe_b64encode(value.encode()).decode()
+            return {"mimeType": mime, "body": {"data": data}}
+
+        def attachment(name: str) -> dict:
+            return {
+                "mimeType": "application/pdf",
+                "filename": name,
+                "body": {"attachmentId": f"id-{name}", "size": 10},
+            }
+
+        payload = {
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [text("text/plain", "Body"), text("text/html", "<p>Body</p>")],
+                },
+                attachment("a.pdf"),
+                {"mimeType": "multipart/mixed", "parts": [attachment("b.pdf")]},
+                text("text/plain", "Footer"),
+                attachment("c.pdf"),
+            ],
+        }
+
+        body_text, body_html, attachments = _parse_message_parts(payload, "msg123")
+
+        assert body_text == "Body"
+        assert body_html == "<p>Body</p>"
+        assert [a.filename for a in attachments] == ["a.pdf", "b.pdf", "c.pdf"]
+        assert attachments[0].id == "id-a.pdf"
+
+    def test_split_addresses_keeps_quoted_display_names(self) -> None:
+        """Test that commas inside quoted names do not split a recipient."""
+        from gmail_cli.services.gmail import _split_addresses
+
+        header = '"Doe, John" <john@example.com>, Max <max@example.com>, plain@example.com'
+
+        assert _split_addresses(header) == [
+            '"Doe, John" <john@example.com>',
+            "Max <max@example.com>",
+            "plain@example.com",
+        ]
+        assert _split_addresses("") == []
+        assert _split_addresses("undisclosed-recipients:;") == ["undisclosed-recipients:;"]
+
+    def test_extract_headers_keeps_wanted_headers_only(self) -> None:
+        """Test that only the requested headers are collected, first occurrence wins."""
+        from gmail_cli.services.gmail import _extract_headers
+
+        payload = {
+            "headers": [
+                {"name": "Received", "value": "by mx"},
+                {"name": "Subject", "value": "First"},
+                {"name": "To", "value": "a@example.com"},
+                {"name": "Subject", "value": "Second"},
+            ]
+        }
+
+        assert _extract_headers(payload, frozenset({"Subject", "To", "Cc"})) == {
+            "Subject": "First",
+            "To": "a@example.com",
+        }
+        assert _extract_headers({}, frozenset({"Subject"})) == {}
+
 
 class TestGetEmail:
     """Tests for get_email function."""
@@ -147,3 +218,23 @@ class TestGetEmail:
             email = get_email("nonexistent")
 
             assert email is None
+
+
+class TestSenderParsing:
+    """Tests for Email.sender_name and Email.sender_email."""
+
+    def test_sender_name_and_email_forms(self, sample_email) -> None:
+        """Test splitting of the supported From header forms."""
+        import dataclasses
+
+        cases = {
+            "Max Mustermann <max@example.com>": ("Max Mustermann", "max@example.com"),
+            '"Doe, John" <john@example.com>': ("Doe, John", "john@example.com"),
+            "<bare@example.com>": ("", "bare@example.com"),
+            "plain@example.com": ("plain@example.com", "plain@example.com"),
+            'Max "the man" M <m@example.com>': ("Max the man M", "m@example.com"),
+        }
+        for sender, (name, address) in cases.items():
+            email = dataclasses.replace(sample_email, sender=sender)
+            assert email.sender_name == name
+            assert email.sender_email == address
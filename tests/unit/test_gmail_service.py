@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestGmailService:
     """Tests for the Gmail API service."""
@@ -18,6 +20,28 @@ class TestGmailService:
             assert result is not None
             assert len(result.emails) > 0
 
+    def test_search_emails_fetches_metadata_only(self, mock_gmail_service: MagicMock) -> None:
+        """Test that search requests only summary headers and fields, never bodies."""
+        with patch("gmail_cli.services.gmail.get_gmail_service") as mock_get:
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import (
+                SEARCH_LIST_FIELDS,
+                SUMMARY_FIELDS,
+                SUMMARY_HEADERS,
+                search_emails,
+            )
+
+            search_emails("test query")
+
+            list_call = mock_gmail_service.users.return_value.messages.return_value.list.call_args
+            assert list_call.kwargs["fields"] == SEARCH_LIST_FIELDS
+
+            get_call = mock_gmail_service.users.return_value.messages.return_value.get.call_args
+            assert get_call.kwargs["format"] == "metadata"
+            assert get_call.kwargs["metadataHeaders"] == SUMMARY_HEADERS
+            assert get_call.kwargs["fields"] == SUMMARY_FIELDS
+
     def test_search_emails_builds_query_with_filters(self, mock_gmail_service: MagicMock) -> None:
         """Test that search builds query with filters."""
         with patch("gmail_cli.services.gmail.get_gmail_service") as mock_get:
@@ -63,6 +87,145 @@ class TestGmailService:
 
             assert len(result.emails) == 0
 
+    def test_search_emails_fetches_details_in_one_batch(
+        self, mock_gmail_service: MagicMock
+    ) -> None:
+        """Test that message details are fetched with one batch request."""
+        with patch("gmail_cli.services.gmail.get_gmail_service") as mock_get:
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import search_emails
+
+            result = search_emails("test")
+
+            assert len(result.emails) == 2
+            mock_gmail_service.new_batch_http_request.assert_called_once()
+            # Service is built once for list + batch, not once per message
+            mock_get.assert_called_once()
+
+    def test_search_emails_batches_are_chunked(self, mock_gmail_service: MagicMock) -> None:
+        """Test that results are split into batches of BATCH_MAX_REQUESTS."""
+        mock_gmail_service.users.return_value.messages.return_value.list.return_value.execute.return_value = {
+            "messages": [{"id": f"msg{i}", "threadId": f"t{i}"} for i in range(5)],
+            "resultSizeEstimate": 5,
+        }
+
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get,
+            patch("gmail_cli.services.gmail.BATCH_MAX_REQUESTS", 2),
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+        ):
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import search_emails
+
+            result = search_emails("test")
+
+            assert len(result.emails) == 5
+            assert mock_gmail_service.new_batch_http_request.call_count == 3
+            # Batch workers share credentials resolved once on this thread
+            mock_get_creds.assert_called_once()
+
+    def test_search_emails_concurrent_batches_keep_order(
+        self, mock_gmail_service: MagicMock
+    ) -> None:
+        """Test that batches run concurrently still yield results in listing order."""
+        messages = mock_gmail_service.users.return_value.messages.return_value
+        messages.list.return_value.execute.return_value = {
+            "messages": [{"id": f"msg{i}", "threadId": f"t{i}"} for i in range(7)],
+            "resultSizeEstimate": 7,
+        }
+
+        def get(**kwargs):
+            request = MagicMock()
+            request.execute.return_value = {"id": kwargs["id"], "threadId": "t", "payload": {}}
+            return request
+
+        messages.get.side_effect = get
+
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get,
+            patch("gmail_cli.services.gmail.BATCH_MAX_REQUESTS", 2),
+            patch("gmail_cli.services.gmail.get_credentials"),
+        ):
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import search_emails
+
+            result = search_emails("test")
+
+            assert [email.id for email in result.emails] == [f"msg{i}" for i in range(7)]
+            assert mock_gmail_service.new_batch_http_request.call_count == 4
+
+    def test_search_emails_skips_deleted_messages(self, mock_gmail_service: MagicMock) -> None:
+        """Test that messages returning 404 inside the batch are skipped."""
+        from googleapiclient.errors import HttpError
+
+        mock_resp = MagicMock()
+        mock_resp.status = 404
+        messages = mock_gmail_service.users.return_value.messages.return_value
+        found = messages.get.return_value
+        missing = MagicMock()
+        missing.execute.side_effect = HttpError(mock_resp, b"Not found")
+        messages.get.side_effect = lambda **kwargs: (
+            missing if kwargs["id"].endswith("a8") else found
+        )
+
+        with patch("gmail_cli.services.gmail.get_gmail_service") as mock_get:
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import search_emails
+
+            result = search_emails("test")
+
+            assert [email.id for email in result.emails] == ["18c5a2b3d4e5f6a7"]
+
+    def test_search_emails_refetches_failed_batch_entries(
+        self, mock_gmail_service: MagicMock
+    ) -> None:
+        """Test that rate-limited batch entries are fetched singly, keeping result order."""
+        from googleapiclient.errors import HttpError
+
+        from gmail_cli.models.email import Email
+
+        mock_resp = MagicMock()
+        mock_resp.status = 429
+        mock_gmail_service.users.return_value.messages.return_value.list.return_value.execute.return_value = {
+            "messages": [{"id": f"msg{i}", "threadId": f"t{i}"} for i in range(4)],
+            "resultSizeEstimate": 4,
+        }
+        messages = mock_gmail_service.users.return_value.messages.return_value
+        found = messages.get.return_value
+        limited = MagicMock()
+        limited.execute.side_effect = HttpError(mock_resp, b"Rate limited")
+        messages.get.side_effect = lambda **kwargs: (
+            limited if kwargs["id"] in ("msg1", "msg2") else found
+        )
+
+        def get_summary(message_id: str, **_kwargs: object) -> Email:
+            email = MagicMock(spec=Email)
+            email.id = message_id
+            return email
+
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get,
+            patch(
+                "gmail_cli.services.gmail.get_email_summary", side_effect=get_summary
+            ) as mock_one,
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+        ):
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import search_emails
+
+            result = search_emails("test")
+
+            assert sorted(c.args[0] for c in mock_one.call_args_list) == ["msg1", "msg2"]
+            assert [email.id for email in result.emails][1:3] == ["msg1", "msg2"]
+            assert len(result.emails) == 4
+            # The retry pool reuses credentials resolved on this thread
+            mock_get_creds.assert_called_once()
+
     def test_build_search_query_combines_filters(self) -> None:
         """Test that query builder combines filters correctly."""
         from gmail_cli.services.gmail import build_search_query
@@ -86,3 +249,274 @@ class TestGmailService:
         assert "after:2025-01-01" in query
         assert "before:2025-12-31" in query
         assert "has:attachment" in query
+
+    def test_build_search_query_rejects_empty_date_range(self) -> None:
+        """Test that an after date not before the before date is rejected locally."""
+        import pytest
+
+        from gmail_cli.services.gmail import EmptyDateRangeError, build_search_query
+
+        with pytest.raises(EmptyDateRangeError):
+            build_search_query(after="2025-12-01", before="2024-01-01")
+        with pytest.raises(EmptyDateRangeError):
+            build_search_query(after="2025/06/01", before="2025-06-01")
+
+        # Dates in formats other than YYYY-MM-DD are left to Gmail
+        assert build_search_query(after="1700000000", before="2025-01-01") == (
+            "after:1700000000 before:2025-01-01"
+        )
+
+
+class TestGetGmailService:
+    """Tests for get_gmail_service caching."""
+
+    def test_service_is_reused_for_same_token(self, mock_credentials: MagicMock) -> None:
+        """Test that repeated calls reuse the built service."""
+        with (
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+            patch("gmail_cli.services.gmail.build") as mock_build,
+        ):
+            mock_get_creds.return_value = mock_credentials
+
+            from gmail_cli.services.gmail import get_gmail_service
+
+            first = get_gmail_service("user@gmail.com")
+            second = get_gmail_service("user@gmail.com")
+
+            assert first is second
+            mock_build.assert_called_once()
+
+    def test_service_is_rebuilt_when_token_changes(self, mock_credentials: MagicMock) -> None:
+        """Test that a new access token builds a new service."""
+        with (
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+            patch("gmail_cli.services.gmail.build") as mock_build,
+        ):
+            mock_get_creds.return_value = mock_credentials
+
+            from gmail_cli.services.gmail import get_gmail_service
+
+            get_gmail_service("user@gmail.com")
+            mock_credentials.token = "new-token"
+            get_gmail_service("user@gmail.com")
+
+            assert mock_build.call_count == 2
+
+    def test_service_is_not_shared_across_threads(self, mock_credentials: MagicMock) -> None:
+        """Test that each thread builds its own service."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with (
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+            patch("gmail_cli.services.gmail.build") as mock_build,
+        ):
+            mock_get_creds.return_value = mock_credentials
+
+            from gmail_cli.services.gmail import get_gmail_service
+
+            get_gmail_service("user@gmail.com")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(get_gmail_service, "user@gmail.com").result()
+
+            assert mock_build.call_count == 2
+
+    def test_worker_pool_resolves_credentials_once_on_caller(
+        self, mock_credentials: MagicMock
+    ) -> None:
+        """Test that gmail_worker_pool workers never load credentials themselves."""
+        import threading
+
+        caller = threading.current_thread()
+        loaded_on: list[threading.Thread] = []
+
+        def load(**_kwargs):
+            loaded_on.append(threading.current_thread())
+            return mock_credentials
+
+        with (
+            patch("gmail_cli.services.gmail.get_credentials", side_effect=load),
+            patch("gmail_cli.services.gmail.build") as mock_build,
+        ):
+            from gmail_cli.services.gmail import get_gmail_service, gmail_worker_pool
+
+            with gmail_worker_pool(4, account="user@gmail.com") as executor:
+                list(executor.map(lambda _: get_gmail_service("user@gmail.com"), range(8)))
+
+            assert loaded_on == [caller]
+            assert all(
+                call.kwargs["credentials"] is mock_credentials for call in mock_build.call_args_list
+            )
+
+    def test_service_uses_static_discovery(self, mock_credentials: MagicMock) -> None:
+        """Test that the bundled discovery document is used without cache probing."""
+        with (
+            patch("gmail_cli.services.gmail.get_credentials") as mock_get_creds,
+            patch("gmail_cli.services.gmail.build") as mock_build,
+        ):
+            mock_get_creds.return_value = mock_credentials
+
+            from gmail_cli.services.gmail import get_gmail_service
+
+            get_gmail_service("user@gmail.com")
+
+            assert mock_build.call_args.kwargs["static_discovery"] is True
+            assert mock_build.call_args.kwargs["cache_discovery"] is False
+
+    def test_responses_are_parsed_with_orjson_model(self) -> None:
+        """Test that the service model parses JSON bodies and keeps non-JSON bodies."""
+        pytest.importorskip("orjson")
+
+        from gmail_cli.services.gmail import _OrjsonModel, build_gmail_service
+
+        with patch("gmail_cli.services.gmail.build") as mock_build:
+            build_gmail_service(MagicMock())
+
+        model = mock_build.call_args.kwargs["model"]
+        assert isinstance(model, _OrjsonModel)
+        assert model.deserialize(b'{"id": "msg1", "labelIds": ["INBOX"]}') == {
+            "id": "msg1",
+            "labelIds": ["INBOX"],
+        }
+        assert model.deserialize(b"not json") == "not json"
+
+    def test_default_model_is_used_without_orjson(self) -> None:
+        """Test that the client's own JSON model is used when orjson is missing."""
+        from gmail_cli.services.gmail import build_gmail_service
+
+        with (
+            patch("gmail_cli.services.gmail.orjson", None),
+            patch("gmail_cli.services.gmail.build") as mock_build,
+        ):
+            build_gmail_service(MagicMock())
+
+        assert mock_build.call_args.kwargs["model"] is None
+
+
+class TestExecuteWithRetry:
+    """Tests for _execute_with_retry backoff."""
+
+    @staticmethod
+    def _http_error(status: int, headers: dict | None = None):
+        import httplib2
+        from googleapiclient.errors import HttpError
+
+        resp = httplib2.Response({"status": status, **(headers or {})})
+        return HttpError(resp, b"error")
+
+    def test_retries_on_service_unavailable(self) -> None:
+        """Test that 503 responses are retried with jittered exponential backoff."""
+        from gmail_cli.services.gmail import _execute_with_retry, get_rate_limit_wait
+
+        request = MagicMock()
+        request.execute.side_effect = [self._http_error(503), self._http_error(503), {"id": "x"}]
+
+        with (
+            patch("gmail_cli.services.gmail.time.sleep") as mock_sleep,
+            patch("gmail_cli.services.gmail.random.uniform", return_value=0.75) as mock_uniform,
+        ):
+            before = get_rate_limit_wait()
+            assert _execute_with_retry(request) == {"id": "x"}
+
+        mock_uniform.assert_called_with(0.5, 1.0)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.75, 1.5]
+        assert get_rate_limit_wait() - before == 2.25
+
+    def test_backoff_delays_are_jittered(self) -> None:
+        """Test that backoff delays stay within the jitter range of the exponential step."""
+        from gmail_cli.services.gmail import _retry_delay
+
+        error = self._http_error(429)
+        for attempt in range(4):
+            delays = {_retry_delay(error, attempt) for _ in range(20)}
+            assert all(0.5 * 2**attempt <= d <= 2**attempt for d in delays)
+            assert len(delays) > 1
+
+    def test_honors_retry_after_header(self) -> None:
+        """Test that a numeric Retry-After header sets the delay, capped at MAX_DELAY."""
+        from gmail_cli.services.gmail import MAX_DELAY, _execute_with_retry
+
+        request = MagicMock()
+        request.execute.side_effect = [
+            self._http_error(429, {"retry-after": "7"}),
+            self._http_error(429, {"retry-after": "600"}),
+            {"id": "x"},
+        ]
+
+        with patch("gmail_cli.services.gmail.time.sleep") as mock_sleep:
+            _execute_with_retry(request)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [7, MAX_DELAY]
+
+    def test_retries_transient_server_errors(self) -> None:
+        """Test that 500/502/504 responses are retried for idempotent requests."""
+        from gmail_cli.services.gmail import _execute_with_retry
+
+        request = MagicMock()
+        request.execute.side_effect = [
+            self._http_error(500),
+            self._http_error(502),
+            self._http_error(504),
+            {"id": "x"},
+        ]
+
+        with patch("gmail_cli.services.gmail.time.sleep") as mock_sleep:
+            assert _execute_with_retry(request) == {"id": "x"}
+
+        assert mock_sleep.call_count == 3
+
+    def test_non_idempotent_requests_are_not_retried_on_server_errors(self) -> None:
+        """Test that a send failing with 500 is not repeated, but 429 still is."""
+        import pytest
+        from googleapiclient.errors import HttpError
+
+        from gmail_cli.services.gmail import _execute_with_retry
+
+        request = MagicMock()
+        request.execute.side_effect = [self._http_error(429), self._http_error(500)]
+
+        with (
+            patch("gmail_cli.services.gmail.time.sleep") as mock_sleep,
+            pytest.raises(HttpError),
+        ):
+            _execute_with_retry(request, idempotent=False)
+
+        assert request.execute.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_gives_up_after_max_retries(self) -> None:
+        """Test that the last retryable error is raised after MAX_RETRIES retries."""
+        import pytest
+        from googleapiclient.errors import HttpError
+
+        from gmail_cli.services.gmail import MAX_RETRIES, _execute_with_retry
+
+        request = MagicMock()
+        request.execute.side_effect = self._http_error(503)
+
+        with (
+            patch("gmail_cli.services.gmail.time.sleep") as mock_sleep,
+            pytest.raises(HttpError),
+        ):
+            _execute_with_retry(request)
+
+        assert request.execute.call_count == MAX_RETRIES + 1
+        assert mock_sleep.call_count == MAX_RETRIES
+
+    def test_other_errors_are_not_retried(self) -> None:
+        """Test that non-retryable errors are raised immediately."""
+        import pytest
+        from googleapiclient.errors import HttpError
+
+        from gmail_cli.services.gmail import _execute_with_retry
+
+        request = MagicMock()
+        request.execute.side_effect = self._http_error(400)
+
+        with (
+            patch("gmail_cli.services.gmail.time.sleep") as mock_sleep,
+            pytest.raises(HttpError),
+        ):
+            _execute_with_retry(request)
+
+        mock_sleep.assert_not_called()
+        request.execute.assert_called_once()
@@ -0,0 +1,28 @@
+"""Unit tests for HTML to text conversion."""
+
+from gmail_cli.utils.html import html_to_text
+
+
+class TestHtmlToText:
+    """Tests for html_to_text function."""
+
+    def test_links_are_kept(self):
+        """Links are rendered with their target."""
+        result = html_to_text('<p>See <a href="https://example.com">here</a></p>')
+        assert result == "See [here](https://example.com)"
+
+    def test_styles_scripts_and_head_are_dropped(self):
+        """Stylesheets, scripts and the document head never reach the output."""
+        html = (
+            "<html><head><title>Newsletter</title>"
+            '<style type="text/css">.a { color: red; }</style></head>'
+            "<body><p>Hello</p><SCRIPT>alert(1)</SCRIPT><header>Top</header></body></html>"
+        )
+
+        result = html_to_text(html)
+
+        assert "color" not in result
+        assert "alert" not in result
+        assert "Newsletter" not in result
+        assert "Hello" in result
+        assert "Top" in result
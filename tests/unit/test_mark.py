@@ -168,3 +168,93 @@ class TestModifyMessageLabels:
             call_args = mock_gmail_service.users.return_value.messages.return_value.modify.call_args
             assert "removeLabelIds" in call_args.kwargs["body"]
             assert "addLabelIds" not in call_args.kwargs["body"]
+
+
+class TestBatchModifyMessageLabels:
+    """Tests for batchModify-based label changes."""
+
+    def test_mark_as_read_batch_sends_one_request(self, mock_gmail_service: MagicMock) -> None:
+        """Test that all IDs are sent in a single batchModify request."""
+        batch_modify = mock_gmail_service.users.return_value.messages.return_value.batchModify
+
+        with patch("gmail_cli.services.gmail.get_gmail_service") as mock_get:
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import mark_as_read_batch
+
+            mark_as_read_batch(["msg1", "msg2", "msg3"])
+
+            batch_modify.assert_called_once_with(
+                userId="me",
+                body={"removeLabelIds": ["UNREAD"], "ids": ["msg1", "msg2", "msg3"]},
+            )
+
+    def test_batch_is_chunked(self, mock_gmail_service: MagicMock) -> None:
+        """Test that IDs are split into chunks of BATCH_MODIFY_MAX_IDS."""
+        batch_modify = mock_gmail_service.users.return_value.messages.return_value.batchModify
+
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get,
+            patch("gmail_cli.services.gmail.BATCH_MODIFY_MAX_IDS", 2),
+        ):
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import mark_as_unread_batch
+
+            mark_as_unread_batch(["msg1", "msg2", "msg3"])
+
+            chunks = [c.kwargs["body"]["ids"] for c in batch_modify.call_args_list]
+            assert chunks == [["msg1", "msg2"], ["msg3"]]
+            assert batch_modify.call_args.kwargs["body"]["addLabelIds"] == ["UNREAD"]
+
+    def test_failed_chunk_reports_only_its_ids(self, mock_gmail_service: MagicMock) -> None:
+        """Test that a failing chunk does not stop the others and reports its IDs."""
+        batch_modify = mock_gmail_service.users.return_value.messages.return_value.batchModify
+        error = ConnectionError("reset")
+        first, second = MagicMock(), MagicMock()
+        second.execute.side_effect = error
+        batch_modify.side_effect = [first, second]
+
+        with (
+            patch("gmail_cli.services.gmail.get_gmail_service") as mock_get,
+            patch("gmail_cli.services.gmail.BATCH_MODIFY_MAX_IDS", 2),
+        ):
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import mark_as_read_batch
+
+            failed = mark_as_read_batch(["msg1", "msg2", "msg3"])
+
+            assert failed == {"msg3": error}
+            first.execute.assert_called_once()
+
+
+class TestFindMissingMessages:
+    """Tests for find_missing_messages."""
+
+    def test_reports_only_not_found_ids(self, mock_gmail_service: MagicMock) -> None:
+        """Test that 404s are reported as missing and other errors are not."""
+        messages = mock_gmail_service.users.return_value.messages.return_value
+
+        def get(**kwargs):
+            request = MagicMock()
+            status = {"gone": 404, "limited": 429}.get(kwargs["id"])
+            if status:
+                resp = MagicMock()
+                resp.status = status
+                request.execute.side_effect = HttpError(resp, b"error")
+            else:
+                request.execute.return_value = {"id": kwargs["id"]}
+            return request
+
+        messages.get.side_effect = get
+
+        with patch("gmail_cli.services.gmail.get_gmail_service") as mock_get:
+            mock_get.return_value = mock_gmail_service
+
+            from gmail_cli.services.gmail import find_missing_messages
+
+            missing = find_missing_messages(["msg1", "gone", "limited"])
+
+        assert missing == {"gone"}
+        assert messages.get.call_args.kwargs["fields"] == "id"
@@ -90,6 +90,13 @@ code here
         # Should have monospace font or background styling
         assert "font-family" in result.lower() or "background" in result.lower()
 
+    def test_code_inside_block_gets_neutral_style(self):
+        """Code inside a fenced block gets a plain style attribute, not inline code styling."""
+        result = markdown_to_html("```python\nx = 1\n```\n\nUse `x`")
+        assert '<code class="language-python" style="font-family: inherit;' in result
+        assert '\\"' not in result
+        assert result.count("padding: 0.2em 0.4em") == 1
+
     def test_inline_code(self):
         """Inline code is converted to <code> tags."""
         result = markdown_to_html("Use `print()` function")
@@ -165,6 +172,19 @@ code here
         assert "Ümläüte" in result
         assert "äöü" in result
 
+    def test_converter_is_reused_without_leaking_state(self):
+        """Consecutive conversions share one converter but not document state."""
+        from gmail_cli.utils.markdown import _get_converter
+
+        first = markdown_to_html("```\nfirst block\n```\n\n- [x] done")
+        converter = _get_converter()
+        second = markdown_to_html("plain")
+
+        assert _get_converter() is converter
+        assert "first block" in first
+        assert "first block" not in second
+        assert second == markdown_to_html("plain")
+
 
 class TestWrapHtmlForEmail:
     """Tests for wrap_html_for_email function."""
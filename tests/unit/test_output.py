@@ -0,0 +1,104 @@
+"""Unit tests for output formatting utilities."""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from gmail_cli.models.attachment import Attachment
+from gmail_cli.utils import output
+from gmail_cli.utils.output import emit_error, print_json, print_text
+
+
+class TestPrintJson:
+    """Tests for print_json function."""
+
+    def test_output_is_valid_json(self, capsysbinary):
+        """Output parses back to the same data."""
+        print_json({"drafts": [{"id": "r1", "subject": "Hallo"}], "count": 1})
+        data = json.loads(capsysbinary.readouterr().out)
+        assert data == {"drafts": [{"id": "r1", "subject": "Hallo"}], "count": 1}
+
+    def test_non_ascii_is_not_escaped(self, capsysbinary):
+        """Umlauts are emitted as UTF-8, not as \\u escapes."""
+        print_json({"message": "Konto gelöscht"})
+        out = capsysbinary.readouterr().out
+        assert "gelöscht".encode() in out
+
+    def test_unknown_types_fall_back_to_str(self, capsysbinary):
+        """Non-serializable values are converted with str()."""
+
+        class Token:
+            def __str__(self) -> str:
+                return "token-123"
+
+        print_json({"value": Token()})
+        data = json.loads(capsysbinary.readouterr().out)
+        assert data["value"] == "token-123"
+
+    def test_stdlib_fallback_without_orjson(self, capsysbinary):
+        """The stdlib encoder is used when orjson is not installed."""
+        with patch.object(output, "orjson", None):
+            print_json({"date": datetime(2025, 12, 1, tzinfo=timezone.utc), "name": "Müller"})
+        data = json.loads(capsysbinary.readouterr().out)
+        assert data["name"] == "Müller"
+        assert data["date"] == "2025-12-01T00:00:00+00:00"
+
+    def test_dataclasses_are_objects_with_both_encoders(self, capsysbinary):
+        """Dataclass instances serialize to the same object with and without orjson."""
+        attachment = Attachment(
+            id="att1", message_id="msg1", filename="a.pdf", mime_type="application/pdf", size=10
+        )
+        expected = {
+            "id": "att1",
+            "message_id": "msg1",
+            "filename": "a.pdf",
+            "mime_type": "application/pdf",
+            "size": 10,
+        }
+        print_json({"attachments": [attachment]})
+        assert json.loads(capsysbinary.readouterr().out)["attachments"] == [expected]
+        with patch.object(output, "orjson", None):
+            print_json({"attachments": [attachment]})
+        assert json.loads(capsysbinary.readouterr().out)["attachments"] == [expected]
+
+    def test_datetimes_are_iso_8601(self, capsysbinary):
+        """Datetimes are emitted like datetime.isoformat()."""
+        value = datetime(2025, 12, 1, 10, 30, tzinfo=timezone.utc)
+        print_json({"date": value})
+        data = json.loads(capsysbinary.readouterr().out)
+        assert data["date"] == value.isoformat()
+
+
+class TestPrintText:
+    """Tests for print_text function."""
+
+    def test_writes_utf8_with_trailing_newline(self, capsysbinary):
+        """Text is written as UTF-8 followed by a single newline."""
+        print_text("Grüße\nZeile 2")
+        assert capsysbinary.readouterr().out == "Grüße\nZeile 2\n".encode()
+
+
+class TestEmitError:
+    """Tests for emit_error function."""
+
+    def test_json_mode_prints_error_object_and_exits(self, capsysbinary):
+        """In JSON mode the error is printed as a JSON object."""
+        with patch.object(output, "_json_mode", True), pytest.raises(typer.Exit) as exc:
+            emit_error("NOT_FOUND", "Nicht gefunden")
+        assert exc.value.exit_code == 1
+        data = json.loads(capsysbinary.readouterr().out)
+        assert data == {"error": True, "code": "NOT_FOUND", "message": "Nicht gefunden"}
+
+    def test_text_mode_prints_message_and_exits(self):
+        """In text mode the error is printed via print_error."""
+        with (
+            patch.object(output, "_json_mode", False),
+            patch.object(output, "print_error") as mock_print,
+            pytest.raises(typer.Exit) as exc,
+        ):
+            emit_error("NOT_FOUND", "Nicht gefunden", exit_code=2)
+        assert exc.value.exit_code == 2
+        mock_print.assert_called_once_with("Nicht gefunden", details=None)